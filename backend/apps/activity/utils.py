@@ -28,3 +28,24 @@ def log_activity(action, user, instance=None, description=None, extra_data=None)
         description=description or f"{action} performed",
         extra_data=extra_data or {}
     )
+
+
+def log_activities(entries):
+    """
+    Bulk version of log_activity: one INSERT for many entries.
+
+    Args:
+        entries: iterable of dicts with the same keys as log_activity's arguments
+    """
+    logs = []
+    for entry in entries:
+        instance = entry.get('instance')
+        logs.append(ActivityLog(
+            action=entry['action'],
+            user=entry['user'],
+            content_type=ContentType.objects.get_for_model(instance) if instance else None,
+            object_id=instance.id if instance else None,
+            description=entry.get('description') or f"{entry['action']} performed",
+            extra_data=entry.get('extra_data') or {},
+        ))
+    ActivityLog.objects.bulk_create(logs)
@@ -1,35 +1,22 @@
-from django.core.management.base import BaseCommand
 from django.utils import timezone
-from apps.attendance.models import Attendance
-from django.contrib.auth import get_user_model
 
-User = get_user_model()
+from apps.core.tenant_jobs import TenantJobCommand
 
-class Command(BaseCommand):
-    help = 'Automatically mark users absent if they have not marked attendance by the end of the day'
+
+class Command(TenantJobCommand):
+    help = 'Automatically mark users absent if they have not marked attendance by the end of the day (every tenant)'
+
+    def describe_result(self, result) -> str:
+        if result is None:
+            return 'skipped, not a working day'
+        return f'marked {result} user(s) absent'
 
     def handle(self, *args, **options):
         # We assume this runs at the end of the day, so check for today.
         today = timezone.localdate()
-        
-        # Check if today is a working day
-        if not Attendance.is_working_day(today):
-            self.stdout.write(self.style.SUCCESS(f'Skipped. {today} is not a working day.'))
-            return
-            
-        users = User.objects.filter(is_active=True, is_staff=False, is_superuser=False)
-        absent_count = 0
-        
-        for user in users:
-            attendance, created = Attendance.objects.get_or_create(
-                employee=user,
-                date=today,
-                defaults={'status': 'neutral'}
-            )
-            
-            # If status is still neutral (never touched) or if they marked unavailable but never available
-            if attendance.status == 'neutral' or (attendance.current_availability == 'unavailable' and attendance.status not in ['present', 'leave']):
-                attendance.mark_absent()
-                absent_count += 1
-                
-        self.stdout.write(self.style.SUCCESS(f'Successfully marked {absent_count} users as absent for {today}.'))
+        self.run_job(
+            'mark_absentees',
+            job_name=f'mark_absentees:{today.isoformat()}',
+            options=options,
+            job_kwargs={'day': today},
+        )
@@ -52,27 +52,18 @@ class OfficeSettings(models.Model):
     
     @classmethod
     def get_settings(cls):
-        """Get or create the singleton settings instance"""
-        settings, created = cls.objects.get_or_create(
-            pk=1,
-            defaults={
-                'office_start_time': time(10, 0),
-                'office_end_time': time(17, 0),
-                'auto_mark_absent': True,
-                'weekend_holidays': 'saturday',
-            }
-        )
-        dirty = []
+        """
+        The singleton settings row, or unsaved defaults when there is none yet.
+        Never writes, so GET paths stay read-only; saving the result creates
+        or updates row 1.
+        """
+        settings = cls.objects.filter(pk=1).first()
+        if settings is None:
+            return cls(pk=1)
         for field_name in ('office_start_time', 'office_end_time'):
-            raw = getattr(settings, field_name)
-            if isinstance(raw, str):
-                setattr(settings, field_name, _coerce_time(raw))
-                dirty.append(field_name)
+            setattr(settings, field_name, _coerce_time(getattr(settings, field_name)))
         if not settings.weekend_holidays:
             settings.weekend_holidays = 'saturday'
-            dirty.append('weekend_holidays')
-        if dirty:
-            settings.save(update_fields=dirty)
         return settings
 
     @property
@@ -412,6 +403,48 @@ class Attendance(models.Model):
             current += timedelta(days=1)
 
         return days
+
+    @classmethod
+    def effective_for_day(cls, employees, day):
+        """
+        Attendance for `employees` on `day` as the team views show it, without writing.
+
+        Missing records come back as unsaved neutral placeholders. Neutral
+        records show as leave when an approved leave covers the day, or as
+        absent once office hours have ended. Leave approval and the
+        mark_absentees job persist the same outcomes.
+        """
+        employees = list(employees)
+        records = {
+            record.employee_id: record
+            for record in cls.objects.filter(date=day, employee__in=employees)
+        }
+        leaves = {}
+        for leave in LeaveRequest.objects.filter(
+            employee__in=employees, status='approved', start_date__lte=day, end_date__gte=day
+        ).order_by('pk'):
+            leaves.setdefault(leave.employee_id, leave)
+        settings = OfficeSettings.get_settings()
+        mark_absent = settings.has_office_hours_ended and settings.auto_mark_absent
+
+        result = []
+        for employee in employees:
+            attendance = records.get(employee.pk)
+            if attendance is None:
+                attendance = cls(employee=employee, date=day, status='neutral', current_availability='none')
+            else:
+                attendance.employee = employee
+            if attendance.status == 'neutral':
+                leave = leaves.get(employee.pk)
+                if leave is not None:
+                    attendance.status = 'leave'
+                    attendance.leave_request = leave
+                    attendance.current_availability = 'unavailable'
+                elif mark_absent:
+                    attendance.status = 'absent'
+                    attendance.current_availability = 'none'
+            result.append(attendance)
+        return result
     
     def mark_available(self):
         """Mark employee as available"""
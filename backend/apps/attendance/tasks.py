@@ -1,4 +1,8 @@
 from datetime import timedelta
+
+from django.contrib.auth import get_user_model
+from django.utils import timezone
+
 from .models import Attendance, LeaveRequest
 
 
@@ -21,3 +25,38 @@ def mark_attendance_for_leave(leave_request):
             attendance.mark_leave(leave_request)
         
         current_date += timedelta(days=1)
+
+
+def mark_absentees(day=None):
+    """
+    Mark users absent who never became available on `day` (default: today).
+    Returns how many were marked, or None when `day` is not a working day.
+    Runs in the current tenant schema.
+    """
+    day = day or timezone.localdate()
+    if not Attendance.is_working_day(day):
+        return None
+
+    users = get_user_model().objects.filter(is_active=True, is_staff=False, is_superuser=False)
+    existing = {
+        record.employee_id: record
+        for record in Attendance.objects.filter(date=day, employee__in=users)
+    }
+    missing = [user.pk for user in users.only('id') if user.pk not in existing]
+    Attendance.objects.bulk_create(
+        [Attendance(employee_id=user_id, date=day, status='neutral') for user_id in missing],
+        ignore_conflicts=True,
+    )
+    if missing:
+        existing.update(
+            (record.employee_id, record)
+            for record in Attendance.objects.filter(date=day, employee_id__in=missing)
+        )
+
+    absent_count = 0
+    for attendance in existing.values():
+        # If status is still neutral (never touched) or if they marked unavailable but never available
+        if attendance.status == 'neutral' or (attendance.current_availability == 'unavailable' and attendance.status not in ['present', 'leave']):
+            attendance.mark_absent()
+            absent_count += 1
+    return absent_count
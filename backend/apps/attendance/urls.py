@@ -5,7 +5,7 @@ from .views import (
     approve_leave_request, reject_leave_request,
     AttendanceListView, get_team_attendance, get_my_attendance,
     get_my_leave_requests, get_daily_attendance_logs, get_attendance_stats,
-    get_attendance_calendar
+    get_attendance_calendar, export_attendance
 )
 
 urlpatterns = [
@@ -26,4 +26,5 @@ urlpatterns = [
     path('attendance/logs/', get_daily_attendance_logs, name='daily-attendance-logs'),
     path('attendance/stats/', get_attendance_stats, name='attendance-stats'),
     path('attendance/calendar/', get_attendance_calendar, name='attendance-calendar'),
+    path('attendance/export/', export_attendance, name='attendance-export'),
 ]
@@ -14,6 +14,8 @@ from .serializers import (
     AttendanceDailyLogSerializer
 )
 from apps.users.permissions import IsAdminUser, IsManagerOrAdmin
+from apps.core.exports import export_format, stream_export
+from apps.core.transactions import ReadOnlySafeMethodsMixin, read_only_safe_methods
 
 logger = logging.getLogger(__name__)
 
@@ -24,7 +26,7 @@ logger = logging.getLogger(__name__)
     get=extend_schema(summary="Get office settings", description="Get current office hours settings"),
     put=extend_schema(summary="Update office settings", description="Update office hours (Admin only)")
 )
-class OfficeSettingsView(generics.RetrieveUpdateAPIView):
+class OfficeSettingsView(ReadOnlySafeMethodsMixin, generics.RetrieveUpdateAPIView):
     """Get or update office settings"""
     serializer_class = OfficeSettingsSerializer
     permission_classes = [permissions.IsAuthenticated]
@@ -159,7 +161,7 @@ def reject_leave_request(request, pk):
     get=extend_schema(summary="Get attendance records", description="Get attendance for a date range"),
     post=extend_schema(summary="Toggle availability", description="Toggle between available/unavailable during office hours")
 )
-class AttendanceListView(generics.ListCreateAPIView):
+class AttendanceListView(ReadOnlySafeMethodsMixin, generics.ListCreateAPIView):
     """List and toggle attendance records"""
     serializer_class = AttendanceSerializer
     permission_classes = [permissions.IsAuthenticated]
@@ -227,6 +229,48 @@ class AttendanceListView(generics.ListCreateAPIView):
         return Response(response_serializer.data, status=status.HTTP_201_CREATED)
 
 
+ATTENDANCE_EXPORT_COLUMNS = {
+    'date': 'date',
+    'employee': 'employee__username',
+    'employee_id': 'employee_id',
+    'status': 'status',
+    'current_availability': 'current_availability',
+    'first_available_at': 'first_available_at',
+    'last_changed_at': 'last_changed_at',
+}
+
+
+@read_only_safe_methods
+@extend_schema(summary="Export attendance", description="Stream attendance records as CSV or JSON Lines")
+@api_view(['GET'])
+@permission_classes([permissions.IsAuthenticated])
+def export_attendance(request):
+    """
+    Stream attendance (?file_format=csv|jsonl&start_date=&end_date=&employee_id=).
+
+    Employees export their own records; admins/managers export everyone unless
+    employee_id narrows it down.
+    """
+    fmt = export_format(request)
+    user = request.user
+    queryset = Attendance.objects.all()
+    if user.role not in ['admin', 'manager']:
+        queryset = queryset.filter(employee=user)
+    elif request.query_params.get('employee_id'):
+        queryset = queryset.filter(employee_id=request.query_params.get('employee_id'))
+
+    start_date = request.query_params.get('start_date')
+    end_date = request.query_params.get('end_date')
+    if start_date:
+        queryset = queryset.filter(date__gte=start_date)
+    if end_date:
+        queryset = queryset.filter(date__lte=end_date)
+
+    rows = queryset.order_by('date', 'employee_id').values(*ATTENDANCE_EXPORT_COLUMNS.values())
+    return stream_export(rows, columns=ATTENDANCE_EXPORT_COLUMNS, fmt=fmt, filename='attendance')
+
+
+@read_only_safe_methods
 @extend_schema_view(
     get=extend_schema(summary="Get team attendance", description="Get today's attendance for all team members")
 )
@@ -244,52 +288,16 @@ def get_team_attendance(request):
             'records': []
         })
     
-    settings = OfficeSettings.get_settings()
-    
-    # Get all employees
+    # Show all employees (available, unavailable, or hidden/neutral)
     from apps.users.models import User
     employees = User.objects.filter(is_active=True).exclude(role='admin')
-    
-    # Get or create attendance records for today
-    attendance_records = []
-    for employee in employees:
-        attendance, created = Attendance.objects.get_or_create(
-            employee=employee,
-            date=today,
-            defaults={'status': 'neutral', 'current_availability': 'none'}
-        )
-        
-        # Auto-mark absent if still neutral and end of day
-        if attendance.status == 'neutral':
-            # Check for approved leave
-            has_approved_leave = LeaveRequest.objects.filter(
-                employee=employee,
-                status='approved',
-                start_date__lte=today,
-                end_date__gte=today
-            ).exists()
-            
-            if has_approved_leave:
-                leave_req = LeaveRequest.objects.filter(
-                    employee=employee,
-                    status='approved',
-                    start_date__lte=today,
-                    end_date__gte=today
-                ).first()
-                attendance.mark_leave(leave_req)
-            elif settings.has_office_hours_ended and settings.auto_mark_absent:
-                # Past office hours, mark as absent (no logs = absent)
-                attendance.mark_absent()
-        
-        attendance_records.append(attendance)
-    
-    # Show all employees (available, unavailable, or hidden/neutral)
-    visible_records = attendance_records
+    visible_records = Attendance.effective_for_day(employees, today)
     
     serializer = TeamAttendanceSerializer(visible_records, many=True)
     return Response(serializer.data)
 
 
+@read_only_safe_methods
 @extend_schema_view(
     get=extend_schema(summary="Get my attendance status", description="Get current user's attendance for today")
 )
@@ -311,40 +319,13 @@ def get_my_attendance(request):
             'daily_logs': []
         })
     
-    settings = OfficeSettings.get_settings()
-    
-    attendance, created = Attendance.objects.get_or_create(
-        employee=request.user,
-        date=today,
-        defaults={'status': 'neutral', 'current_availability': 'none'}
-    )
-    
-    # Check if user has approved leave for today
-    if attendance.status == 'neutral':
-        has_approved_leave = LeaveRequest.objects.filter(
-            employee=request.user,
-            status='approved',
-            start_date__lte=today,
-            end_date__gte=today
-        ).exists()
-        
-        if has_approved_leave:
-            leave_req = LeaveRequest.objects.filter(
-                employee=request.user,
-                status='approved',
-                start_date__lte=today,
-                end_date__gte=today
-            ).first()
-            attendance.mark_leave(leave_req)
-    
-    # Auto-mark absent if office hours ended and still neutral (no logs)
-    if attendance.status == 'neutral' and settings.has_office_hours_ended and settings.auto_mark_absent:
-        attendance.mark_absent()
+    [attendance] = Attendance.effective_for_day([request.user], today)
     
     serializer = AttendanceSerializer(attendance)
     return Response(serializer.data)
 
 
+@read_only_safe_methods
 @extend_schema_view(
     get=extend_schema(summary="Get my leave requests", description="Get all leave requests for current user")
 )
@@ -357,6 +338,7 @@ def get_my_leave_requests(request):
     return Response(serializer.data)
 
 
+@read_only_safe_methods
 @api_view(['GET'])
 @permission_classes([IsManagerOrAdmin])
 def get_daily_attendance_logs(request):
@@ -385,36 +367,7 @@ def get_daily_attendance_logs(request):
     # Get all active employees (excluding admins)
     from apps.users.models import User
     employees = User.objects.filter(is_active=True).exclude(role='admin')
-    
-    settings = OfficeSettings.get_settings()
-    attendance_records = []
-    for employee in employees:
-        attendance, created = Attendance.objects.get_or_create(
-            employee=employee,
-            date=target_date,
-            defaults={'status': 'neutral', 'current_availability': 'none'}
-        )
-        # Apply auto-marking logic if neutral
-        if attendance.status == 'neutral':
-            has_approved_leave = LeaveRequest.objects.filter(
-                employee=employee,
-                status='approved',
-                start_date__lte=target_date,
-                end_date__gte=target_date
-            ).exists()
-            
-            if has_approved_leave:
-                leave_req = LeaveRequest.objects.filter(
-                    employee=employee,
-                    status='approved',
-                    start_date__lte=target_date,
-                    end_date__gte=target_date
-                ).first()
-                attendance.mark_leave(leave_req)
-            elif settings.has_office_hours_ended and settings.auto_mark_absent:
-                attendance.mark_absent()
-        
-        attendance_records.append(attendance)
+    attendance_records = Attendance.effective_for_day(employees, target_date)
 
     serializer = AttendanceDailyLogSerializer(attendance_records, many=True)
     
@@ -436,6 +389,7 @@ def get_daily_attendance_logs(request):
     })
 
 
+@read_only_safe_methods
 @extend_schema(
     summary="Get attendance statistics",
     description="Get aggregated attendance statistics for a date range"
@@ -497,6 +451,7 @@ def get_attendance_stats(request):
     })
 
 
+@read_only_safe_methods
 @extend_schema(
     summary="Get monthly attendance calendar",
     description="Get day-by-day attendance calendar for a month"
@@ -0,0 +1,45 @@
+import django.contrib.postgres.indexes
+import django.contrib.postgres.search
+from django.db import migrations
+
+SEARCH_VECTOR_SQL = "to_tsvector('pg_catalog.english', coalesce({row}content, ''))"
+
+CREATE_TRIGGER_SQL = f"""
+CREATE OR REPLACE FUNCTION comments_search_vector_trigger() RETURNS trigger AS $$
+BEGIN
+    NEW.search_vector := {SEARCH_VECTOR_SQL.format(row='NEW.')};
+    RETURN NEW;
+END
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER comments_search_vector_update
+    BEFORE INSERT OR UPDATE OF content ON comments
+    FOR EACH ROW EXECUTE PROCEDURE comments_search_vector_trigger();
+
+UPDATE comments SET search_vector = {SEARCH_VECTOR_SQL.format(row='')};
+"""
+
+DROP_TRIGGER_SQL = """
+DROP TRIGGER IF EXISTS comments_search_vector_update ON comments;
+DROP FUNCTION IF EXISTS comments_search_vector_trigger();
+"""
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('comments', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='comment',
+            name='search_vector',
+            field=django.contrib.postgres.search.SearchVectorField(editable=False, null=True),
+        ),
+        migrations.AddIndex(
+            model_name='comment',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['search_vector'], name='comments_search_idx'),
+        ),
+        migrations.RunSQL(CREATE_TRIGGER_SQL, DROP_TRIGGER_SQL),
+    ]
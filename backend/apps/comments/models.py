@@ -1,3 +1,5 @@
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchVectorField
 from django.db import models
 from apps.users.models import User
 from apps.tickets.models import Ticket
@@ -9,12 +11,17 @@ class Comment(models.Model):
     content = models.TextField()
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
+    # Maintained by a database trigger from content.
+    search_vector = SearchVectorField(null=True, editable=False)
     
     class Meta:
         db_table = 'comments'
         verbose_name = 'Comment'
         verbose_name_plural = 'Comments'
         ordering = ['created_at']
+        indexes = [
+            GinIndex(fields=['search_vector'], name='comments_search_idx'),
+        ]
     
     def __str__(self):
         return f"Comment by {self.author.username} on {self.ticket.ticket_id}"
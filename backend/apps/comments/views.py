@@ -4,7 +4,7 @@ from rest_framework.decorators import action
 from rest_framework.response import Response
 from rest_framework.exceptions import PermissionDenied
 from django.db.models import Q
-from apps.core.access import user_can_access_ticket
+from apps.core.access import request_membership, user_can_access_ticket
 from apps.comments.utils import notify_comment_mentions
 from .models import Comment
 from .serializers import CommentSerializer, CommentCreateSerializer
@@ -48,7 +48,9 @@ class CommentViewSet(viewsets.ModelViewSet):
     
     def perform_create(self, serializer):
         ticket = serializer.validated_data['ticket']
-        if not user_can_access_ticket(self.request.user, ticket):
+        if not user_can_access_ticket(
+            self.request.user, ticket, membership=request_membership(self.request)
+        ):
             raise PermissionDenied('You do not have access to comment on this ticket.')
         comment = serializer.save(author=self.request.user)
         notify_comment_mentions(self.request.user, ticket, comment.content)
@@ -1,45 +1,101 @@
 """Shared authorization helpers for project and ticket access."""
 
+from functools import cached_property
+
 from django.db.models import Q
 
-from apps.projects.models import Project
+from apps.projects.models import Project, ProjectMember
 from apps.tickets.models import Ticket
 
 
-def user_can_access_project(user, project: Project) -> bool:
+class ProjectMembership:
+    """
+    One user's project memberships, loaded once and answered from memory.
+
+    Views, permissions and serializers handling the same request share a
+    single instance through `request_membership(request)`, so repeated
+    "is this user on that project?" checks cost one query in total. Member
+    lists of other projects (for checks about target users) are cached per
+    project the same way. Changes made to memberships during the request are
+    not picked up.
+    """
+
+    def __init__(self, user):
+        self.user_id = user.pk
+        self._project_member_ids = {}
+
+    @cached_property
+    def project_ids(self) -> frozenset[int]:
+        return frozenset(
+            ProjectMember.objects.filter(user_id=self.user_id).values_list('project_id', flat=True)
+        )
+
+    def is_member(self, project_id: int) -> bool:
+        return project_id in self.project_ids
+
+    def project_member_ids(self, project_id: int) -> frozenset[int]:
+        if project_id not in self._project_member_ids:
+            self._project_member_ids[project_id] = frozenset(
+                ProjectMember.objects.filter(project_id=project_id).values_list('user_id', flat=True)
+            )
+        return self._project_member_ids[project_id]
+
+    def user_is_member(self, user_id: int, project_id: int) -> bool:
+        if user_id == self.user_id:
+            return self.is_member(project_id)
+        return user_id in self.project_member_ids(project_id)
+
+
+def request_membership(request) -> ProjectMembership:
+    """The ProjectMembership for `request.user`, built on first use and kept on the request."""
+    membership = getattr(request, '_project_membership', None)
+    if membership is None or membership.user_id != request.user.pk:
+        membership = ProjectMembership(request.user)
+        request._project_membership = membership
+    return membership
+
+
+def ticket_has_assignee(ticket: Ticket, user_id: int) -> bool:
+    """Answer from prefetched assignees when the queryset loaded them."""
+    if 'assignees' in getattr(ticket, '_prefetched_objects_cache', {}):
+        return any(assignee.pk == user_id for assignee in ticket.assignees.all())
+    return ticket.assignees.filter(pk=user_id).exists()
+
+
+def user_can_access_project(user, project: Project, *, membership: ProjectMembership | None = None) -> bool:
     if user.role == 'admin':
         return True
     if project.created_by_id == user.id:
         return True
+    if membership is not None:
+        return membership.is_member(project.pk)
     return project.members.filter(pk=user.pk).exists()
 
 
-def user_can_create_ticket_on_project(user, project: Project) -> bool:
+def user_can_create_ticket_on_project(
+    user, project: Project, *, membership: ProjectMembership | None = None
+) -> bool:
     if user.role == 'admin':
         return True
-    if user.role == 'manager':
-        return (
-            project.created_by_id == user.id
-            or project.members.filter(pk=user.pk).exists()
-        )
+    if user.role == 'manager' and project.created_by_id == user.id:
+        return True
+    if membership is not None:
+        return membership.is_member(project.pk)
     return project.members.filter(pk=user.pk).exists()
 
 
-def user_can_access_ticket(user, ticket: Ticket) -> bool:
+def user_can_access_ticket(user, ticket: Ticket, *, membership: ProjectMembership | None = None) -> bool:
     if user.role == 'admin':
         return True
-    if user.role == 'manager':
-        return (
-            ticket.project.created_by_id == user.id
-            or ticket.project.members.filter(pk=user.pk).exists()
-            or ticket.assignees.filter(pk=user.pk).exists()
-            or ticket.created_by_id == user.id
-        )
-    return (
-        ticket.assignees.filter(pk=user.pk).exists()
-        or ticket.project.members.filter(pk=user.pk).exists()
-        or ticket.created_by_id == user.id
-    )
+    if ticket.created_by_id == user.id:
+        return True
+    if user.role == 'manager' and ticket.project.created_by_id == user.id:
+        return True
+    if membership is not None and membership.is_member(ticket.project_id):
+        return True
+    if membership is None and ticket.project.members.filter(pk=user.pk).exists():
+        return True
+    return ticket_has_assignee(ticket, user.id)
 
 
 def get_accessible_project(user, project_id: int) -> Project:
@@ -87,3 +143,22 @@ def accessible_ticket_ids_for_user(user):
         | Q(project__members=user)
         | Q(created_by=user)
     ).distinct().values_list('pk', flat=True)
+
+
+def accessible_workspace_docs(user, queryset):
+    """Narrow a WorkspaceDoc queryset to docs `user` may open."""
+    if user.role == 'admin':
+        return queryset.distinct()
+
+    if user.role == 'manager':
+        return queryset.filter(
+            Q(project__isnull=True, created_by=user)
+            | Q(project__created_by=user)
+            | Q(project__members=user)
+            | Q(created_by=user)
+        ).distinct()
+
+    return queryset.filter(
+        Q(project__isnull=True, created_by=user)
+        | Q(project__members=user)
+    ).distinct()
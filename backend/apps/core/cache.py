@@ -0,0 +1,89 @@
+"""
+Cache backends and key helpers.
+
+settings.CACHES defines four aliases, all Redis when REDIS_CACHE_URL is set
+and per-process LocMem otherwise:
+
+- `default`: shared keys that name their tenant explicitly (plan
+  entitlements, public doc renders, user state), so they can be read in one
+  schema and invalidated from another.
+- `tenant`: keys are namespaced by `connection.schema_name` through
+  `make_tenant_key`, for data that only ever lives inside one tenant.
+- `sessions`: backs the cached_db session engine.
+- `ratelimit`: request counters for RateLimitMiddleware.
+
+`versioned_key` / `bump_namespace` invalidate a whole group of keys at once
+by bumping a counter that is part of every key in the group.
+"""
+
+from django.core.cache import caches
+from django.core.cache.backends.locmem import LocMemCache
+from django.core.cache.backends.redis import RedisCache
+from django.db import connection
+
+from apps.core.instrumentation import record_cache_lookup
+
+_MISSING = object()
+
+NAMESPACE_VERSION_TTL = None  # version counters never expire on their own
+
+
+class InstrumentedCacheMixin:
+    """Counts get() lookups; BaseCache.get_many() and friends go through get()."""
+
+    def get(self, key, default=None, version=None):
+        value = super().get(key, _MISSING, version=version)
+        if value is _MISSING:
+            record_cache_lookup(misses=1)
+            return default
+        record_cache_lookup(hits=1)
+        return value
+
+
+class InstrumentedLocMemCache(InstrumentedCacheMixin, LocMemCache):
+    pass
+
+
+class InstrumentedRedisCache(InstrumentedCacheMixin, RedisCache):
+    """RedisCache fetches get_many() in one MGET, bypassing get(), so it is counted here."""
+
+    def get_many(self, keys, version=None):
+        keys = list(keys)
+        found = super().get_many(keys, version=version)
+        record_cache_lookup(hits=len(found), misses=len(keys) - len(found))
+        return found
+
+
+def make_tenant_key(key, key_prefix, version):
+    """KEY_FUNCTION for the `tenant` alias: prefix:version:schema:key."""
+    return f'{key_prefix}:{version}:{connection.schema_name}:{key}'
+
+
+def _namespace_version_key(namespace: str) -> str:
+    return f'nsversion:{namespace}'
+
+
+def namespace_version(namespace: str, *, alias: str = 'default') -> int:
+    cache = caches[alias]
+    version_key = _namespace_version_key(namespace)
+    version = cache.get(version_key)
+    if version is None:
+        cache.add(version_key, 1, NAMESPACE_VERSION_TTL)
+        version = cache.get(version_key, 1)
+    return version
+
+
+def versioned_key(namespace: str, key, *, alias: str = 'default') -> str:
+    """`namespace:v<N>:key`, where N changes every time the namespace is bumped."""
+    return f'{namespace}:v{namespace_version(namespace, alias=alias)}:{key}'
+
+
+def bump_namespace(namespace: str, *, alias: str = 'default') -> None:
+    """Orphan every key built with `versioned_key(namespace, ...)`; they expire by TTL."""
+    cache = caches[alias]
+    version_key = _namespace_version_key(namespace)
+    try:
+        cache.incr(version_key)
+    except ValueError:
+        if not cache.add(version_key, 2, NAMESPACE_VERSION_TTL):
+            cache.incr(version_key)
@@ -0,0 +1,179 @@
+"""
+Per-request instrumentation: SQL count/time, cache hits and external HTTP time.
+
+RequestInstrumentationMiddleware collects the numbers for every request,
+reports them in a Server-Timing header and folds them into an in-process
+aggregate keyed by tenant schema and URL name. QUERY_BUDGETS caps the
+number of queries an endpoint may run; with QUERY_BUDGET_ENFORCE on (tests)
+going over the budget raises instead of logging.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from contextlib import ExitStack, contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from functools import partial
+
+from django.conf import settings
+from django.db import connections
+
+logger = logging.getLogger(__name__)
+
+
+class QueryBudgetExceeded(AssertionError):
+    """An endpoint ran more SQL queries than its QUERY_BUDGETS entry allows."""
+
+
+@dataclass
+class RequestMetrics:
+    sql_count: int = 0
+    sql_ms: float = 0.0
+    cache_hits: int = 0
+    cache_misses: int = 0
+    external_ms: dict[str, float] = field(default_factory=dict)
+
+
+_current: ContextVar[RequestMetrics | None] = ContextVar('request_metrics', default=None)
+
+
+def current_metrics() -> RequestMetrics | None:
+    return _current.get()
+
+
+def _record_sql(metrics: RequestMetrics, execute, sql, params, many, context):
+    started = time.perf_counter()
+    try:
+        return execute(sql, params, many, context)
+    finally:
+        metrics.sql_count += 1
+        metrics.sql_ms += (time.perf_counter() - started) * 1000
+
+
+@contextmanager
+def collect_metrics():
+    """Collect metrics for the enclosed block (SQL on every configured connection)."""
+    metrics = RequestMetrics()
+    token = _current.set(metrics)
+    try:
+        with ExitStack() as stack:
+            for connection in connections.all():
+                stack.enter_context(connection.execute_wrapper(partial(_record_sql, metrics)))
+            yield metrics
+    finally:
+        _current.reset(token)
+
+
+def record_cache_lookup(*, hits: int = 0, misses: int = 0) -> None:
+    metrics = _current.get()
+    if metrics is not None:
+        metrics.cache_hits += hits
+        metrics.cache_misses += misses
+
+
+@contextmanager
+def track_external(service: str):
+    """Time a call to an external service (GitHub, SMTP, ...) for the current request."""
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        metrics = _current.get()
+        if metrics is not None:
+            elapsed = (time.perf_counter() - started) * 1000
+            metrics.external_ms[service] = metrics.external_ms.get(service, 0.0) + elapsed
+
+
+def server_timing_header(metrics: RequestMetrics, total_ms: float) -> str:
+    parts = [
+        f'db;dur={metrics.sql_ms:.1f};desc="{metrics.sql_count} queries"',
+        f'cache;desc="{metrics.cache_hits} hits, {metrics.cache_misses} misses"',
+    ]
+    for service, elapsed in sorted(metrics.external_ms.items()):
+        parts.append(f'ext-{service};dur={elapsed:.1f}')
+    parts.append(f'total;dur={total_ms:.1f}')
+    return ', '.join(parts)
+
+
+def check_query_budget(route: str, metrics: RequestMetrics, *, enforce: bool | None = None) -> None:
+    budget = settings.QUERY_BUDGETS.get(route)
+    if budget is None or metrics.sql_count <= budget:
+        return
+    message = f'{route} ran {metrics.sql_count} queries (budget {budget}).'
+    if settings.QUERY_BUDGET_ENFORCE if enforce is None else enforce:
+        raise QueryBudgetExceeded(message)
+    logger.warning(message)
+
+
+@contextmanager
+def enforce_query_budget(route: str):
+    """Fail when the enclosed block runs more queries than QUERY_BUDGETS[route] (for tests)."""
+    with collect_metrics() as metrics:
+        yield metrics
+    check_query_budget(route, metrics, enforce=True)
+
+
+_aggregate_lock = threading.Lock()
+_aggregate: dict[tuple[str, str, str], dict] = {}
+
+
+def record_request(*, schema: str, route: str, method: str, duration_ms: float, metrics: RequestMetrics) -> None:
+    with _aggregate_lock:
+        entry = _aggregate.setdefault((schema, route, method), {
+            'requests': 0,
+            'total_ms': 0.0,
+            'max_ms': 0.0,
+            'sql_count': 0,
+            'sql_max': 0,
+            'sql_ms': 0.0,
+            'cache_hits': 0,
+            'cache_misses': 0,
+            'external_ms': {},
+        })
+        entry['requests'] += 1
+        entry['total_ms'] += duration_ms
+        entry['max_ms'] = max(entry['max_ms'], duration_ms)
+        entry['sql_count'] += metrics.sql_count
+        entry['sql_max'] = max(entry['sql_max'], metrics.sql_count)
+        entry['sql_ms'] += metrics.sql_ms
+        entry['cache_hits'] += metrics.cache_hits
+        entry['cache_misses'] += metrics.cache_misses
+        for service, elapsed in metrics.external_ms.items():
+            entry['external_ms'][service] = entry['external_ms'].get(service, 0.0) + elapsed
+
+
+def metrics_snapshot(*, schema: str | None = None) -> list[dict]:
+    """Aggregated per-endpoint numbers for this process, slowest total time first."""
+    with _aggregate_lock:
+        items = [(key, dict(entry, external_ms=dict(entry['external_ms']))) for key, entry in _aggregate.items()]
+
+    rows = []
+    for (entry_schema, route, method), entry in items:
+        if schema is not None and entry_schema != schema:
+            continue
+        count = entry['requests']
+        rows.append({
+            'schema': entry_schema,
+            'route': route,
+            'method': method,
+            'requests': count,
+            'avg_ms': round(entry['total_ms'] / count, 2),
+            'max_ms': round(entry['max_ms'], 2),
+            'avg_queries': round(entry['sql_count'] / count, 2),
+            'max_queries': entry['sql_max'],
+            'query_budget': settings.QUERY_BUDGETS.get(route),
+            'avg_sql_ms': round(entry['sql_ms'] / count, 2),
+            'cache_hits': entry['cache_hits'],
+            'cache_misses': entry['cache_misses'],
+            'external_ms': {service: round(ms, 2) for service, ms in entry['external_ms'].items()},
+        })
+    rows.sort(key=lambda row: row['avg_ms'] * row['requests'], reverse=True)
+    return rows
+
+
+def reset_metrics() -> None:
+    with _aggregate_lock:
+        _aggregate.clear()
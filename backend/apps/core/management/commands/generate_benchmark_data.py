@@ -0,0 +1,29 @@
+import json
+
+from django.core.management.base import BaseCommand
+
+from benchmarks.dataset import SCALES, generate_dataset
+
+
+class Command(BaseCommand):
+    help = 'Create benchmark tenants (bench_0, bench_1, ...) filled with synthetic data.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--tenants', type=int, default=1)
+        parser.add_argument('--scale', choices=sorted(SCALES), default='small')
+        parser.add_argument('--seed', type=int, default=0)
+        parser.add_argument('--workers', type=int, default=1, help='Fill tenants in this many processes.')
+        parser.add_argument('--output', help='Write the JSON summary to this file.')
+
+    def handle(self, *args, **options):
+        summary = generate_dataset(
+            tenants=options['tenants'],
+            scale=SCALES[options['scale']],
+            seed=options['seed'],
+            workers=options['workers'],
+            stdout=self.stdout,
+        )
+        if options['output']:
+            with open(options['output'], 'w') as handle:
+                json.dump(summary, handle, indent=2)
+        self.stdout.write(self.style.SUCCESS(f'Benchmark data ready in {len(summary["tenants"])} tenant(s).'))
@@ -1,106 +1,97 @@
 from __future__ import annotations
 
+import logging
 import os
 import shutil
 
 from django.conf import settings
-from django.core.management.base import BaseCommand
-from django.db import transaction
-from django_tenants.utils import get_tenant_model, schema_context
+from django.db import connection, transaction
 
 from apps.core.media_paths import tenant_scoped_upload_path
+from apps.core.tenant_jobs import TenantJobCommand
 from apps.projects.models import ProjectDocument
 from apps.tickets.models import TicketMedia
 
+logger = logging.getLogger(__name__)
+
+
+def migrate_tenant_media(*, dry_run: bool = False) -> dict:
+    """
+    Move the current schema's legacy media files under {schema}/ and update
+    their rows. With dry_run, only report the planned moves.
+    """
+    media_root = settings.MEDIA_ROOT
+    schema_name = connection.schema_name
+    moved = 0
+    skipped = 0
+    planned = []
+
+    for model in (TicketMedia, ProjectDocument):
+        for instance in model.objects.exclude(file='').iterator():
+            current_name = instance.file.name
+            if not current_name or current_name.startswith(f'{schema_name}/'):
+                skipped += 1
+                continue
+
+            new_name = tenant_scoped_upload_path(current_name)
+            if new_name == current_name:
+                skipped += 1
+                continue
+
+            old_path = os.path.join(media_root, current_name)
+            new_path = os.path.join(media_root, new_name)
+
+            if dry_run:
+                planned.append(f'{current_name} -> {new_name}')
+                moved += 1
+                continue
+
+            if not os.path.isfile(old_path):
+                logger.warning('%s: missing file for %s; updating DB path only', schema_name, current_name)
+
+            os.makedirs(os.path.dirname(new_path), exist_ok=True)
 
-class Command(BaseCommand):
+            if os.path.isfile(old_path):
+                if os.path.exists(new_path):
+                    raise RuntimeError(f'Target already exists: {new_path}')
+                shutil.move(old_path, new_path)
+
+            with transaction.atomic():
+                instance.file.name = new_name
+                instance.save(update_fields=['file'])
+
+            moved += 1
+
+    return {'moved': moved, 'skipped': skipped, 'planned': planned}
+
+
+class Command(TenantJobCommand):
     help = 'Move legacy media files into tenant-scoped directories ({schema}/ticket_media/...).'
 
     def add_arguments(self, parser):
-        parser.add_argument(
-            '--schema',
-            default='',
-            help='Only migrate a single tenant schema (default: all tenants)',
-        )
+        super().add_arguments(parser)
         parser.add_argument(
             '--dry-run',
             action='store_true',
             help='Show planned moves without changing files or database rows',
         )
 
+    def describe_result(self, result) -> str:
+        lines = [f'moved={result["moved"]}, skipped={result["skipped"]}']
+        lines += [f'  {move}' for move in result['planned']]
+        return '\n'.join(lines)
+
     def handle(self, *args, **options):
         dry_run = options['dry_run']
-        schema_filter = options['schema'].strip()
-        media_root = settings.MEDIA_ROOT
-
-        tenants = get_tenant_model().objects.all()
-        if schema_filter:
-            tenants = tenants.filter(schema_name=schema_filter)
-
-        total_moved = 0
-        total_skipped = 0
-
-        for tenant in tenants:
-            if tenant.schema_name == 'public':
-                continue
-
-            with schema_context(tenant.schema_name):
-                moved, skipped = self._migrate_schema(
-                    media_root=media_root,
-                    schema_name=tenant.schema_name,
-                    dry_run=dry_run,
-                )
-                total_moved += moved
-                total_skipped += skipped
-                self.stdout.write(
-                    f'{tenant.schema_name}: moved={moved}, skipped={skipped}'
-                )
-
+        results = self.run_job(
+            'migrate_media',
+            job_name='migrate_media_dry_run' if dry_run else 'migrate_media',
+            options=options,
+            job_kwargs={'dry_run': dry_run},
+        )
+        total_moved = sum(result.result['moved'] for result in results)
+        total_skipped = sum(result.result['skipped'] for result in results)
         prefix = '[dry-run] ' if dry_run else ''
         self.stdout.write(self.style.SUCCESS(
             f'{prefix}Media migration complete. moved={total_moved}, skipped={total_skipped}'
         ))
-
-    def _migrate_schema(self, *, media_root, schema_name: str, dry_run: bool) -> tuple[int, int]:
-        moved = 0
-        skipped = 0
-
-        for model in (TicketMedia, ProjectDocument):
-            for instance in model.objects.exclude(file='').iterator():
-                current_name = instance.file.name
-                if not current_name or current_name.startswith(f'{schema_name}/'):
-                    skipped += 1
-                    continue
-
-                new_name = tenant_scoped_upload_path(current_name)
-                if new_name == current_name:
-                    skipped += 1
-                    continue
-
-                old_path = os.path.join(media_root, current_name)
-                new_path = os.path.join(media_root, new_name)
-
-                if dry_run:
-                    self.stdout.write(f'  {current_name} -> {new_name}')
-                    moved += 1
-                    continue
-
-                if not os.path.isfile(old_path):
-                    self.stderr.write(self.style.WARNING(
-                        f'  missing file for {current_name}; updating DB path only'
-                    ))
-
-                os.makedirs(os.path.dirname(new_path), exist_ok=True)
-
-                if os.path.isfile(old_path):
-                    if os.path.exists(new_path):
-                        raise RuntimeError(f'Target already exists: {new_path}')
-                    shutil.move(old_path, new_path)
-
-                with transaction.atomic():
-                    instance.file.name = new_name
-                    instance.save(update_fields=['file'])
-
-                moved += 1
-
-        return moved, skipped
@@ -0,0 +1,15 @@
+from apps.core.tenant_jobs import TENANT_JOBS, TenantJobCommand
+
+
+class Command(TenantJobCommand):
+    help = (
+        'Run a job in every tenant schema with a bounded process pool. JOB is one of '
+        f'{", ".join(sorted(TENANT_JOBS))}, a dotted path to a callable, or a management command name.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('job')
+        super().add_arguments(parser)
+
+    def handle(self, *args, **options):
+        self.run_job(options['job'], job_name=options['job'], options=options)
@@ -6,9 +6,10 @@ from rest_framework.decorators import api_view, permission_classes
 from rest_framework.exceptions import PermissionDenied
 from rest_framework.permissions import AllowAny
 
-from apps.core.access import user_can_access_project, user_can_access_ticket
+from apps.core.access import request_membership, user_can_access_project, user_can_access_ticket
 from apps.core.media_paths import assert_media_schema_access, parse_scoped_media_path
 from apps.core.media_utils import verify_media_signature
+from apps.core.transactions import read_only_safe_methods
 from apps.projects.models import Project
 from apps.tickets.models import Ticket
 
@@ -43,7 +44,7 @@ def _authorize_media_access(request, path: str) -> None:
             ticket = Ticket.objects.select_related('project').get(pk=resource_id)
         except Ticket.DoesNotExist as exc:
             raise Http404('Media not found.') from exc
-        if not user_can_access_ticket(user, ticket):
+        if not user_can_access_ticket(user, ticket, membership=request_membership(request)):
             raise PermissionDenied('You do not have access to this file.')
         return
 
@@ -52,13 +53,14 @@ def _authorize_media_access(request, path: str) -> None:
             project = Project.objects.get(pk=resource_id)
         except Project.DoesNotExist as exc:
             raise Http404('Media not found.') from exc
-        if not user_can_access_project(user, project):
+        if not user_can_access_project(user, project, membership=request_membership(request)):
             raise PermissionDenied('You do not have access to this file.')
         return
 
     raise PermissionDenied('Unsupported media path.')
 
 
+@read_only_safe_methods
 @api_view(['GET'])
 @permission_classes([AllowAny])
 def protected_media(request, path: str):
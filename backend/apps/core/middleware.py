@@ -1,8 +1,72 @@
 from django.http import JsonResponse
-from django.core.cache import cache
+from django.core.cache import caches
 from django.conf import settings
+from django.db import connections
 import time
 
+from apps.core import prometheus
+from apps.core.instrumentation import (
+    check_query_budget,
+    collect_metrics,
+    record_request,
+    server_timing_header,
+)
+
+
+class RequestInstrumentationMiddleware:
+    """
+    Record SQL count/time, cache hits and external HTTP time per request,
+    tagged by tenant schema and URL name (see apps.core.instrumentation).
+    """
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        started = time.perf_counter()
+        with collect_metrics() as metrics:
+            response = self.get_response(request)
+        duration_ms = (time.perf_counter() - started) * 1000
+
+        match = getattr(request, 'resolver_match', None)
+        route = match.view_name if match else 'unresolved'
+        tenant = getattr(request, 'tenant', None)
+        schema = getattr(tenant, 'schema_name', 'public')
+        record_request(
+            schema=schema,
+            route=route,
+            method=request.method,
+            duration_ms=duration_ms,
+            metrics=metrics,
+        )
+        prometheus.observe_request(
+            tenant=schema,
+            route=route,
+            method=request.method,
+            status=response.status_code,
+            duration=duration_ms / 1000,
+            metrics=metrics,
+        )
+        prometheus.set_open_connections(
+            sum(1 for conn in connections.all(initialized_only=True) if conn.connection is not None)
+        )
+        if settings.SERVER_TIMING_HEADER:
+            response['Server-Timing'] = server_timing_header(metrics, duration_ms)
+        check_query_budget(route, metrics)
+        return response
+
+
+def _hit_counter(cache_key: str, window: int) -> int:
+    """Count this request in a fixed window; add/incr are atomic on Redis, so workers share one count."""
+    ratelimit_cache = caches['ratelimit']
+    if ratelimit_cache.add(cache_key, 1, window):
+        return 1
+    try:
+        return ratelimit_cache.incr(cache_key)
+    except ValueError:
+        # The window expired between add() and incr().
+        ratelimit_cache.add(cache_key, 1, window)
+        return 1
+
 
 class RateLimitMiddleware:
     """
@@ -26,12 +90,15 @@ class RateLimitMiddleware:
         
         # Determine rate limit based on endpoint
         if '/auth/' in request.path:
+            bucket = 'auth'
             limit = 10  # 10 requests
             window = 60  # per 60 seconds
         elif '/media' in request.path and request.method in ('POST', 'PUT', 'PATCH'):
+            bucket = 'media_upload'
             limit = 20  # 20 requests
             window = 60  # per 60 seconds
         else:
+            bucket = 'default'
             limit = 100  # 100 requests
             window = 60  # per 60 seconds
         
@@ -39,21 +106,19 @@ class RateLimitMiddleware:
         schema = getattr(request, 'tenant', None)
         schema_name = getattr(schema, 'schema_name', 'public') if schema else 'public'
         cache_key = f'ratelimit:{schema_name}:{client_id}:{request.path}'
-        current = cache.get(cache_key, 0)
+        current = _hit_counter(cache_key, window)
         
-        if current >= limit:
+        if current > limit:
+            prometheus.record_rate_limit_rejection(bucket)
             return JsonResponse({
                 'error': 'Rate limit exceeded. Please try again later.',
                 'retry_after': window
             }, status=429)
         
-        # Increment counter
-        cache.set(cache_key, current + 1, window)
-        
         # Add rate limit headers
         response = self.get_response(request)
         response['X-RateLimit-Limit'] = str(limit)
-        response['X-RateLimit-Remaining'] = str(max(0, limit - current - 1))
+        response['X-RateLimit-Remaining'] = str(max(0, limit - current))
         
         return response
 
@@ -77,14 +142,14 @@ class RateLimitMiddleware:
         limit = 30
         window = 60
         cache_key = f'ratelimit:public_share:{client_id}'
-        current = cache.get(cache_key, 0)
-        if current >= limit:
+        current = _hit_counter(cache_key, window)
+        if current > limit:
+            prometheus.record_rate_limit_rejection('public_share')
             return JsonResponse({
                 'error': 'Rate limit exceeded. Please try again later.',
                 'retry_after': window,
             }, status=429)
-        cache.set(cache_key, current + 1, window)
         response = self.get_response(request)
         response['X-RateLimit-Limit'] = str(limit)
-        response['X-RateLimit-Remaining'] = str(max(0, limit - current - 1))
+        response['X-RateLimit-Remaining'] = str(max(0, limit - current))
         return response
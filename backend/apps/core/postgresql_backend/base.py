@@ -0,0 +1,114 @@
+"""
+django-tenants PostgreSQL backend that only sends SET search_path when it changes.
+
+The stock backend forgets the applied search_path every time set_tenant() is
+called, which TenantResolutionMiddleware does on every request, so a
+persistent connection re-sends the same SET on the first query of each
+request. This wrapper remembers what the server session actually has
+(TENANT_LIMIT_SET_CALLS makes the stock _cursor() honour that) and forgets it
+whenever the session value may have changed:
+
+- the connection is opened or closed;
+- a transaction or savepoint rolls back, which undoes a SET issued inside it;
+- with DATABASES[...]['TRANSACTION_POOLING'] on (PgBouncer or a similar
+  pooler in transaction mode), a transaction ends, because the next
+  transaction may run on a different server session.
+
+Under TRANSACTION_POOLING the path is never set for the session: inside a
+transaction it is sent as SET LOCAL, and a tenant query run in autocommit
+carries its own `SET LOCAL search_path = ...;` prefix, so the SET and the
+query are one implicit transaction on one server session.
+
+Code that changes search_path with raw SQL must restore it before returning,
+as django_tenants.clone does.
+"""
+
+import psycopg2.extensions
+import psycopg2.sql
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
+from django_tenants.postgresql_backend.base import DatabaseWrapper as TenantDatabaseWrapper
+from django_tenants.utils import get_public_schema_name
+
+
+def _search_path_sql(search_paths) -> str:
+    return 'SET LOCAL search_path = {}'.format(','.join(f"'{schema}'" for schema in search_paths))
+
+
+class PooledAutocommitCursor(psycopg2.extensions.cursor):
+    """Sends the tenant search_path in the same query string as each autocommit statement."""
+
+    search_path_sql = None
+
+    def _with_search_path(self, sql):
+        if self.search_path_sql is None or not self.connection.autocommit:
+            return sql
+        if isinstance(sql, psycopg2.sql.Composable):
+            sql = sql.as_string(self)
+        if isinstance(sql, bytes):
+            return self.search_path_sql.encode() + b'; ' + sql
+        return f'{self.search_path_sql}; {sql}'
+
+    def execute(self, sql, params=None):
+        return super().execute(self._with_search_path(sql), params)
+
+    def executemany(self, sql, params_list):
+        return super().executemany(self._with_search_path(sql), params_list)
+
+
+class DatabaseWrapper(TenantDatabaseWrapper):
+    @property
+    def transaction_pooling(self) -> bool:
+        return bool(self.settings_dict.get('TRANSACTION_POOLING'))
+
+    def set_tenant(self, tenant, include_public=True):
+        applied = self.search_path_set_schemas
+        super().set_tenant(tenant, include_public)
+        if applied and self.connection is not None and applied == self._get_cursor_search_paths():
+            self.search_path_set_schemas = applied
+
+    def connect(self):
+        super().connect()
+        self.search_path_set_schemas = None
+
+    def create_cursor(self, name=None):
+        if name or not self.transaction_pooling:
+            return super().create_cursor(name)
+        cursor = self.connection.cursor(cursor_factory=PooledAutocommitCursor)
+        cursor.tzinfo_factory = self.tzinfo_factory if settings.USE_TZ else None
+        return cursor
+
+    def _cursor(self, name=None):
+        if not self.transaction_pooling:
+            return super()._cursor(name=name)
+        if name:
+            raise ImproperlyConfigured('Server-side cursors cannot be used with TRANSACTION_POOLING.')
+        if not self.schema_name:
+            raise ImproperlyConfigured(
+                'Database schema not set. Did you forget to call set_schema() or set_tenant()?'
+            )
+
+        cursor = super(TenantDatabaseWrapper, self)._cursor()
+        search_paths = self._get_cursor_search_paths()
+        # Used by the cursor for statements it runs in autocommit. Sessions keep the
+        # server's default path under pooling, so public-schema statements need no
+        # prefix (and CREATE DATABASE and friends must not be put in a transaction).
+        if search_paths != [get_public_schema_name()]:
+            cursor.cursor.search_path_sql = _search_path_sql(search_paths)
+        if not self.get_autocommit() and self.search_path_set_schemas != search_paths:
+            cursor.execute(_search_path_sql(search_paths))
+            self.search_path_set_schemas = search_paths
+        return cursor
+
+    def _commit(self):
+        super()._commit()
+        if self.transaction_pooling:
+            self.search_path_set_schemas = None
+
+    def _rollback(self):
+        super()._rollback()
+        self.search_path_set_schemas = None
+
+    def _savepoint_rollback(self, sid):
+        super()._savepoint_rollback(sid)
+        self.search_path_set_schemas = None
@@ -0,0 +1,142 @@
+"""
+Prometheus metrics for the API, database, Celery tasks and rate limiting.
+
+Metrics are process-local unless PROMETHEUS_MULTIPROC_DIR is set before the
+process starts, in which case every gunicorn worker writes to it and /metrics/
+merges them at scrape time. Files are keyed by pid, so the directory must not
+be shared across containers: Celery workers get their own and, when
+CELERY_METRICS_PORT is set, serve it from the worker's main process.
+"""
+
+from __future__ import annotations
+
+import os
+import time
+
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    REGISTRY,
+    CollectorRegistry,
+    Counter,
+    Gauge,
+    Histogram,
+    generate_latest,
+    multiprocess,
+    start_http_server,
+)
+
+REQUEST_LATENCY = Histogram(
+    'tickethub_http_request_duration_seconds',
+    'API request latency by URL name.',
+    ['route', 'method', 'status'],
+    buckets=(0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10),
+)
+TENANT_REQUESTS = Counter(
+    'tickethub_tenant_requests_total',
+    'Requests served per tenant schema.',
+    ['tenant'],
+)
+DB_QUERIES = Counter(
+    'tickethub_db_queries_total',
+    'SQL queries run while serving requests, by URL name.',
+    ['route'],
+)
+DB_QUERY_SECONDS = Counter(
+    'tickethub_db_query_seconds_total',
+    'Time spent in SQL while serving requests, by URL name.',
+    ['route'],
+)
+DB_CONNECTIONS = Gauge(
+    'tickethub_db_connections_open',
+    'Database connections currently held open by API workers.',
+    multiprocess_mode='livesum',
+)
+CELERY_TASK_DURATION = Histogram(
+    'tickethub_celery_task_duration_seconds',
+    'Celery task run time.',
+    ['task'],
+    buckets=(0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60),
+)
+CELERY_TASK_FAILURES = Counter(
+    'tickethub_celery_task_failures_total',
+    'Celery task runs that raised.',
+    ['task'],
+)
+RATE_LIMIT_REJECTIONS = Counter(
+    'tickethub_rate_limit_rejections_total',
+    'Requests rejected by RateLimitMiddleware, by limit bucket.',
+    ['bucket'],
+)
+
+
+def observe_request(*, tenant: str, route: str, method: str, status: int, duration: float, metrics) -> None:
+    """Record one served request (`metrics` is the request's RequestMetrics)."""
+    REQUEST_LATENCY.labels(route, method, f'{status // 100}xx').observe(duration)
+    TENANT_REQUESTS.labels(tenant).inc()
+    DB_QUERIES.labels(route).inc(metrics.sql_count)
+    DB_QUERY_SECONDS.labels(route).inc(metrics.sql_ms / 1000)
+
+
+def set_open_connections(count: int) -> None:
+    DB_CONNECTIONS.set(count)
+
+
+def record_rate_limit_rejection(bucket: str) -> None:
+    RATE_LIMIT_REJECTIONS.labels(bucket).inc()
+
+
+_task_started: dict[str, float] = {}
+
+
+def _task_prerun(task_id=None, **kwargs):
+    _task_started[task_id] = time.perf_counter()
+
+
+def _task_postrun(task_id=None, task=None, **kwargs):
+    started = _task_started.pop(task_id, None)
+    if started is not None and task is not None:
+        CELERY_TASK_DURATION.labels(task.name).observe(time.perf_counter() - started)
+
+
+def _task_failure(sender=None, **kwargs):
+    CELERY_TASK_FAILURES.labels(getattr(sender, 'name', 'unknown')).inc()
+
+
+def _worker_ready(**kwargs):
+    port = os.environ.get('CELERY_METRICS_PORT')
+    if port:
+        start_metrics_server(int(port))
+
+
+def connect_celery_signals() -> None:
+    from celery import signals
+
+    signals.task_prerun.connect(_task_prerun, weak=False)
+    signals.task_postrun.connect(_task_postrun, weak=False)
+    signals.task_failure.connect(_task_failure, weak=False)
+    signals.worker_ready.connect(_worker_ready, weak=False)
+
+
+def _registry():
+    if os.environ.get('PROMETHEUS_MULTIPROC_DIR'):
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+        return registry
+    return REGISTRY
+
+
+def render_metrics() -> tuple[bytes, str]:
+    """Exposition-format payload for every process sharing PROMETHEUS_MULTIPROC_DIR (or just this one)."""
+    return generate_latest(_registry()), CONTENT_TYPE_LATEST
+
+
+def start_metrics_server(port: int, addr: str = '0.0.0.0'):
+    """Serve render_metrics() over plain HTTP from a daemon thread; returns the server."""
+    server, _thread = start_http_server(port, addr=addr, registry=_registry())
+    return server
+
+
+def mark_process_dead(pid: int) -> None:
+    """gunicorn child_exit hook: drop a dead worker's live gauges."""
+    if os.environ.get('PROMETHEUS_MULTIPROC_DIR'):
+        multiprocess.mark_process_dead(pid)
@@ -0,0 +1,245 @@
+"""
+Run a job in every tenant schema, optionally across a bounded process pool.
+
+A job is a module-level callable (or a management command name) run inside
+`schema_context(schema)` for each tenant. With `workers` > 1 tenants are
+spread over spawned worker processes; each keeps one database connection and
+switches schema per tenant. A failing tenant is recorded and the run moves
+on. With a checkpoint file, every finished tenant is written to it as soon
+as it completes, and a rerun skips tenants that already succeeded.
+"""
+
+from __future__ import annotations
+
+import io
+import json
+import logging
+import multiprocessing
+import os
+import time
+from collections.abc import Callable, Iterable
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import asdict, dataclass
+from functools import partial
+from typing import Any
+
+from django.core.management import call_command
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.utils import timezone
+from django.utils.module_loading import import_string
+from django_tenants.utils import get_public_schema_name, get_tenant_model, schema_context
+
+logger = logging.getLogger(__name__)
+
+# Named jobs for `run_tenant_job`; anything else is a dotted path or a command name.
+TENANT_JOBS = {
+    'migrate': 'apps.core.tenant_jobs.migrate_tenant_schema',
+    'mark_absentees': 'apps.attendance.tasks.mark_absentees',
+    'cleanup_old_notifications': 'apps.notifications.services.delete_old_notifications',
+    'sync_login_accounts': 'apps.customers.services.login_accounts.resync_current_tenant_login_accounts',
+    'migrate_media': 'apps.core.management.commands.migrate_media_schemas.migrate_tenant_media',
+    'reindex_search': 'apps.search.services.reindex_search_vectors',
+}
+
+
+@dataclass
+class TenantJobResult:
+    schema_name: str
+    ok: bool
+    seconds: float
+    result: Any = None
+    error: str = ''
+
+
+class TenantJobCheckpoint:
+    """JSON file of per-tenant outcomes for one job, rewritten after every tenant."""
+
+    def __init__(self, path: str, job_name: str, *, restart: bool = False):
+        self.path = path
+        self.job_name = job_name
+        self.tenants: dict[str, dict] = {}
+        if os.path.exists(path) and not restart:
+            with open(path) as handle:
+                data = json.load(handle)
+            if data.get('job') != job_name:
+                raise ValueError(f'{path} is a checkpoint for "{data.get("job")}", not "{job_name}".')
+            self.tenants = data.get('tenants', {})
+
+    @property
+    def completed(self) -> set[str]:
+        return {schema for schema, entry in self.tenants.items() if entry.get('ok')}
+
+    def record(self, result: TenantJobResult) -> None:
+        entry = asdict(result)
+        entry.pop('schema_name')
+        entry['finished_at'] = timezone.now().isoformat()
+        self.tenants[result.schema_name] = entry
+        tmp_path = f'{self.path}.tmp'
+        with open(tmp_path, 'w') as handle:
+            json.dump({'job': self.job_name, 'tenants': self.tenants}, handle, indent=2, default=str)
+        os.replace(tmp_path, self.path)
+
+
+def tenant_schema_names(schemas: Iterable[str] | None = None) -> list[str]:
+    """Tenant schemas in a stable order, optionally limited to `schemas`."""
+    queryset = get_tenant_model().objects.exclude(schema_name=get_public_schema_name())
+    if schemas:
+        queryset = queryset.filter(schema_name__in=list(schemas))
+    return list(queryset.order_by('schema_name').values_list('schema_name', flat=True))
+
+
+def resolve_job(job: str | Callable) -> Callable:
+    """A callable, a TENANT_JOBS name, a dotted path, or a management command name."""
+    if callable(job):
+        return job
+    if job in TENANT_JOBS:
+        return import_string(TENANT_JOBS[job])
+    if '.' in job:
+        return import_string(job)
+    return partial(call_command_job, job)
+
+
+def call_command_job(command_name: str, *args, **options) -> str:
+    """Run a management command in the current schema; returns its last output line."""
+    stdout = io.StringIO()
+    call_command(command_name, *args, stdout=stdout, **options)
+    lines = stdout.getvalue().strip().splitlines()
+    return lines[-1] if lines else ''
+
+
+def migrate_tenant_schema() -> str:
+    """Apply tenant-app migrations to the current schema only."""
+    schema_name = connection.schema_name
+    call_command('migrate_schemas', schema_name=schema_name, tenant=True, interactive=False, verbosity=0)
+    return 'migrated'
+
+
+def run_in_schema(job: Callable, schema_name: str, job_kwargs: dict | None = None) -> TenantJobResult:
+    started = time.perf_counter()
+    try:
+        with schema_context(schema_name):
+            result = job(**(job_kwargs or {}))
+    except Exception as exc:
+        logger.exception('Tenant job failed in schema %s', schema_name)
+        # Don't hand a broken connection to the next tenant in this worker.
+        if not connection.in_atomic_block:
+            connection.close_if_unusable_or_obsolete()
+        return TenantJobResult(schema_name, False, round(time.perf_counter() - started, 3), error=f'{type(exc).__name__}: {exc}')
+    return TenantJobResult(schema_name, True, round(time.perf_counter() - started, 3), result=result)
+
+
+def _setup_worker() -> None:
+    import django
+
+    django.setup()
+
+
+def run_tenant_job(
+    job: str | Callable,
+    *,
+    schemas: Iterable[str] | None = None,
+    workers: int = 1,
+    checkpoint: TenantJobCheckpoint | None = None,
+    job_kwargs: dict | None = None,
+    on_result: Callable[[TenantJobResult], None] | None = None,
+) -> list[TenantJobResult]:
+    """
+    Run `job` once per tenant schema and return the results of this run.
+
+    Tenants already completed in `checkpoint` are skipped. Worker processes are
+    spawned (not forked), so they never share the caller's DB connections.
+    """
+    func = resolve_job(job)
+    pending = tenant_schema_names(schemas)
+    if checkpoint is not None:
+        done = checkpoint.completed
+        pending = [schema for schema in pending if schema not in done]
+
+    results = []
+
+    def finish(result: TenantJobResult) -> None:
+        results.append(result)
+        if checkpoint is not None:
+            checkpoint.record(result)
+        if on_result is not None:
+            on_result(result)
+
+    if workers <= 1 or len(pending) <= 1:
+        for schema_name in pending:
+            finish(run_in_schema(func, schema_name, job_kwargs))
+        return results
+
+    with ProcessPoolExecutor(
+        max_workers=min(workers, len(pending)),
+        mp_context=multiprocessing.get_context('spawn'),
+        initializer=_setup_worker,
+    ) as pool:
+        futures = {pool.submit(run_in_schema, func, schema_name, job_kwargs): schema_name for schema_name in pending}
+        for future in as_completed(futures):
+            try:
+                result = future.result()
+            except Exception as exc:
+                # The worker itself died (or the job's result could not be pickled).
+                result = TenantJobResult(futures[future], False, 0.0, error=f'{type(exc).__name__}: {exc}')
+            finish(result)
+    return results
+
+
+class TenantJobCommand(BaseCommand):
+    """
+    Base for management commands that run a job in every tenant schema.
+
+    Adds --schema (repeatable), --workers, --checkpoint and --restart; exits
+    non-zero when any tenant failed.
+    """
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--schema',
+            action='append',
+            dest='schemas',
+            help='Only run in this tenant schema (repeatable; default: all tenants)',
+        )
+        parser.add_argument('--workers', type=int, default=1, help='Tenants processed in parallel')
+        parser.add_argument('--checkpoint', help='JSON progress file; rerunning with it skips finished tenants')
+        parser.add_argument('--restart', action='store_true', help='Ignore what --checkpoint says is already done')
+
+    def describe_result(self, result) -> str:
+        return '' if result is None else str(result)
+
+    def run_job(self, job: str | Callable, *, job_name: str, options, job_kwargs: dict | None = None) -> list[TenantJobResult]:
+        checkpoint = None
+        if options['checkpoint']:
+            try:
+                checkpoint = TenantJobCheckpoint(options['checkpoint'], job_name, restart=options['restart'])
+            except ValueError as exc:
+                raise CommandError(str(exc)) from exc
+            if checkpoint.completed:
+                self.stdout.write(f'Resuming: {len(checkpoint.completed)} tenant(s) already done')
+
+        def report(result: TenantJobResult) -> None:
+            if result.ok:
+                self.stdout.write(f'{result.schema_name}: {self.describe_result(result.result)} ({result.seconds:.2f}s)')
+            else:
+                self.stderr.write(self.style.ERROR(f'{result.schema_name}: FAILED {result.error} ({result.seconds:.2f}s)'))
+
+        started = time.perf_counter()
+        results = run_tenant_job(
+            job,
+            schemas=options['schemas'],
+            workers=options['workers'],
+            checkpoint=checkpoint,
+            job_kwargs=job_kwargs,
+            on_result=report,
+        )
+        failed = [result.schema_name for result in results if not result.ok]
+        elapsed = time.perf_counter() - started
+        summary = f'{job_name}: {len(results) - len(failed)} tenant(s) ok, {len(failed)} failed in {elapsed:.1f}s'
+        if results:
+            slowest = max(results, key=lambda result: result.seconds)
+            summary += f' (slowest: {slowest.schema_name} {slowest.seconds:.2f}s)'
+        if failed:
+            raise CommandError(f'{summary}. Failed: {", ".join(failed)}')
+        self.stdout.write(self.style.SUCCESS(summary))
+        return results
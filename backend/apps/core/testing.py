@@ -0,0 +1,76 @@
+"""
+Shared test helpers.
+
+`MainTenantTestCase` creates the `main` tenant and runs every test inside its
+schema; subclasses call super().setUp() before creating tenant data.
+
+`redis_caches()` builds a CACHES setting like production's with
+REDIS_CACHE_URL set: a real server when TEST_REDIS_URL is set, otherwise
+fakeredis in-process. `use_redis_caches` applies it with override_settings and
+skips the test when neither is available.
+
+    @use_redis_caches
+    class MyCacheTests(TestCase): ...
+"""
+
+import os
+import unittest
+
+from django.test import TestCase, override_settings
+from django_tenants.utils import schema_context
+
+from apps.customers.models import Client
+
+try:
+    import fakeredis
+except ImportError:  # pragma: no cover - fakeredis is a test requirement
+    fakeredis = None
+
+TEST_REDIS_URL = os.environ.get('TEST_REDIS_URL', '')
+
+
+class MainTenantTestCase(TestCase):
+    """Creates the `main` tenant as `self.tenant` and enters its schema for each test."""
+
+    # Extra or overriding Client fields.
+    tenant_fields: dict = {}
+
+    def setUp(self):
+        super().setUp()
+        fields = {'name': 'Main Organization', 'slug': 'main', 'is_active': True, **self.tenant_fields}
+        self.tenant = Client(schema_name='main', **fields)
+        self.tenant.save()
+        self.enterContext(schema_context('main'))
+
+
+def redis_caches(url: str | None = None) -> dict | None:
+    url = url or TEST_REDIS_URL
+    options = {}
+    if not url:
+        if fakeredis is None:
+            return None
+        url = 'redis://fakeredis:6379/0'
+        options = {'connection_class': fakeredis.FakeConnection}
+
+    def alias(name: str, **extra) -> dict:
+        return {
+            'BACKEND': 'apps.core.cache.InstrumentedRedisCache',
+            'LOCATION': url,
+            'KEY_PREFIX': f'test:{name}',
+            'OPTIONS': options,
+            **extra,
+        }
+
+    return {
+        'default': alias('default'),
+        'tenant': alias('tenant', KEY_FUNCTION='apps.core.cache.make_tenant_key'),
+        'sessions': alias('sessions'),
+        'ratelimit': alias('ratelimit'),
+    }
+
+
+def use_redis_caches(test_item):
+    caches_setting = redis_caches()
+    if caches_setting is None:
+        return unittest.skip('Set TEST_REDIS_URL or install fakeredis')(test_item)
+    return override_settings(CACHES=caches_setting)(test_item)
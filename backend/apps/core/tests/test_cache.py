@@ -0,0 +1,46 @@
+from django.core.cache import caches
+from django.test import SimpleTestCase
+from django_tenants.utils import schema_context
+
+from apps.core.cache import InstrumentedRedisCache, bump_namespace, versioned_key
+from apps.core.instrumentation import collect_metrics
+from apps.core.middleware import _hit_counter
+from apps.core.testing import use_redis_caches
+
+
+@use_redis_caches
+class RedisCacheTests(SimpleTestCase):
+    def setUp(self):
+        caches['default'].clear()
+
+    def test_aliases_share_one_server_under_separate_prefixes(self):
+        self.assertIsInstance(caches['default'], InstrumentedRedisCache)
+        caches['default'].set('key', 'default')
+        caches['ratelimit'].set('key', 'ratelimit')
+        self.assertEqual(caches['default'].get('key'), 'default')
+        self.assertEqual(caches['ratelimit'].get('key'), 'ratelimit')
+
+    def test_tenant_alias_namespaces_by_schema(self):
+        with schema_context('acme'):
+            caches['tenant'].set('recent', [1, 2])
+            self.assertEqual(caches['tenant'].get('recent'), [1, 2])
+        with schema_context('beta'):
+            self.assertIsNone(caches['tenant'].get('recent'))
+
+    def test_bump_namespace_orphans_versioned_keys(self):
+        key = versioned_key('user_state:acme', 7)
+        caches['default'].set(key, {'is_active': True})
+        bump_namespace('user_state:acme')
+
+        self.assertNotEqual(versioned_key('user_state:acme', 7), key)
+        self.assertEqual(versioned_key('user_state:beta', 7), 'user_state:beta:v1:7')
+
+    def test_get_many_is_instrumented(self):
+        caches['default'].set('present', 1)
+        with collect_metrics() as metrics:
+            caches['default'].get('present')
+            caches['default'].get_many(['present', 'absent'])
+        self.assertEqual((metrics.cache_hits, metrics.cache_misses), (2, 1))
+
+    def test_rate_limit_counter_is_atomic(self):
+        self.assertEqual([_hit_counter('ratelimit:test', 60) for _ in range(3)], [1, 2, 3])
@@ -0,0 +1,97 @@
+from django.db import connections
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+
+
+class SearchPathReuseTests(TestCase):
+    """Run on a second connection so autocommit and real commits can be observed."""
+
+    def setUp(self):
+        self.db = connections.create_connection('default')
+        self.db.settings_dict = dict(self.db.settings_dict, TRANSACTION_POOLING=False)
+        self.addCleanup(self.db.close)
+
+    def run_queries(self, *schemas):
+        """Run one query per schema and return how many SET search_path statements were sent."""
+        with CaptureQueriesContext(self.db) as queries:
+            for schema in schemas:
+                self.db.set_schema(schema)
+                with self.db.cursor() as cursor:
+                    cursor.execute('SELECT 1')
+        return sum(1 for q in queries.captured_queries if q['sql'].startswith('SET search_path'))
+
+    def test_same_tenant_reuses_the_applied_path(self):
+        self.run_queries('acme')
+        self.assertEqual(self.run_queries('acme', 'acme'), 0)
+        self.assertEqual(self.run_queries('beta', 'acme'), 2)
+
+    def test_rollback_forgets_the_applied_path(self):
+        self.run_queries('public')
+        self.db.set_autocommit(False)
+        self.run_queries('acme')
+        self.db.rollback()
+        self.db.set_autocommit(True)
+        self.assertEqual(self.run_queries('acme'), 1)
+
+    def test_reconnect_forgets_the_applied_path(self):
+        self.run_queries('acme')
+        self.db.close()
+        self.assertEqual(self.run_queries('acme'), 1)
+
+
+class TransactionPoolingSearchPathTests(TestCase):
+    """With TRANSACTION_POOLING the path must travel with each transaction, never the session."""
+
+    def setUp(self):
+        self.db = connections.create_connection('default')
+        self.db.settings_dict = dict(self.db.settings_dict, TRANSACTION_POOLING=True)
+        self.addCleanup(self.db.close)
+
+    def current_search_path(self, schema):
+        self.db.set_schema(schema)
+        with self.db.cursor() as cursor:
+            cursor.execute("SELECT current_setting('search_path')")
+            return cursor.fetchone()[0]
+
+    def session_search_path(self):
+        """The server session's own value, read without the backend's prefix."""
+        self.db.ensure_connection()
+        with self.db.connection.cursor() as cursor:
+            cursor.execute("SELECT current_setting('search_path')")
+            return cursor.fetchone()[0]
+
+    def test_autocommit_query_carries_its_search_path(self):
+        default = self.session_search_path()
+        with CaptureQueriesContext(self.db) as queries:
+            self.assertEqual(self.current_search_path('acme'), 'acme, public')
+        # The SET and the query went out as one statement, and the session itself was never changed.
+        self.assertEqual(
+            [q['sql'] for q in queries.captured_queries],
+            ["SET LOCAL search_path = 'acme','public'; SELECT current_setting('search_path')"],
+        )
+        self.assertEqual(self.session_search_path(), default)
+
+    def test_transaction_sets_the_path_locally_once(self):
+        default = self.session_search_path()
+        self.db.set_autocommit(False)
+        with CaptureQueriesContext(self.db) as queries:
+            self.assertEqual(self.current_search_path('acme'), 'acme, public')
+            self.assertEqual(self.current_search_path('acme'), 'acme, public')
+        self.assertEqual(
+            [q['sql'] for q in queries.captured_queries if 'search_path =' in q['sql']],
+            ["SET LOCAL search_path = 'acme','public'"],
+        )
+        self.db.commit()
+        self.db.set_autocommit(True)
+        # SET LOCAL ended with the transaction it shared with the query.
+        self.assertEqual(self.session_search_path(), default)
+
+    def test_each_transaction_sets_its_own_path(self):
+        self.db.set_autocommit(False)
+        self.current_search_path('acme')
+        self.db.commit()
+        with CaptureQueriesContext(self.db) as queries:
+            self.assertEqual(self.current_search_path('acme'), 'acme, public')
+        self.assertTrue(queries.captured_queries[0]['sql'].startswith('SET LOCAL search_path'))
+        self.db.rollback()
+        self.db.set_autocommit(True)
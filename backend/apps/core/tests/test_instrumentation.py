@@ -0,0 +1,73 @@
+from django.core.cache import cache
+from django.db import connection
+from django.test import TestCase, override_settings
+from rest_framework.test import APIClient
+
+from apps.core.instrumentation import (
+    QueryBudgetExceeded,
+    collect_metrics,
+    enforce_query_budget,
+    metrics_snapshot,
+    reset_metrics,
+    track_external,
+)
+from apps.customers.models import Client
+from apps.users.models import User
+
+
+@override_settings(SERVER_TIMING_HEADER=True)
+class RequestInstrumentationTests(TestCase):
+    def setUp(self):
+        from django_tenants.utils import schema_context
+
+        reset_metrics()
+        self.addCleanup(reset_metrics)
+        # Requests leave the connection on the tenant schema they resolved.
+        self.addCleanup(connection.set_schema_to_public)
+        Client(schema_name='main', name='Main Organization', slug='main', is_active=True).save()
+        with schema_context('main'):
+            self.admin = User.objects.create_user(username='boss', email='b@test.com', password='pw', role='admin')
+            self.dev = User.objects.create_user(username='dev', email='d@test.com', password='pw', role='employee')
+
+    def _client(self, user):
+        client = APIClient(HTTP_X_TENANT_SCHEMA='main')
+        client.force_authenticate(user)
+        return client
+
+    def test_server_timing_and_aggregate_by_tenant_and_route(self):
+        response = self._client(self.dev).get('/api/timelogs/worklogs/')
+        self.assertEqual(response.status_code, 200)
+        self.assertRegex(response['Server-Timing'], r'^db;dur=[\d.]+;desc="\d+ queries", cache;desc=')
+
+        endpoints = self._client(self.admin).get('/api/metrics/requests/').data['endpoints']
+        worklogs = next(row for row in endpoints if row['route'] == 'worklog-list')
+        self.assertEqual((worklogs['schema'], worklogs['method'], worklogs['requests']), ('main', 'GET', 1))
+        self.assertGreater(worklogs['avg_queries'], 0)
+        self.assertEqual(worklogs['query_budget'], 10)
+
+    def test_metrics_endpoint_is_admin_only(self):
+        self.assertEqual(self._client(self.dev).get('/api/metrics/requests/').status_code, 403)
+
+    @override_settings(QUERY_BUDGETS={'worklog-list': 1})
+    def test_over_budget_request_fails_in_tests(self):
+        with self.assertRaises(QueryBudgetExceeded):
+            self._client(self.dev).get('/api/timelogs/worklogs/')
+
+    @override_settings(QUERY_BUDGETS={'ticket-stats': 1}, QUERY_BUDGET_ENFORCE=False)
+    def test_enforce_query_budget_context_manager(self):
+        with self.assertRaisesRegex(QueryBudgetExceeded, r'^ticket-stats ran \d+ queries \(budget 1\)\.$'):
+            with enforce_query_budget('ticket-stats'):
+                Client.objects.count()
+                Client.objects.count()
+
+    def test_cache_and_external_time_are_attributed_to_the_request(self):
+        with collect_metrics() as metrics:
+            cache.set('instrumented', 1)
+            cache.get('instrumented')
+            cache.get('missing')
+            cache.get_many(['instrumented', 'missing'])
+            with track_external('github'):
+                pass
+        self.assertEqual((metrics.cache_hits, metrics.cache_misses), (2, 2))
+        self.assertIn('github', metrics.external_ms)
+        self.assertEqual(metrics_snapshot(), [])
@@ -0,0 +1,110 @@
+import os
+import subprocess
+import sys
+import tempfile
+from unittest import mock
+from urllib.request import urlopen
+
+from django.conf import settings
+from django.core.cache import cache, caches
+from django.db import connection
+from django.test import TestCase, override_settings
+from prometheus_client.parser import text_string_to_metric_families
+from rest_framework.test import APIClient
+
+from apps.customers.models import Client
+from apps.users.models import User
+
+
+def _samples(body: str) -> dict:
+    samples = {}
+    for family in text_string_to_metric_families(body):
+        for sample in family.samples:
+            samples[(sample.name, tuple(sorted(sample.labels.items())))] = sample.value
+    return samples
+
+
+@override_settings(METRICS_TOKEN='scrape-me')
+class PrometheusScrapeTests(TestCase):
+    def setUp(self):
+        from django_tenants.utils import schema_context
+
+        cache.clear()
+        caches['ratelimit'].clear()
+        self.addCleanup(connection.set_schema_to_public)
+        Client(schema_name='main', name='Main Organization', slug='main', is_active=True).save()
+        with schema_context('main'):
+            self.dev = User.objects.create_user(username='dev', email='d@test.com', password='pw', role='employee')
+
+    def _scrape(self, **headers):
+        return self.client.get('/metrics/', HTTP_AUTHORIZATION='Bearer scrape-me', **headers)
+
+    def test_scrape_reports_requests_tenants_rate_limits_and_tasks(self):
+        from apps.notifications.tasks import send_ticket_assignment_email
+
+        api = APIClient(HTTP_X_TENANT_SCHEMA='main')
+        api.force_authenticate(self.dev)
+        self.assertEqual(api.get('/api/timelogs/worklogs/').status_code, 200)
+        for _ in range(11):
+            response = api.get('/api/auth/profile/')
+        self.assertEqual(response.status_code, 429)
+        send_ticket_assignment_email.delay(0, 0, 0)
+
+        response = self._scrape()
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response['Content-Type'].startswith('text/plain'))
+        samples = _samples(response.content.decode())
+
+        route = (('method', 'GET'), ('route', 'worklog-list'), ('status', '2xx'))
+        self.assertGreaterEqual(samples[('tickethub_http_request_duration_seconds_count', route)], 1)
+        self.assertGreaterEqual(samples[('tickethub_tenant_requests_total', (('tenant', 'main'),))], 12)
+        self.assertGreater(samples[('tickethub_db_queries_total', (('route', 'worklog-list'),))], 0)
+        self.assertGreaterEqual(samples[('tickethub_rate_limit_rejections_total', (('bucket', 'auth'),))], 1)
+        task = (('task', 'apps.notifications.tasks.send_ticket_assignment_email'),)
+        self.assertGreaterEqual(samples[('tickethub_celery_task_duration_seconds_count', task)], 1)
+        self.assertIn(('tickethub_db_connections_open', ()), samples)
+
+    def test_scrape_requires_token(self):
+        self.assertEqual(self.client.get('/metrics/').status_code, 401)
+
+    @override_settings(METRICS_TOKEN='', DEBUG=False)
+    def test_hidden_without_token_outside_debug(self):
+        self.assertEqual(self.client.get('/metrics/').status_code, 404)
+
+
+class PrometheusMultiprocessTests(TestCase):
+    def test_counters_from_separate_worker_processes_are_merged(self):
+        with tempfile.TemporaryDirectory() as multiproc_dir:
+            env = dict(os.environ, PROMETHEUS_MULTIPROC_DIR=multiproc_dir)
+
+            def run(code):
+                return subprocess.run(
+                    [sys.executable, '-c', code], cwd=settings.BASE_DIR, env=env,
+                    check=True, capture_output=True, text=True,
+                ).stdout
+
+            for _ in range(2):
+                run('from apps.core import prometheus; prometheus.record_rate_limit_rejection("auth")')
+            body = run('import sys; from apps.core import prometheus; sys.stdout.write(prometheus.render_metrics()[0].decode())')
+
+        samples = _samples(body)
+        self.assertEqual(samples[('tickethub_rate_limit_rejections_total', (('bucket', 'auth'),))], 2)
+
+    def test_metrics_server_merges_the_multiprocess_directory(self):
+        from apps.core import prometheus
+
+        with tempfile.TemporaryDirectory() as multiproc_dir:
+            env = dict(os.environ, PROMETHEUS_MULTIPROC_DIR=multiproc_dir)
+            subprocess.run(
+                [sys.executable, '-c', 'from apps.core import prometheus; prometheus.record_rate_limit_rejection("auth")'],
+                cwd=settings.BASE_DIR, env=env, check=True,
+            )
+            with mock.patch.dict(os.environ, PROMETHEUS_MULTIPROC_DIR=multiproc_dir):
+                server = prometheus.start_metrics_server(0, addr='127.0.0.1')
+            self.addCleanup(server.server_close)
+            self.addCleanup(server.shutdown)
+            with urlopen(f'http://127.0.0.1:{server.server_port}/metrics') as response:
+                body = response.read().decode()
+
+        samples = _samples(body)
+        self.assertEqual(samples[('tickethub_rate_limit_rejections_total', (('bucket', 'auth'),))], 1)
@@ -0,0 +1,92 @@
+import json
+import os
+import tempfile
+from datetime import date, timedelta
+
+from django.db import connection
+from django.test import TestCase
+from django.utils import timezone
+from django_tenants.utils import schema_context
+
+from apps.attendance.models import Attendance
+from apps.attendance.tasks import mark_absentees
+from apps.core.tenant_jobs import TenantJobCheckpoint, run_tenant_job
+from apps.core.testing import MainTenantTestCase
+from apps.customers.models import Client
+from apps.notifications.models import Notification
+from apps.notifications.services import delete_old_notifications
+from apps.users.models import User
+
+
+def count_users():
+    return User.objects.count()
+
+
+def fail_in_other():
+    if connection.schema_name == 'other':
+        raise RuntimeError('boom')
+    return connection.schema_name
+
+
+class RunTenantJobTests(TestCase):
+    def setUp(self):
+        for schema in ('main', 'other'):
+            Client(schema_name=schema, name=schema.title(), slug=schema, is_active=True).save()
+        with schema_context('other'):
+            User.objects.create_user(username='alice', password='pw-12345')
+        tmp = tempfile.mkdtemp()
+        self.checkpoint_path = os.path.join(tmp, 'job.json')
+        self.addCleanup(lambda: os.path.exists(self.checkpoint_path) and os.remove(self.checkpoint_path))
+
+    def test_runs_in_every_tenant_schema(self):
+        results = run_tenant_job(count_users)
+
+        self.assertEqual([(r.schema_name, r.ok, r.result) for r in results], [('main', True, 0), ('other', True, 1)])
+
+    def test_failure_is_isolated_and_checkpointed(self):
+        checkpoint = TenantJobCheckpoint(self.checkpoint_path, 'fail')
+        results = run_tenant_job(fail_in_other, checkpoint=checkpoint)
+
+        self.assertEqual({r.schema_name: r.ok for r in results}, {'main': True, 'other': False})
+        self.assertIn('RuntimeError: boom', results[1].error)
+        with open(self.checkpoint_path) as handle:
+            saved = json.load(handle)
+        self.assertEqual(saved['job'], 'fail')
+        self.assertTrue(saved['tenants']['main']['ok'])
+        self.assertFalse(saved['tenants']['other']['ok'])
+
+    def test_resume_skips_completed_tenants(self):
+        run_tenant_job(fail_in_other, checkpoint=TenantJobCheckpoint(self.checkpoint_path, 'fail'))
+
+        rerun = run_tenant_job(fail_in_other, checkpoint=TenantJobCheckpoint(self.checkpoint_path, 'fail'))
+        self.assertEqual([r.schema_name for r in rerun], ['other'])
+
+        restarted = run_tenant_job(count_users, checkpoint=TenantJobCheckpoint(self.checkpoint_path, 'fail', restart=True))
+        self.assertEqual(len(restarted), 2)
+
+    def test_checkpoint_for_another_job_is_rejected(self):
+        TenantJobCheckpoint(self.checkpoint_path, 'fail').record(run_tenant_job(count_users, schemas=['main'])[0])
+
+        with self.assertRaises(ValueError):
+            TenantJobCheckpoint(self.checkpoint_path, 'count')
+
+
+class TenantMaintenanceJobTests(MainTenantTestCase):
+    def test_mark_absentees_marks_untouched_users_only(self):
+        day = date(2026, 3, 4)  # a Wednesday
+        idle = User.objects.create_user(username='idle', password='pw-12345')
+        present = User.objects.create_user(username='present', password='pw-12345')
+        Attendance.objects.create(employee=present, date=day, status='present')
+
+        self.assertEqual(mark_absentees(day), 1)
+        self.assertEqual(Attendance.objects.get(employee=idle, date=day).status, 'absent')
+        self.assertEqual(Attendance.objects.get(employee=present, date=day).status, 'present')
+
+    def test_delete_old_notifications(self):
+        user = User.objects.create_user(username='u', password='pw-12345')
+        old = Notification.objects.create(user=user, message='old')
+        Notification.objects.filter(pk=old.pk).update(created_at=timezone.now() - timedelta(days=8))
+        Notification.objects.create(user=user, message='new')
+
+        self.assertEqual(delete_old_notifications(days=7), 1)
+        self.assertEqual(Notification.objects.count(), 1)
@@ -0,0 +1,69 @@
+from django.db import DatabaseError, connection
+from django.test import TestCase, override_settings
+from django.utils import timezone
+from rest_framework.decorators import api_view, permission_classes
+from rest_framework.permissions import AllowAny
+from rest_framework.response import Response
+from rest_framework.test import APIRequestFactory, force_authenticate
+
+from apps.attendance.models import Attendance, OfficeSettings
+from apps.attendance.views import get_my_attendance, get_team_attendance
+from apps.core.testing import MainTenantTestCase
+from apps.core.transactions import read_only_safe_methods
+from apps.users.models import User
+
+
+def _make_view(body):
+    @read_only_safe_methods
+    @api_view(['GET', 'POST'])
+    @permission_classes([AllowAny])
+    def view(request):
+        return Response(body())
+
+    return view
+
+
+class ReadOnlySafeMethodsTests(TestCase):
+    def setUp(self):
+        self.factory = APIRequestFactory()
+        self.depth = len(connection.atomic_blocks)
+        self.view = _make_view(lambda: {'depth': len(connection.atomic_blocks) - self.depth})
+
+    @override_settings(READ_ONLY_REQUEST_MODE='autocommit')
+    def test_safe_methods_skip_the_request_transaction(self):
+        self.assertEqual(self.view(self.factory.get('/')).data, {'depth': 0})
+        self.assertEqual(self.view(self.factory.post('/')).data, {'depth': 1})
+
+    @override_settings(READ_ONLY_REQUEST_MODE='read_only')
+    def test_read_only_mode_rejects_writes(self):
+        def write():
+            with connection.cursor() as cursor:
+                cursor.execute('CREATE TABLE read_only_probe (id int)')
+
+        with self.assertRaises(DatabaseError):
+            _make_view(write)(self.factory.get('/'))
+        self.assertEqual(len(connection.atomic_blocks), self.depth)
+
+
+class AttendanceReadsDoNotWriteTests(MainTenantTestCase):
+    def setUp(self):
+        super().setUp()
+
+        self.manager = User.objects.create_user(username='mgr', email='m@test.com', password='pw', role='manager')
+        User.objects.create_user(username='dev', email='d@test.com', password='pw', role='employee')
+
+    def get(self, view):
+        request = APIRequestFactory().get('/')
+        force_authenticate(request, user=self.manager)
+        return view(request)
+
+    def test_get_views_create_no_rows(self):
+        self.assertEqual(self.get(get_my_attendance).status_code, 200)
+        self.assertEqual(self.get(get_team_attendance).status_code, 200)
+        self.assertFalse(Attendance.objects.exists())
+        self.assertFalse(OfficeSettings.objects.exists())
+
+    def test_effective_for_day_returns_placeholders(self):
+        [attendance] = Attendance.effective_for_day([self.manager], timezone.localdate())
+        self.assertIsNone(attendance.pk)
+        self.assertIn(attendance.status, {'neutral', 'absent'})
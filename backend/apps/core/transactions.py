@@ -0,0 +1,65 @@
+"""
+Per-view opt-out of ATOMIC_REQUESTS for safe methods.
+
+ATOMIC_REQUESTS wraps every view in a transaction, so a dashboard, report or
+media download holds one open through serialization and streaming even
+though it writes nothing. Views decorated with `read_only_safe_methods` (or
+class views using ReadOnlySafeMethodsMixin) run GET, HEAD and OPTIONS
+according to READ_ONLY_REQUEST_MODE:
+
+- 'autocommit': no transaction at all;
+- 'read_only': inside a transaction (a savepoint when one is already open)
+  with transaction_read_only on, so a stray write fails loudly. It is always
+  rolled back, as there is nothing to keep.
+
+Every other method keeps the atomic block ATOMIC_REQUESTS would have given it.
+Only opt in views whose safe methods really are read-only.
+"""
+
+from contextlib import ExitStack, contextmanager
+from functools import wraps
+
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS, connections, transaction
+from rest_framework.permissions import SAFE_METHODS
+
+
+def _atomic_request_aliases() -> list[str]:
+    return [alias for alias, db in settings.DATABASES.items() if db.get('ATOMIC_REQUESTS')]
+
+
+@contextmanager
+def read_only_atomic(using: str = DEFAULT_DB_ALIAS):
+    """An atomic block in which writes raise; it always rolls back."""
+    with transaction.atomic(using=using):
+        with connections[using].cursor() as cursor:
+            cursor.execute('SET LOCAL transaction_read_only = on')
+        yield
+        transaction.set_rollback(True, using=using)
+
+
+def read_only_safe_methods(view):
+    """Decorate a view callable (e.g. the result of @api_view) as described in the module docstring."""
+    aliases = _atomic_request_aliases()
+
+    @wraps(view)
+    def wrapped(request, *args, **kwargs):
+        with ExitStack() as stack:
+            if request.method not in SAFE_METHODS:
+                for alias in aliases:
+                    stack.enter_context(transaction.atomic(using=alias))
+            elif settings.READ_ONLY_REQUEST_MODE == 'read_only':
+                for alias in aliases:
+                    stack.enter_context(read_only_atomic(alias))
+            return view(request, *args, **kwargs)
+
+    wrapped._non_atomic_requests = set(aliases)
+    return wrapped
+
+
+class ReadOnlySafeMethodsMixin:
+    """Apply `read_only_safe_methods` to a DRF view or viewset."""
+
+    @classmethod
+    def as_view(cls, *args, **kwargs):
+        return read_only_safe_methods(super().as_view(*args, **kwargs))
@@ -1,10 +1,11 @@
 from django.urls import path, re_path
-from .views import health_check
+from .views import health_check, request_metrics
 from .media_views import protected_media
 
 app_name = 'core'
 
 urlpatterns = [
     path('health/', health_check, name='health_check'),
+    path('metrics/requests/', request_metrics, name='request-metrics'),
     re_path(r'^media/(?P<path>.+)$', protected_media, name='protected-media'),
 ]
@@ -1,8 +1,17 @@
 from rest_framework.decorators import api_view, permission_classes
 from rest_framework.permissions import AllowAny
 from rest_framework.response import Response
+from django.conf import settings
 from django.db import connections
 from django.db.utils import OperationalError
+from django.http import Http404, HttpResponse
+from django.utils.crypto import constant_time_compare
+import os
+
+from apps.core.prometheus import render_metrics
+
+from apps.core.instrumentation import metrics_snapshot
+from apps.users.permissions import IsAdminUser
 
 
 @api_view(['GET'])
@@ -26,3 +35,31 @@ def health_check(request):
         return Response(status, status=503)
     
     return Response(status)
+
+
+@api_view(['GET'])
+@permission_classes([IsAdminUser])
+def request_metrics(request):
+    """
+    Per-endpoint SQL/cache/latency aggregates for the caller's tenant, collected
+    by RequestInstrumentationMiddleware in this worker process since it started.
+    """
+    tenant = getattr(request, 'tenant', None)
+    return Response({
+        'pid': os.getpid(),
+        'endpoints': metrics_snapshot(schema=getattr(tenant, 'schema_name', 'public')),
+    })
+
+
+def prometheus_metrics(request):
+    """
+    Prometheus scrape endpoint. Requires `Authorization: Bearer <METRICS_TOKEN>`
+    when METRICS_TOKEN is set; without a token it is only served in DEBUG.
+    """
+    token = settings.METRICS_TOKEN
+    if not token and not settings.DEBUG:
+        raise Http404()
+    if token and not constant_time_compare(request.headers.get('Authorization', ''), f'Bearer {token}'):
+        return HttpResponse('Unauthorized', status=401, content_type='text/plain')
+    payload, content_type = render_metrics()
+    return HttpResponse(payload, content_type=content_type)
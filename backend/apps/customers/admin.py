@@ -3,6 +3,7 @@ from django.contrib import admin
 from apps.platform.admin_site import platform_admin_site
 
 from .models import Client, Domain, Plan, TenantSubscription
+from .services.plans import invalidate_client_entitlements, invalidate_plan_entitlements
 
 
 class ClientAdmin(admin.ModelAdmin):
@@ -27,11 +28,23 @@ class PlanAdmin(admin.ModelAdmin):
         'calendar_enabled',
     )
 
+    def save_model(self, request, obj, form, change):
+        super().save_model(request, obj, form, change)
+        invalidate_plan_entitlements(obj)
+
 
 class TenantSubscriptionAdmin(admin.ModelAdmin):
     list_display = ('client', 'plan', 'status', 'expires_at', 'started_at')
     list_filter = ('status', 'plan')
 
+    def save_model(self, request, obj, form, change):
+        super().save_model(request, obj, form, change)
+        invalidate_client_entitlements(obj.client_id)
+
+    def delete_model(self, request, obj):
+        super().delete_model(request, obj)
+        invalidate_client_entitlements(obj.client_id)
+
 
 platform_admin_site.register(Client, ClientAdmin)
 platform_admin_site.register(Domain, DomainAdmin)
@@ -0,0 +1,38 @@
+import statistics
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.test.utils import override_settings
+from django_tenants.utils import get_tenant_model
+
+from apps.customers.services.template_schema import refresh_template_schema
+
+
+class Command(BaseCommand):
+    help = (
+        'Compare creating tenant schemas by running migrations vs cloning the template schema. '
+        'The benchmark tenants are dropped afterwards.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--runs', type=int, default=3, help='Tenants created per mode.')
+
+    def handle(self, *args, **options):
+        refresh_template_schema()
+        Client = get_tenant_model()
+        for mode, use_template in (('migrate', False), ('template clone', True)):
+            timings = []
+            with override_settings(TENANT_TEMPLATE_PROVISIONING=use_template):
+                for run in range(options['runs']):
+                    schema_name = f'provision_bench_{run}'
+                    client = Client(schema_name=schema_name, name=schema_name, slug=schema_name.replace('_', '-'))
+                    started = time.perf_counter()
+                    client.save(verbosity=0)
+                    timings.append(time.perf_counter() - started)
+                    client.delete(force_drop=True)
+            self.stdout.write(
+                f'{mode:>15}: median {statistics.median(timings) * 1000:.0f}ms, '
+                f'max {max(timings) * 1000:.0f}ms over {len(timings)} tenant(s)'
+            )
+        self.stdout.write(f'Template schema: {settings.TENANT_TEMPLATE_SCHEMA}')
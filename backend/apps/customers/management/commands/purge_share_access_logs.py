@@ -0,0 +1,11 @@
+from django.core.management.base import BaseCommand
+
+from apps.customers.services.share_access import purge_expired_share_access_logs
+
+
+class Command(BaseCommand):
+    help = 'Purge raw share link access logs past PUBLIC_SHARE_RAW_LOG_RETENTION_DAYS (run daily from cron).'
+
+    def handle(self, *args, **options):
+        purged = purge_expired_share_access_logs()
+        self.stdout.write(self.style.SUCCESS(f'Purged {purged} raw access log(s).'))
@@ -0,0 +1,12 @@
+from django.core.management.base import BaseCommand
+
+from apps.customers.services.template_schema import refresh_template_schema, template_schema_name
+
+
+class Command(BaseCommand):
+    help = 'Create or migrate the template schema new tenants are cloned from. Run after migrate_schemas.'
+
+    def handle(self, *args, **options):
+        changed = refresh_template_schema(verbosity=max(options['verbosity'] - 1, 0))
+        state = 'migrated' if changed else 'already current'
+        self.stdout.write(self.style.SUCCESS(f'Tenant template schema "{template_schema_name()}" {state}.'))
@@ -1,16 +1,13 @@
-from django.core.management.base import BaseCommand
-from django_tenants.utils import get_tenant_model
+from apps.core.tenant_jobs import TenantJobCommand
 
-from apps.customers.services.login_accounts import resync_client_login_accounts
 
-class Command(BaseCommand):
+class Command(TenantJobCommand):
     help = 'Rebuild public-schema tenant login account index from all tenant users.'
 
-    def handle(self, *args, **options):
-        Client = get_tenant_model()
-        total = 0
-
-        for client in Client.objects.exclude(schema_name='public'):
-            total += resync_client_login_accounts(client)
+    def describe_result(self, result) -> str:
+        return f'synced {result} login account(s)'
 
+    def handle(self, *args, **options):
+        results = self.run_job('sync_login_accounts', job_name='sync_login_accounts', options=options)
+        total = sum(result.result for result in results)
         self.stdout.write(self.style.SUCCESS(f'Synced {total} login account(s).'))
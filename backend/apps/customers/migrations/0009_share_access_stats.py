@@ -0,0 +1,53 @@
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('customers', '0008_enable_github_on_premium_plan'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='publicdocshareaccesslog',
+            name='accessed_at',
+            field=models.DateTimeField(default=django.utils.timezone.now),
+        ),
+        migrations.AlterField(
+            model_name='publicwhiteboardshareaccesslog',
+            name='accessed_at',
+            field=models.DateTimeField(default=django.utils.timezone.now),
+        ),
+        migrations.AddIndex(
+            model_name='publicdocshareaccesslog',
+            index=models.Index(fields=['accessed_at'], name='customers_doc_log_accessed_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='publicwhiteboardshareaccesslog',
+            index=models.Index(fields=['accessed_at'], name='customers_wb_log_accessed_idx'),
+        ),
+        migrations.CreateModel(
+            name='PublicShareAccessStat',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('kind', models.CharField(choices=[('doc', 'Doc'), ('whiteboard', 'Whiteboard')], max_length=16)),
+                ('token', models.UUIDField()),
+                ('tenant_schema', models.CharField(max_length=63)),
+                ('hour', models.DateTimeField()),
+                ('views', models.PositiveIntegerField(default=0)),
+                ('unique_ips', models.PositiveIntegerField(default=0)),
+                ('ip_sketch', models.BinaryField(default=bytes, help_text='HyperLogLog registers used to estimate unique_ips across flushes.')),
+            ],
+            options={
+                'db_table': 'customers_public_share_access_stat',
+                'ordering': ['-hour'],
+                'constraints': [
+                    models.UniqueConstraint(fields=('kind', 'token', 'hour'), name='customers_share_stat_kind_token_hour_uniq'),
+                ],
+                'indexes': [
+                    models.Index(fields=['tenant_schema', 'hour'], name='customers_sharestat_tenant_idx'),
+                ],
+            },
+        ),
+    ]
@@ -0,0 +1,19 @@
+import django.db.models.functions.text
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('customers', '0009_share_access_stats'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='tenantloginaccount',
+            index=models.Index(
+                django.db.models.functions.text.Lower('username'),
+                name='customers_login_lower_idx',
+            ),
+        ),
+    ]
@@ -1,6 +1,7 @@
 from decimal import Decimal
 
 from django.db import models
+from django.db.models.functions import Lower
 from django.utils import timezone
 from django_tenants.models import DomainMixin, TenantMixin
 
@@ -28,6 +29,16 @@ class Client(TenantMixin):
     def __str__(self) -> str:
         return self.name or self.schema_name
 
+    def create_schema(self, check_if_exists=False, sync_schema=True, verbosity=1):
+        from django_tenants.utils import schema_exists
+
+        from apps.customers.services.template_schema import clone_from_template
+
+        if sync_schema and not (check_if_exists and schema_exists(self.schema_name)):
+            if clone_from_template(self.schema_name):
+                return True
+        return super().create_schema(check_if_exists=check_if_exists, sync_schema=sync_schema, verbosity=verbosity)
+
 
 class Domain(DomainMixin):
     class Meta:
@@ -53,6 +64,9 @@ class TenantLoginAccount(models.Model):
                 name='customers_login_account_client_user_uniq',
             ),
         ]
+        indexes = [
+            models.Index(Lower('username'), name='customers_login_lower_idx'),
+        ]
 
     def __str__(self) -> str:
         return f'{self.username} → {self.client.schema_name}'
@@ -82,11 +96,14 @@ class PublicDocShareAccessLog(models.Model):
         related_name='access_logs',
     )
     ip_address = models.GenericIPAddressField(null=True, blank=True)
-    accessed_at = models.DateTimeField(auto_now_add=True)
+    accessed_at = models.DateTimeField(default=timezone.now)
 
     class Meta:
         db_table = 'customers_public_doc_share_access_log'
         ordering = ['-accessed_at']
+        indexes = [
+            models.Index(fields=['accessed_at'], name='customers_doc_log_accessed_idx'),
+        ]
 
 
 class PublicWhiteboardShareIndex(models.Model):
@@ -113,11 +130,50 @@ class PublicWhiteboardShareAccessLog(models.Model):
         related_name='access_logs',
     )
     ip_address = models.GenericIPAddressField(null=True, blank=True)
-    accessed_at = models.DateTimeField(auto_now_add=True)
+    accessed_at = models.DateTimeField(default=timezone.now)
 
     class Meta:
         db_table = 'customers_public_whiteboard_share_access_log'
         ordering = ['-accessed_at']
+        indexes = [
+            models.Index(fields=['accessed_at'], name='customers_wb_log_accessed_idx'),
+        ]
+
+
+class ShareKind(models.TextChoices):
+    DOC = 'doc', 'Doc'
+    WHITEBOARD = 'whiteboard', 'Whiteboard'
+
+
+class PublicShareAccessStat(models.Model):
+    """Hourly roll-up of anonymous views for one doc or whiteboard share link."""
+
+    kind = models.CharField(max_length=16, choices=ShareKind.choices)
+    token = models.UUIDField()
+    tenant_schema = models.CharField(max_length=63)
+    hour = models.DateTimeField()
+    views = models.PositiveIntegerField(default=0)
+    unique_ips = models.PositiveIntegerField(default=0)
+    ip_sketch = models.BinaryField(
+        default=bytes,
+        help_text='HyperLogLog registers used to estimate unique_ips across flushes.',
+    )
+
+    class Meta:
+        db_table = 'customers_public_share_access_stat'
+        ordering = ['-hour']
+        constraints = [
+            models.UniqueConstraint(
+                fields=['kind', 'token', 'hour'],
+                name='customers_share_stat_kind_token_hour_uniq',
+            ),
+        ]
+        indexes = [
+            models.Index(fields=['tenant_schema', 'hour'], name='customers_sharestat_tenant_idx'),
+        ]
+
+    def __str__(self) -> str:
+        return f'{self.kind}:{self.token} @ {self.hour:%Y-%m-%d %H:00} ({self.views})'
 
 
 class PlanTier(models.TextChoices):
@@ -62,8 +62,8 @@ class ClientListSerializer(serializers.ModelSerializer):
         ]
 
     def get_primary_domain(self, obj: Client) -> str | None:
-        domain = obj.domains.filter(is_primary=True).first()
-        return domain.domain if domain else None
+        # Iterate rather than filter() so the list view's prefetch_related('domains') is used.
+        return next((domain.domain for domain in obj.domains.all() if domain.is_primary), None)
 
 
 class ClientDetailSerializer(ClientListSerializer):
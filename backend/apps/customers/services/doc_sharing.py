@@ -1,11 +1,15 @@
+import hashlib
 import uuid
 from datetime import datetime
 
+from django.core.cache import cache
 from django.db import transaction
 from django.utils import timezone
 from django_tenants.utils import get_public_schema_name, schema_context
 
-from apps.customers.models import PublicDocShareAccessLog, PublicDocShareIndex
+from apps.core.cache import bump_namespace, versioned_key
+from apps.customers.models import PublicDocShareIndex, ShareKind
+from apps.customers.services.share_access import record_share_access
 from apps.workspace_docs.models import DocShareLink, WorkspaceDoc
 
 
@@ -50,8 +54,61 @@ def resolve_public_share(token: uuid.UUID):
 
 
 def log_public_share_access(index: PublicDocShareIndex, ip_address: str | None) -> None:
-    with schema_context(get_public_schema_name()):
-        PublicDocShareAccessLog.objects.create(
-            share_index=index,
-            ip_address=ip_address,
-        )
+    record_share_access(
+        kind=ShareKind.DOC,
+        token=index.token,
+        tenant_schema=index.tenant_schema,
+        ip_address=ip_address,
+    )
+
+
+# Rendered public docs are cached in two layers so repeat views skip the tenant schema:
+#   - a per-doc pointer to the doc's current updated_at
+#   - the rendered payload keyed by (doc_id, updated_at), which never goes stale
+# The pointer key is versioned per doc and edits bump that version, so a reader
+# that loaded the doc before an edit committed can only write an orphaned pointer.
+PUBLIC_DOC_RENDER_TTL = 60 * 60 * 24
+
+
+def _public_doc_pointer_namespace(tenant_schema: str, doc_id) -> str:
+    return f'public_doc:current:{tenant_schema}:{doc_id}'
+
+
+def _public_doc_render_key(tenant_schema: str, doc_id, version: str) -> str:
+    return f'public_doc:render:{tenant_schema}:{doc_id}:{version}'
+
+
+def public_doc_version(doc: WorkspaceDoc) -> str:
+    return doc.updated_at.isoformat()
+
+
+def public_doc_etag(doc_id, version: str) -> str:
+    digest = hashlib.sha1(f'{doc_id}:{version}'.encode()).hexdigest()[:20]
+    return f'"{digest}"'
+
+
+def public_doc_pointer_key(index: PublicDocShareIndex) -> str:
+    """Resolve once per request, before reading the doc, and pass to the calls below."""
+    return versioned_key(_public_doc_pointer_namespace(index.tenant_schema, index.doc_id), 'version')
+
+
+def cached_public_doc_version(pointer_key: str) -> str | None:
+    return cache.get(pointer_key)
+
+
+def get_cached_public_doc(index: PublicDocShareIndex, version: str) -> dict | None:
+    return cache.get(_public_doc_render_key(index.tenant_schema, index.doc_id, version))
+
+
+def cache_public_doc(index: PublicDocShareIndex, pointer_key: str, version: str, payload: dict) -> None:
+    cache.set(
+        _public_doc_render_key(index.tenant_schema, index.doc_id, version),
+        payload,
+        PUBLIC_DOC_RENDER_TTL,
+    )
+    cache.set(pointer_key, version, PUBLIC_DOC_RENDER_TTL)
+
+
+def invalidate_public_doc_cache(*, tenant_schema: str, doc_id) -> None:
+    """Call after a doc is edited or archived so shared views revalidate."""
+    bump_namespace(_public_doc_pointer_namespace(tenant_schema, doc_id))
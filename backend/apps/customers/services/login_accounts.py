@@ -2,6 +2,8 @@ from __future__ import annotations
 
 import re
 
+from django.db import connection, transaction
+from django.db.models.functions import Lower
 from django_tenants.utils import get_public_schema_name, schema_context
 
 from apps.customers.models import Client, TenantLoginAccount
@@ -59,7 +61,8 @@ def resolve_login_account(login_identifier: str) -> TenantLoginAccount | None:
     with schema_context(get_public_schema_name()):
         return (
             TenantLoginAccount.objects.select_related('client')
-            .filter(username__iexact=key, client__is_active=True)
+            .alias(username_lower=Lower('username'))
+            .filter(username_lower=key, client__is_active=True)
             .first()
         )
 
@@ -74,7 +77,11 @@ def register_login_account(*, client: Client, user: User) -> TenantLoginAccount:
     )
 
     with schema_context(get_public_schema_name()):
-        existing = TenantLoginAccount.objects.filter(username__iexact=login_id).first()
+        existing = (
+            TenantLoginAccount.objects.alias(username_lower=Lower('username'))
+            .filter(username_lower=login_id.lower())
+            .first()
+        )
         if existing is not None and (
             existing.client_id != client.pk or existing.tenant_user_id != user.pk
         ):
@@ -118,21 +125,87 @@ def sync_login_account_username(*, client: Client, user: User, previous_username
     register_login_account(client=client, user=user)
 
 
-def resync_client_login_accounts(client: Client) -> int:
-    """Rebuild all public login ids for a tenant (e.g. after login_domain change)."""
+def _login_accounts_for(client: Client) -> list[TenantLoginAccount]:
     with schema_context(client.schema_name):
-        users = list(User.objects.all())
+        users = list(User.objects.values_list('pk', 'username'))
+    return [
+        TenantLoginAccount(
+            client=client,
+            tenant_user_id=pk,
+            username=build_login_identifier(local_username=username, login_domain=client.login_domain),
+        )
+        for pk, username in users
+    ]
+
+
+def _assert_login_ids_available(*, client: Client, login_ids: list[str]) -> None:
+    """One query for every login id another tenant already holds (case-insensitive)."""
+    from apps.customers.services.tenants import TenantProvisionError
 
     with schema_context(get_public_schema_name()):
+        taken = list(
+            TenantLoginAccount.objects.alias(username_lower=Lower('username'))
+            .filter(username_lower__in=[login_id.lower() for login_id in login_ids])
+            .exclude(client=client)
+            .values_list('username', flat=True)[:5]
+        )
+    if taken:
+        raise TenantProvisionError(
+            f'Login address already taken on the platform: {", ".join(sorted(taken))}.',
+            status_code=400,
+        )
+
+
+def resync_client_login_accounts(client: Client) -> int:
+    """
+    Rebuild all public login ids for a tenant (e.g. after login_domain change).
+
+    Set-based: one read of the tenant's users, one conflict query, then the
+    client's accounts are replaced with a single bulk insert. Nothing changes
+    if any new login id is already taken by another tenant.
+    """
+    accounts = _login_accounts_for(client)
+    _assert_login_ids_available(client=client, login_ids=[account.username for account in accounts])
+
+    with schema_context(get_public_schema_name()), transaction.atomic():
         TenantLoginAccount.objects.filter(client=client).delete()
+        TenantLoginAccount.objects.bulk_create(accounts, batch_size=1000)
+
+    return len(accounts)
 
-    for user in users:
-        register_login_account(client=client, user=user)
 
-    return len(users)
+def schedule_login_account_resync(client: Client) -> None:
+    """
+    Rebuild the client's login ids in a Celery worker once the current
+    transaction commits. Conflicts are still checked here, so the caller can
+    reject the change; without a broker the task runs inline at commit.
+    """
+    from apps.customers.tasks import resync_client_login_accounts_task
+
+    _assert_login_ids_available(
+        client=client,
+        login_ids=[account.username for account in _login_accounts_for(client)],
+    )
+    client_id = client.pk
+    # robust: the domain change has already committed, so a failed enqueue (or an
+    # eager run that exhausted its retries) is logged instead of failing the request.
+    transaction.on_commit(lambda: resync_client_login_accounts_task.delay(client_id), robust=True)
+
+
+def resync_current_tenant_login_accounts() -> int:
+    """resync_client_login_accounts for the tenant whose schema is active (tenant job)."""
+    schema_name = connection.schema_name
+    with schema_context(get_public_schema_name()):
+        client = Client.objects.get(schema_name=schema_name)
+    return resync_client_login_accounts(client)
+
 
+def update_client_login_domain(*, client: Client, login_domain: str, background: bool = False) -> Client:
+    """
+    Change the tenant's login postfix and rebuild its login ids.
 
-def update_client_login_domain(*, client: Client, login_domain: str) -> Client:
+    With `background`, the rebuild is left to `schedule_login_account_resync`.
+    """
     normalized = normalize_login_domain(login_domain)
     assert_login_domain_available(login_domain=normalized, exclude_client_id=client.pk)
 
@@ -142,5 +215,8 @@ def update_client_login_domain(*, client: Client, login_domain: str) -> Client:
         current.save(update_fields=['login_domain', 'updated_at'])
         client = current
 
-    resync_client_login_accounts(client)
+    if background:
+        schedule_login_account_resync(client)
+    else:
+        resync_client_login_accounts(client)
     return client
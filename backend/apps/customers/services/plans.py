@@ -3,6 +3,8 @@ from __future__ import annotations
 from datetime import datetime
 from decimal import Decimal
 
+from django.core.cache import cache
+from django.db import transaction
 from django.utils import timezone
 from django.utils.text import slugify
 from rest_framework.exceptions import PermissionDenied
@@ -45,6 +47,7 @@ def ensure_default_plans() -> tuple[Plan, Plan]:
     created: list[Plan] = []
     for spec in DEFAULT_PLANS:
         plan, _ = Plan.objects.update_or_create(name=spec['name'], defaults=spec)
+        invalidate_plan_entitlements(plan)
         created.append(plan)
     return created[0], created[1]
 
@@ -64,27 +67,109 @@ def get_client_plan(client: Client) -> Plan:
         return sub.plan
 
 
-def sync_subscription_status(client: Client) -> None:
+# Plan features, limits and subscription expiry per client, so feature gates and
+# login don't hit the public schema on every request. Entries are dropped by
+# assign_plan_to_client, sync_subscription_status and plan edits; the TTL only bounds
+# edits made outside those paths (e.g. a shell).
+ENTITLEMENTS_TTL = 60 * 10
+
+PLAN_ENTITLEMENT_FIELDS = (
+    'max_users',
+    'max_projects',
+    'attendance_enabled',
+    'calendar_enabled',
+    'email_notifications_enabled',
+    'github_integration_enabled',
+)
+
+
+def _entitlements_key(client_id) -> str:
+    return f'plan_entitlements:{client_id}'
+
+
+def _build_entitlements(sub: TenantSubscription | None) -> dict:
+    if sub is None:
+        return {'subscribed': False}
+    data = {
+        'subscribed': True,
+        'plan_id': sub.plan_id,
+        'plan_name': sub.plan.name,
+        'status': sub.status,
+        'expires_at': sub.expires_at,
+    }
+    data.update({field: getattr(sub.plan, field) for field in PLAN_ENTITLEMENT_FIELDS})
+    return data
+
+
+def get_client_entitlements(client: Client) -> dict:
+    """
+    Cached plan features and subscription state for `client`.
+
+    `{'subscribed': False}` when the client has no subscription. Expiry is not
+    decided here; check it with `entitlements_expired`, which runs in memory.
+    """
     from django_tenants.utils import get_public_schema_name, schema_context
 
-    with schema_context(get_public_schema_name()):
-        try:
-            sub = TenantSubscription.objects.get(client=client)
-        except TenantSubscription.DoesNotExist:
-            return
+    key = _entitlements_key(client.pk)
+    entitlements = cache.get(key)
+    if entitlements is None:
+        with schema_context(get_public_schema_name()):
+            sub = TenantSubscription.objects.select_related('plan').filter(client=client).first()
+        entitlements = _build_entitlements(sub)
+        cache.set(key, entitlements, ENTITLEMENTS_TTL)
+    return entitlements
+
+
+def entitlements_expired(entitlements: dict) -> bool:
+    """Same rule as TenantSubscription.is_effectively_expired; False when unsubscribed."""
+    if not entitlements['subscribed']:
+        return False
+    if entitlements['status'] in {SubscriptionStatus.EXPIRED, SubscriptionStatus.CANCELLED}:
+        return True
+    expires_at = entitlements['expires_at']
+    return expires_at is not None and expires_at < timezone.now()
 
-        if (
-            sub.status == SubscriptionStatus.ACTIVE
-            and sub.expires_at is not None
-            and sub.expires_at < timezone.now()
-        ):
-            sub.status = SubscriptionStatus.EXPIRED
-            sub.save(update_fields=['status', 'updated_at'])
+
+def invalidate_client_entitlements(*client_ids) -> None:
+    """Drop cached entitlements once the current transaction commits, so nothing re-caches the old row."""
+    keys = [_entitlements_key(client_id) for client_id in client_ids]
+    transaction.on_commit(lambda: cache.delete_many(keys))
+
+
+def invalidate_plan_entitlements(plan: Plan) -> None:
+    """Call after a plan is edited so every client on it picks up the change."""
+    client_ids = TenantSubscription.objects.filter(plan=plan).values_list('client_id', flat=True)
+    invalidate_client_entitlements(*client_ids)
+
+
+def get_active_entitlements(client: Client) -> dict:
+    """Entitlements of a current subscription; raises SubscriptionExpiredError otherwise."""
+    entitlements = get_client_entitlements(client)
+    if not entitlements['subscribed']:
+        raise SubscriptionExpiredError('No subscription found. Please contact support.')
+    if entitlements_expired(entitlements):
+        raise SubscriptionExpiredError()
+    return entitlements
+
+
+def sync_subscription_status(client: Client) -> bool:
+    """Mark an active subscription past its expiry date as expired. Returns True if it changed."""
+    from django_tenants.utils import get_public_schema_name, schema_context
+
+    with schema_context(get_public_schema_name()):
+        updated = TenantSubscription.objects.filter(
+            client=client,
+            status=SubscriptionStatus.ACTIVE,
+            expires_at__lt=timezone.now(),
+        ).update(status=SubscriptionStatus.EXPIRED, updated_at=timezone.now())
+    if updated:
+        invalidate_client_entitlements(client.pk)
+    return bool(updated)
 
 
 def requires_feature(client: Client, feature: str) -> None:
-    plan = get_client_plan(client)
-    if not getattr(plan, feature, False):
+    entitlements = get_active_entitlements(client)
+    if not entitlements.get(feature, False):
         raise PermissionDenied('Your plan does not include this feature.')
 
 
@@ -113,20 +198,50 @@ def assign_plan_to_client(
             'notes': notes,
         },
     )
+    invalidate_client_entitlements(client.pk)
     return sub
 
 
-def get_client_plan_usage(client: Client) -> dict[str, int]:
-    from django_tenants.utils import schema_context
+def get_plan_usage_by_schema(clients) -> dict[str, dict[str, int]]:
+    """
+    User and project counts for many tenants in one round trip.
+
+    Builds a single UNION ALL over each tenant schema's tables instead of
+    switching search_path per tenant; schemas that do not exist report zeros.
+    """
+    from django.db import connection
+
+    from apps.projects.models import Project
+    from apps.users.models import User
+
+    schema_names = [client.schema_name for client in clients]
+    usage = {schema: {'users': 0, 'projects': 0} for schema in schema_names}
+    if not schema_names:
+        return usage
+
+    quote = connection.ops.quote_name
+    users_table = quote(User._meta.db_table)
+    projects_table = quote(Project._meta.db_table)
+    with connection.cursor() as cursor:
+        cursor.execute('SELECT nspname FROM pg_namespace WHERE nspname = ANY(%s)', [schema_names])
+        existing = [row[0] for row in cursor.fetchall()]
+        if not existing:
+            return usage
+        cursor.execute(
+            ' UNION ALL '.join(
+                f'SELECT %s, (SELECT count(*) FROM {quote(schema)}.{users_table}), '
+                f'(SELECT count(*) FROM {quote(schema)}.{projects_table})'
+                for schema in existing
+            ),
+            existing,
+        )
+        for schema, users, projects in cursor.fetchall():
+            usage[schema] = {'users': users, 'projects': projects}
+    return usage
 
-    with schema_context(client.schema_name):
-        from apps.projects.models import Project
-        from apps.users.models import User
 
-        return {
-            'users': User.objects.count(),
-            'projects': Project.objects.count(),
-        }
+def get_client_plan_usage(client: Client) -> dict[str, int]:
+    return get_plan_usage_by_schema([client])[client.schema_name]
 
 
 def resolve_unique_slug(*, name: str, slug: str | None = None) -> str:
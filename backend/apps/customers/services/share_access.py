@@ -0,0 +1,182 @@
+"""
+Buffered access logging for anonymous doc/whiteboard share links.
+
+Views are collected in process memory and flushed in batches into hourly
+PublicShareAccessStat rows (view count + HyperLogLog sketch of client IPs).
+A flush runs after the recording request's transaction commits, so the stat
+row locks are never held for the rest of a request. Raw per-view rows are
+only written when PUBLIC_SHARE_RAW_ACCESS_LOGS is on, and are purged after
+PUBLIC_SHARE_RAW_LOG_RETENTION_DAYS by the purge_share_access_logs command.
+"""
+
+from __future__ import annotations
+
+import atexit
+import hashlib
+import logging
+import math
+import threading
+import time
+import uuid
+from collections import defaultdict
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+
+from django.conf import settings
+from django.db import transaction
+from django.utils import timezone
+from django_tenants.utils import get_public_schema_name, schema_context
+
+from apps.customers.models import (
+    PublicDocShareAccessLog,
+    PublicShareAccessStat,
+    PublicWhiteboardShareAccessLog,
+    ShareKind,
+)
+
+logger = logging.getLogger(__name__)
+
+# 2**10 one-byte registers: ~1 KB per share-hour, ~3% standard error.
+HLL_PRECISION = 10
+HLL_REGISTERS = 1 << HLL_PRECISION
+
+_RAW_LOG_MODELS = {
+    ShareKind.DOC: PublicDocShareAccessLog,
+    ShareKind.WHITEBOARD: PublicWhiteboardShareAccessLog,
+}
+
+
+def hll_add(registers: bytearray, value: str) -> None:
+    x = int.from_bytes(hashlib.sha1(value.encode()).digest()[:8], 'big')
+    index = x >> (64 - HLL_PRECISION)
+    rest = x & ((1 << (64 - HLL_PRECISION)) - 1)
+    rank = (64 - HLL_PRECISION) - rest.bit_length() + 1
+    if rank > registers[index]:
+        registers[index] = rank
+
+
+def hll_merge(registers: bytearray, other: bytes) -> None:
+    if len(other) != HLL_REGISTERS:
+        return
+    for i, rank in enumerate(other):
+        if rank > registers[i]:
+            registers[i] = rank
+
+
+def hll_count(registers: bytes) -> int:
+    m = HLL_REGISTERS
+    alpha = 0.7213 / (1 + 1.079 / m)
+    estimate = alpha * m * m / sum(2.0 ** -rank for rank in registers)
+    zeros = registers.count(0)
+    if estimate <= 2.5 * m and zeros:
+        estimate = m * math.log(m / zeros)
+    return int(round(estimate))
+
+
+@dataclass
+class _ShareAccessBuffer:
+    events: list[tuple[str, uuid.UUID, str, str | None, datetime]] = field(default_factory=list)
+    started_at: float = 0.0
+    lock: threading.Lock = field(default_factory=threading.Lock)
+
+
+_buffer = _ShareAccessBuffer()
+
+
+def record_share_access(*, kind: str, token: uuid.UUID, tenant_schema: str, ip_address: str | None) -> None:
+    """Queue one anonymous view; flushes on commit once the buffer is big or old enough."""
+    with _buffer.lock:
+        if not _buffer.events:
+            _buffer.started_at = time.monotonic()
+        _buffer.events.append((kind, token, tenant_schema, ip_address, timezone.now()))
+        due = (
+            len(_buffer.events) >= settings.PUBLIC_SHARE_ACCESS_FLUSH_SIZE
+            or time.monotonic() - _buffer.started_at >= settings.PUBLIC_SHARE_ACCESS_FLUSH_SECONDS
+        )
+    if due:
+        transaction.on_commit(flush_share_access_buffer)
+
+
+def flush_share_access_buffer() -> int:
+    """Write buffered views into the hourly counters. Returns the number of events flushed."""
+    with _buffer.lock:
+        events, _buffer.events = _buffer.events, []
+    if not events:
+        return 0
+
+    try:
+        with schema_context(get_public_schema_name()), transaction.atomic():
+            _write_hourly_stats(events)
+            if settings.PUBLIC_SHARE_RAW_ACCESS_LOGS:
+                _write_raw_logs(events)
+    except Exception:
+        # Access stats are best-effort; never fail a public page view over them.
+        logger.exception('Failed to flush %d share access events', len(events))
+        return 0
+    return len(events)
+
+
+def _write_hourly_stats(events) -> None:
+    grouped: dict[tuple[str, uuid.UUID, datetime], dict] = defaultdict(
+        lambda: {'views': 0, 'ips': set(), 'tenant_schema': ''},
+    )
+    for kind, token, tenant_schema, ip_address, accessed_at in events:
+        bucket = grouped[(kind, token, accessed_at.replace(minute=0, second=0, microsecond=0))]
+        bucket['views'] += 1
+        bucket['tenant_schema'] = tenant_schema
+        if ip_address:
+            bucket['ips'].add(ip_address)
+
+    PublicShareAccessStat.objects.bulk_create(
+        [
+            PublicShareAccessStat(kind=kind, token=token, hour=hour, tenant_schema=bucket['tenant_schema'])
+            for (kind, token, hour), bucket in grouped.items()
+        ],
+        ignore_conflicts=True,
+    )
+    rows = (
+        PublicShareAccessStat.objects.select_for_update()
+        .filter(
+            token__in={token for _, token, _ in grouped},
+            hour__in={hour for _, _, hour in grouped},
+        )
+        .order_by('id')
+    )
+    updated = []
+    for row in rows:
+        bucket = grouped.get((row.kind, row.token, row.hour))
+        if bucket is None:
+            continue
+        registers = bytearray(bytes(row.ip_sketch) or bytes(HLL_REGISTERS))
+        for ip_address in bucket['ips']:
+            hll_add(registers, ip_address)
+        row.views += bucket['views']
+        row.ip_sketch = bytes(registers)
+        row.unique_ips = hll_count(registers)
+        updated.append(row)
+    PublicShareAccessStat.objects.bulk_update(updated, ['views', 'ip_sketch', 'unique_ips'])
+
+
+def _write_raw_logs(events) -> None:
+    rows_by_model = defaultdict(list)
+    for kind, token, _, ip_address, accessed_at in events:
+        model = _RAW_LOG_MODELS[kind]
+        rows_by_model[model].append(
+            model(share_index_id=token, ip_address=ip_address, accessed_at=accessed_at),
+        )
+    for model, rows in rows_by_model.items():
+        model.objects.bulk_create(rows, batch_size=500)
+
+
+def purge_expired_share_access_logs() -> int:
+    """Delete raw access rows older than the retention window. Returns rows deleted."""
+    cutoff = timezone.now() - timedelta(days=settings.PUBLIC_SHARE_RAW_LOG_RETENTION_DAYS)
+    deleted = 0
+    with schema_context(get_public_schema_name()):
+        for model in _RAW_LOG_MODELS.values():
+            count, _ = model.objects.filter(accessed_at__lt=cutoff).delete()
+            deleted += count
+    return deleted
+
+
+atexit.register(flush_share_access_buffer)
@@ -0,0 +1,100 @@
+"""
+Provision tenant schemas by cloning a pre-migrated template schema.
+
+Running every tenant migration for each new Client takes seconds and grows
+with every migration. Instead, `refresh_template_schema` (run after each
+deploy's migrations) keeps TENANT_TEMPLATE_SCHEMA fully migrated, and
+`clone_from_template` copies its tables, sequences and data-migration rows
+into the new schema. When the template is missing or behind the migrations
+on disk, cloning is skipped and the caller migrates from scratch instead.
+"""
+
+from __future__ import annotations
+
+import logging
+import time
+from contextlib import contextmanager
+from functools import lru_cache
+
+from django.conf import settings
+from django.core.management import call_command
+from django.db import connection
+from django.db.migrations.loader import MigrationLoader
+from django_tenants.clone import CloneSchema
+from django_tenants.utils import schema_exists
+
+logger = logging.getLogger(__name__)
+
+
+def template_schema_name() -> str:
+    return settings.TENANT_TEMPLATE_SCHEMA
+
+
+@contextmanager
+def _template_lock(*, shared: bool):
+    """Clones take a shared lock, refreshes an exclusive one, so no clone sees a half-migrated template."""
+    lock = 'pg_advisory_lock_shared' if shared else 'pg_advisory_lock'
+    unlock = 'pg_advisory_unlock_shared' if shared else 'pg_advisory_unlock'
+    with connection.cursor() as cursor:
+        cursor.execute(f'SELECT {lock}(hashtext(%s))', [template_schema_name()])
+    try:
+        yield
+    finally:
+        with connection.cursor() as cursor:
+            cursor.execute(f'SELECT {unlock}(hashtext(%s))', [template_schema_name()])
+
+
+@lru_cache(maxsize=1)
+def _migrations_on_disk() -> frozenset[tuple[str, str]]:
+    return frozenset(MigrationLoader(None, ignore_no_migrations=True).disk_migrations)
+
+
+def template_is_current() -> bool:
+    """True when the template schema exists and has every migration on disk applied."""
+    schema = template_schema_name()
+    if not schema_exists(schema):
+        return False
+    with connection.cursor() as cursor:
+        cursor.execute(f'SELECT app, name FROM {connection.ops.quote_name(schema)}.django_migrations')
+        applied = set(cursor.fetchall())
+    return _migrations_on_disk() <= applied
+
+
+def refresh_template_schema(*, verbosity: int = 0) -> bool:
+    """Create the template schema if needed and apply pending tenant migrations. Returns True if it changed."""
+    schema = template_schema_name()
+    with _template_lock(shared=False):
+        if template_is_current():
+            return False
+        if not schema_exists(schema):
+            with connection.cursor() as cursor:
+                cursor.execute(f'CREATE SCHEMA {connection.ops.quote_name(schema)}')
+        call_command('migrate_schemas', schema_name=schema, tenant=True, interactive=False, verbosity=verbosity)
+        connection.set_schema_to_public()
+    return True
+
+
+def clone_from_template(schema_name: str) -> bool:
+    """
+    Create `schema_name` as a copy of the template. Returns False (and creates
+    nothing) when template provisioning is off or the template is stale.
+    """
+    if not settings.TENANT_TEMPLATE_PROVISIONING:
+        return False
+    started = time.perf_counter()
+    with _template_lock(shared=True):
+        if not schema_exists(template_schema_name()):
+            logger.info('No tenant template schema; migrating "%s" from scratch.', schema_name)
+            return False
+        if not template_is_current():
+            logger.warning(
+                'Tenant template schema "%s" is stale; migrating "%s" from scratch. '
+                'Run `manage.py refresh_tenant_template` after migrations.',
+                template_schema_name(),
+                schema_name,
+            )
+            return False
+        CloneSchema().clone_schema(template_schema_name(), schema_name, 'DATA')
+    connection.set_schema_to_public()
+    logger.info('Cloned schema "%s" from template in %.2fs', schema_name, time.perf_counter() - started)
+    return True
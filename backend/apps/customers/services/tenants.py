@@ -14,6 +14,7 @@ from apps.customers.services.login_accounts import (
     register_login_account,
 )
 from apps.users.models import User
+from apps.users.user_state import invalidate_tenant_user_state
 
 
 class TenantProvisionError(Exception):
@@ -99,6 +100,7 @@ def deactivate_client(*, client: Client) -> Client:
 
     with schema_context(client.schema_name):
         User.objects.filter(is_active=True).update(is_active=False)
+    invalidate_tenant_user_state(client.schema_name)
 
     return client
 
@@ -109,6 +111,7 @@ def reactivate_client(*, client: Client) -> Client:
 
     with schema_context(client.schema_name):
         User.objects.update(is_active=True)
+    invalidate_tenant_user_state(client.schema_name)
 
     return client
 
@@ -136,11 +139,11 @@ def create_client_user(
     first_name: str = '',
     last_name: str = '',
 ) -> User:
-    plan = None
+    entitlements = None
     try:
-        from apps.customers.services.plans import get_client_plan
+        from apps.customers.services.plans import get_active_entitlements
 
-        plan = get_client_plan(client)
+        entitlements = get_active_entitlements(client)
     except Exception:
         pass
 
@@ -148,11 +151,11 @@ def create_client_user(
         if User.objects.filter(username=username).exists():
             raise TenantProvisionError('Username already exists.')
 
-        if plan is not None:
+        if entitlements is not None:
             usage = get_client_plan_usage(client)
-            if usage['users'] >= plan.max_users:
+            if usage['users'] >= entitlements['max_users']:
                 raise TenantProvisionError(
-                    f'Plan limit reached: maximum {plan.max_users} users.',
+                    f"Plan limit reached: maximum {entitlements['max_users']} users.",
                     status_code=403,
                 )
 
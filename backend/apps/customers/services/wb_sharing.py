@@ -4,7 +4,8 @@ from django.db import transaction
 from django.utils import timezone
 from django_tenants.utils import get_public_schema_name, schema_context
 
-from apps.customers.models import PublicWhiteboardShareAccessLog, PublicWhiteboardShareIndex
+from apps.customers.models import PublicWhiteboardShareIndex, ShareKind
+from apps.customers.services.share_access import record_share_access
 from apps.workspace_whiteboards.models import Whiteboard, WhiteboardShareLink
 
 
@@ -55,8 +56,9 @@ def resolve_public_whiteboard_share(token: uuid.UUID):
 
 
 def log_public_whiteboard_share_access(index: PublicWhiteboardShareIndex, ip_address: str | None) -> None:
-    with schema_context(get_public_schema_name()):
-        PublicWhiteboardShareAccessLog.objects.create(
-            share_index=index,
-            ip_address=ip_address,
-        )
+    record_share_access(
+        kind=ShareKind.WHITEBOARD,
+        token=index.token,
+        tenant_schema=index.tenant_schema,
+        ip_address=ip_address,
+    )
@@ -0,0 +1,25 @@
+import logging
+
+from celery import shared_task
+
+from apps.customers.models import Client
+
+logger = logging.getLogger(__name__)
+
+
+@shared_task(
+    bind=True,
+    max_retries=3,
+    default_retry_delay=15,
+    acks_late=True,
+    autoretry_for=(Exception,),
+)
+def resync_client_login_accounts_task(self, client_id: int):
+    from apps.customers.services.login_accounts import resync_client_login_accounts
+
+    try:
+        client = Client.objects.get(pk=client_id)
+    except Client.DoesNotExist:
+        logger.warning('Login account resync skipped: client %s not found', client_id)
+        return 0
+    return resync_client_login_accounts(client)
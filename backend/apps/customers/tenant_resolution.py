@@ -30,7 +30,7 @@ def is_public_api_path(path: str) -> bool:
         return True
     if path.startswith('/api/public/integrations/github/'):
         return True
-    if path in ('/api/health/', '/health/'):
+    if path in ('/api/health/', '/health/', '/metrics/'):
         return True
     return False
 
@@ -1,4 +1,8 @@
+from unittest import mock
+
+from django.db import OperationalError, connection
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
 from django_tenants.utils import get_public_schema_name, schema_context
 
 from apps.customers.models import Client, Domain, TenantLoginAccount
@@ -6,9 +10,11 @@ from apps.customers.services.login_accounts import (
     build_login_identifier,
     register_login_account,
     resolve_login_account,
+    resync_client_login_accounts,
     sync_login_account_username,
     update_client_login_domain,
 )
+from apps.customers.services.tenants import TenantProvisionError
 from apps.customers.tenant_resolution import internal_domain_for
 from apps.users.models import User
 
@@ -121,3 +127,67 @@ class SyncLoginAccountTests(TestCase):
             }
         self.assertEqual(accounts[self.user.pk], 'admin@technest.com')
         self.assertIsNotNone(resolve_login_account('admin@technest.com'))
+
+    def test_resync_query_count_does_not_grow_with_users(self):
+        def resync_queries():
+            with CaptureQueriesContext(connection) as queries:
+                resync_client_login_accounts(self.client_obj)
+            return len([q for q in queries.captured_queries if not q['sql'].startswith('SET search_path')])
+
+        baseline = resync_queries()
+        with schema_context('sync_tenant'):
+            for i in range(20):
+                User.objects.create_user(username=f'dev{i}', password='technest2026')
+        self.assertEqual(resync_queries(), baseline)
+        self.assertEqual(TenantLoginAccount.objects.filter(client=self.client_obj).count(), 21)
+
+    def test_resync_conflict_leaves_accounts_untouched(self):
+        other = Client(schema_name='other_tenant', name='Other', slug='other', login_domain='other.com', is_active=True)
+        other.save()
+        TenantLoginAccount.objects.create(client=other, tenant_user_id=99, username='admin@other.com')
+        self.client_obj.login_domain = 'other.com'
+
+        with self.assertRaises(TenantProvisionError):
+            resync_client_login_accounts(self.client_obj)
+        self.assertEqual(
+            list(TenantLoginAccount.objects.filter(client=self.client_obj).values_list('username', flat=True)),
+            ['admin@technest'],
+        )
+
+    def test_background_login_domain_change_resyncs_on_commit(self):
+        with self.captureOnCommitCallbacks(execute=True) as callbacks:
+            update_client_login_domain(client=self.client_obj, login_domain='technest.io', background=True)
+            self.assertIsNotNone(resolve_login_account('admin@technest'))
+
+        self.assertEqual(len(callbacks), 1)
+        self.assertIsNone(resolve_login_account('admin@technest'))
+        self.assertIsNotNone(resolve_login_account('admin@technest.io'))
+
+    def test_background_resync_retries_transient_errors(self):
+        failures = [OperationalError('connection reset')]
+
+        def flaky_resync(client):
+            if failures:
+                raise failures.pop()
+            return resync_client_login_accounts(client)
+
+        with mock.patch(
+            'apps.customers.services.login_accounts.resync_client_login_accounts', side_effect=flaky_resync,
+        ) as resync:
+            with self.captureOnCommitCallbacks(execute=True):
+                update_client_login_domain(client=self.client_obj, login_domain='technest.io', background=True)
+
+        self.assertEqual(resync.call_count, 2)
+        self.assertIsNotNone(resolve_login_account('admin@technest.io'))
+
+    def test_background_resync_failure_does_not_fail_the_commit(self):
+        with mock.patch(
+            'apps.customers.tasks.resync_client_login_accounts_task.delay',
+            side_effect=ConnectionError('broker unavailable'),
+        ):
+            with self.captureOnCommitCallbacks(execute=True) as callbacks:
+                update_client_login_domain(client=self.client_obj, login_domain='technest.io', background=True)
+
+        self.assertEqual(len(callbacks), 1)
+        self.client_obj.refresh_from_db()
+        self.assertEqual(self.client_obj.login_domain, 'technest.io')
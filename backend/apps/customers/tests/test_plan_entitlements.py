@@ -0,0 +1,116 @@
+from datetime import timedelta
+
+from django.core.cache import cache
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from django_tenants.utils import schema_context
+from rest_framework.exceptions import PermissionDenied
+from rest_framework.test import APIRequestFactory, force_authenticate
+
+from apps.customers.models import Client, Plan, SubscriptionStatus, TenantSubscription
+from apps.customers.services.login_accounts import build_login_identifier, register_login_account
+from apps.customers.services.plans import (
+    SubscriptionExpiredError,
+    assign_plan_to_client,
+    get_client_entitlements,
+    requires_feature,
+)
+from apps.customers.views.server_tenants import ServerPlanViewSet
+from apps.platform.models import PlatformUser
+from apps.users.models import User
+from apps.users.serializers import CustomTokenObtainPairSerializer
+
+
+def subscription_queries(queries):
+    return [q for q in queries.captured_queries if 'customers_tenant_subscription' in q['sql']]
+
+
+class PlanEntitlementTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.client_obj = Client(schema_name='main', name='Main', slug='main', login_domain='main.test', is_active=True)
+        self.client_obj.save()
+        self.basic = Plan.objects.create(name='Basic', tier='standard', github_integration_enabled=False)
+        self.pro = Plan.objects.create(name='Pro', tier='premium', github_integration_enabled=True)
+        assign_plan_to_client(client=self.client_obj, plan=self.pro)
+
+    def test_feature_checks_are_served_from_cache(self):
+        requires_feature(self.client_obj, 'github_integration_enabled')
+        with CaptureQueriesContext(connection) as queries:
+            for _ in range(3):
+                requires_feature(self.client_obj, 'github_integration_enabled')
+        self.assertEqual(subscription_queries(queries), [])
+
+    def test_assign_plan_invalidates(self):
+        requires_feature(self.client_obj, 'github_integration_enabled')
+        with self.captureOnCommitCallbacks(execute=True):
+            assign_plan_to_client(client=self.client_obj, plan=self.basic)
+            # Still the committed plan until the change commits.
+            requires_feature(self.client_obj, 'github_integration_enabled')
+
+        with self.assertRaises(PermissionDenied):
+            requires_feature(self.client_obj, 'github_integration_enabled')
+
+    def test_plan_edit_invalidates(self):
+        requires_feature(self.client_obj, 'attendance_enabled')
+        request = APIRequestFactory().patch(
+            f'/api/server/plans/{self.pro.pk}/', {'attendance_enabled': False}, format='json'
+        )
+        force_authenticate(request, user=PlatformUser.objects.create_user(username='platform', password='pw-12345'))
+        with self.captureOnCommitCallbacks(execute=True):
+            response = ServerPlanViewSet.as_view({'patch': 'partial_update'})(request, pk=self.pro.pk)
+        self.assertEqual(response.status_code, 200)
+
+        with self.assertRaises(PermissionDenied):
+            requires_feature(self.client_obj, 'attendance_enabled')
+
+    def test_expiry_is_evaluated_from_cached_entry(self):
+        assign_plan_to_client(client=self.client_obj, plan=self.pro, expires_at=timezone.now() + timedelta(seconds=1))
+        get_client_entitlements(self.client_obj)
+        cached = cache.get(f'plan_entitlements:{self.client_obj.pk}')
+        cached['expires_at'] = timezone.now() - timedelta(seconds=1)
+        cache.set(f'plan_entitlements:{self.client_obj.pk}', cached)
+
+        with CaptureQueriesContext(connection) as queries:
+            with self.assertRaises(SubscriptionExpiredError):
+                requires_feature(self.client_obj, 'github_integration_enabled')
+        self.assertEqual(subscription_queries(queries), [])
+
+
+class LoginSubscriptionCheckTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.client_obj = Client(schema_name='main', name='Main', slug='main', login_domain='main.test', is_active=True)
+        self.client_obj.save()
+        self.plan = Plan.objects.create(name='Basic', tier='standard')
+        with schema_context('main'):
+            user = User.objects.create_user(username='alice', password='pw-12345')
+        register_login_account(client=self.client_obj, user=user)
+        self.login_id = build_login_identifier(local_username='alice', login_domain='main.test')
+
+    def _login(self):
+        serializer = CustomTokenObtainPairSerializer(data={'username': self.login_id, 'password': 'pw-12345'})
+        with CaptureQueriesContext(connection) as queries:
+            valid = serializer.is_valid()
+        connection.set_schema_to_public()
+        return valid, subscription_queries(queries)
+
+    def test_login_reads_the_subscription_at_most_once(self):
+        assign_plan_to_client(client=self.client_obj, plan=self.plan)
+
+        valid, queries = self._login()
+        self.assertTrue(valid)
+        self.assertEqual(len(queries), 1)
+
+        valid, queries = self._login()
+        self.assertTrue(valid)
+        self.assertEqual(queries, [])
+
+    def test_login_marks_lapsed_subscription_expired(self):
+        assign_plan_to_client(client=self.client_obj, plan=self.plan, expires_at=timezone.now() - timedelta(days=1))
+
+        valid, _ = self._login()
+        self.assertFalse(valid)
+        self.assertEqual(TenantSubscription.objects.get(client=self.client_obj).status, SubscriptionStatus.EXPIRED)
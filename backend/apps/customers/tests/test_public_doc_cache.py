@@ -0,0 +1,106 @@
+from unittest import mock
+
+from django.core.cache import cache
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django_tenants.utils import schema_context
+from rest_framework.test import APIRequestFactory, force_authenticate
+
+from apps.customers.models import Client, Domain
+from apps.customers.services.doc_sharing import create_public_share, invalidate_public_doc_cache
+from apps.customers.tenant_resolution import internal_domain_for
+from apps.customers.views import public_docs
+from apps.customers.views.public_docs import public_shared_doc
+from apps.users.models import User
+
+
+class PublicSharedDocCacheTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.client_obj = Client(schema_name='main', name='Main Organization', slug='main', is_active=True)
+        self.client_obj.save()
+        Domain.objects.create(domain=internal_domain_for('main'), tenant=self.client_obj, is_primary=True)
+
+        with schema_context('main'):
+            from apps.workspace_docs.models import WorkspaceDoc
+
+            self.user = user = User.objects.create_user(
+                username='owner', email='owner@example.com', password='pw-12345',
+            )
+            self.doc = WorkspaceDoc.objects.create(
+                title='Runbook',
+                content={'type': 'doc', 'content': []},
+                created_by=user,
+            )
+            self.link = create_public_share(doc=self.doc, created_by=user, tenant_schema='main')
+        self.factory = APIRequestFactory()
+
+    def _get(self, **headers):
+        request = self.factory.get(f'/api/public/docs/{self.link.id}/', **headers)
+        return public_shared_doc(request, token=self.link.id)
+
+    def test_revalidation_returns_304_from_cache(self):
+        first = self._get()
+        self.assertEqual(first.status_code, 200)
+        etag = first['ETag']
+        self.assertIn('max-age=', first['Cache-Control'])
+
+        with CaptureQueriesContext(connection) as queries:
+            second = self._get(HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(second.status_code, 304)
+        self.assertFalse(any("'main'" in q['sql'] for q in queries.captured_queries))
+        self.assertEqual(second['ETag'], etag)
+
+    def test_invalidation_picks_up_edits(self):
+        etag = self._get()['ETag']
+        with schema_context('main'):
+            self.doc.title = 'Runbook v2'
+            self.doc.save()
+        invalidate_public_doc_cache(tenant_schema='main', doc_id=self.doc.id)
+
+        response = self._get(HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response['ETag'], etag)
+        self.assertEqual(response.data['title'], 'Runbook v2')
+
+    def test_edit_through_api_invalidates_after_commit(self):
+        from apps.workspace_docs.views import WorkspaceDocViewSet
+
+        etag = self._get()['ETag']
+        request = self.factory.patch(f'/api/docs/{self.doc.id}/', {'title': 'Runbook v2'}, format='json')
+        request.tenant = self.client_obj
+        force_authenticate(request, user=self.user)
+        with schema_context('main'):
+            with self.captureOnCommitCallbacks() as callbacks:
+                response = WorkspaceDocViewSet.as_view({'patch': 'partial_update'})(request, id=self.doc.id)
+                self.assertEqual(response.status_code, 200)
+                # Not committed yet: the cached render is still the one served.
+                self.assertEqual(self._get(HTTP_IF_NONE_MATCH=etag).status_code, 304)
+            for callback in callbacks:
+                callback()
+
+        response = self._get(HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data['title'], 'Runbook v2')
+
+    def test_late_cache_write_from_a_stale_read_is_ignored(self):
+        render = public_docs._public_doc_payload
+
+        def render_then_commit_edit(doc):
+            payload = render(doc)
+            # The edit commits (and invalidates) after this request loaded the
+            # doc but before it writes the cache.
+            with schema_context('main'):
+                self.doc.title = 'Runbook v2'
+                self.doc.save()
+            invalidate_public_doc_cache(tenant_schema='main', doc_id=self.doc.id)
+            return payload
+
+        with mock.patch.object(public_docs, '_public_doc_payload', side_effect=render_then_commit_edit):
+            stale = self._get()
+        self.assertEqual(stale.data['title'], 'Runbook')
+
+        response = self._get(HTTP_IF_NONE_MATCH=stale['ETag'])
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data['title'], 'Runbook v2')
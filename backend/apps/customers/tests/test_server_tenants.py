@@ -0,0 +1,71 @@
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django_tenants.utils import schema_context
+from rest_framework.test import APIRequestFactory, force_authenticate
+
+from apps.customers.models import Client, Domain, Plan
+from apps.customers.services.plans import assign_plan_to_client, get_plan_usage_by_schema
+from apps.customers.services.tenants import TenantProvisionError, create_client_user
+from apps.customers.views.server_tenants import ServerTenantViewSet
+from apps.platform.models import PlatformUser
+from apps.projects.models import Project
+from apps.users.models import User
+
+
+class TenantUsageTests(TestCase):
+    def setUp(self):
+        self.admin = PlatformUser.objects.create_user(username='platform', password='pw-12345')
+        self.plan = Plan.objects.create(name='Tiny', tier='standard', max_users=2, max_projects=1)
+
+    def _tenant(self, schema_name, *, users=0, projects=0):
+        client = Client(schema_name=schema_name, name=schema_name.title(), slug=schema_name, login_domain=f'{schema_name}.test')
+        client.save()
+        Domain.objects.create(domain=f'{schema_name}.internal', tenant=client, is_primary=True)
+        assign_plan_to_client(client=client, plan=self.plan)
+        with schema_context(schema_name):
+            created = [User.objects.create_user(username=f'user{i}', password='pw-12345') for i in range(users)]
+            for i in range(projects):
+                Project.objects.create(name=f'Project {i}', created_by=created[0])
+        return client
+
+    def _list(self):
+        request = APIRequestFactory().get('/api/server/tenants/')
+        force_authenticate(request, user=self.admin)
+        with CaptureQueriesContext(connection) as queries:
+            response = ServerTenantViewSet.as_view({'get': 'list'})(request)
+        self.assertEqual(response.status_code, 200)
+        return response, len(queries)
+
+    def test_usage_for_many_tenants_in_one_query(self):
+        acme = self._tenant('acme', users=2, projects=1)
+        beta = self._tenant('beta', users=1)
+        with CaptureQueriesContext(connection) as queries:
+            usage = get_plan_usage_by_schema([acme, beta, Client(schema_name='missing')])
+
+        self.assertEqual(usage, {
+            'acme': {'users': 2, 'projects': 1},
+            'beta': {'users': 1, 'projects': 0},
+            'missing': {'users': 0, 'projects': 0},
+        })
+        statements = [query['sql'] for query in queries if not query['sql'].startswith(('SET search_path', 'SET LOCAL search_path'))]
+        self.assertEqual(len(statements), 2)
+
+    def test_list_query_count_does_not_grow_with_tenants(self):
+        self._tenant('acme', users=2)
+        self._tenant('beta', users=1)
+        response, two_tenant_queries = self._list()
+        self.assertEqual({row['schema_name']: row['user_count'] for row in response.data}, {'acme': 2, 'beta': 1})
+        self.assertEqual(response.data[0]['primary_domain'], 'acme.internal')
+
+        self._tenant('gamma')
+        response, three_tenant_queries = self._list()
+        self.assertEqual(len(response.data), 3)
+        self.assertEqual(three_tenant_queries, two_tenant_queries)
+
+    def test_create_client_user_enforces_plan_limit(self):
+        client = self._tenant('acme', users=2)
+
+        with self.assertRaises(TenantProvisionError) as raised:
+            create_client_user(client=client, username='third', password='pw-12345')
+        self.assertEqual(raised.exception.status_code, 403)
@@ -0,0 +1,81 @@
+import uuid
+from datetime import timedelta
+
+from django.test import SimpleTestCase, TestCase, override_settings
+from django.utils import timezone
+from django_tenants.utils import get_public_schema_name, schema_context
+
+from apps.customers.models import PublicDocShareAccessLog, PublicDocShareIndex, PublicShareAccessStat, ShareKind
+from apps.customers.services.share_access import (
+    HLL_REGISTERS,
+    flush_share_access_buffer,
+    hll_add,
+    hll_count,
+    purge_expired_share_access_logs,
+    record_share_access,
+)
+
+
+class HyperLogLogTests(SimpleTestCase):
+    def test_estimate_is_close(self):
+        registers = bytearray(HLL_REGISTERS)
+        for i in range(5000):
+            hll_add(registers, f'10.0.{i // 256}.{i % 256}')
+            hll_add(registers, f'10.0.{i // 256}.{i % 256}')
+        self.assertAlmostEqual(hll_count(registers), 5000, delta=500)
+
+    def test_empty_sketch_counts_zero(self):
+        self.assertEqual(hll_count(bytes(HLL_REGISTERS)), 0)
+
+
+@override_settings(PUBLIC_SHARE_ACCESS_FLUSH_SIZE=1000, PUBLIC_SHARE_ACCESS_FLUSH_SECONDS=3600)
+class ShareAccessBufferTests(TestCase):
+    def setUp(self):
+        flush_share_access_buffer()
+        with schema_context(get_public_schema_name()):
+            self.index = PublicDocShareIndex.objects.create(
+                token=uuid.uuid4(),
+                tenant_schema='main',
+                doc_id=uuid.uuid4(),
+            )
+
+    def _record(self, ip_address):
+        record_share_access(
+            kind=ShareKind.DOC,
+            token=self.index.token,
+            tenant_schema='main',
+            ip_address=ip_address,
+        )
+
+    def test_views_are_buffered_then_rolled_up(self):
+        for ip_address in ['1.1.1.1', '2.2.2.2', '1.1.1.1']:
+            self._record(ip_address)
+        self.assertFalse(PublicShareAccessStat.objects.exists())
+
+        self.assertEqual(flush_share_access_buffer(), 3)
+        self._record('3.3.3.3')
+        flush_share_access_buffer()
+
+        stat = PublicShareAccessStat.objects.get(token=self.index.token)
+        self.assertEqual(stat.views, 4)
+        self.assertEqual(stat.unique_ips, 3)
+        self.assertFalse(PublicDocShareAccessLog.objects.exists())
+
+    @override_settings(PUBLIC_SHARE_RAW_ACCESS_LOGS=True, PUBLIC_SHARE_RAW_LOG_RETENTION_DAYS=7)
+    def test_raw_logs_are_optional_and_expire(self):
+        self._record('1.1.1.1')
+        flush_share_access_buffer()
+        self.assertEqual(PublicDocShareAccessLog.objects.count(), 1)
+
+        PublicDocShareAccessLog.objects.update(accessed_at=timezone.now() - timedelta(days=8))
+        self.assertEqual(purge_expired_share_access_logs(), 1)
+
+    @override_settings(PUBLIC_SHARE_ACCESS_FLUSH_SIZE=2)
+    def test_full_buffer_flushes_after_commit(self):
+        with self.captureOnCommitCallbacks(execute=True) as callbacks:
+            self._record('1.1.1.1')
+            self._record('2.2.2.2')
+            self.assertFalse(PublicShareAccessStat.objects.filter(token=self.index.token).exists())
+
+        self.assertEqual(len(callbacks), 1)
+        self.assertEqual(PublicShareAccessStat.objects.get(token=self.index.token).views, 2)
@@ -0,0 +1,61 @@
+from django.db import connection
+from django.test import TestCase, override_settings
+from django_tenants.utils import schema_context, schema_exists
+
+from apps.customers.models import Client
+from apps.customers.services.template_schema import (
+    clone_from_template,
+    refresh_template_schema,
+    template_is_current,
+)
+from apps.users.models import User
+
+LOGGER = 'apps.customers.services.template_schema'
+
+
+@override_settings(TENANT_TEMPLATE_SCHEMA='test_tenant_template', TENANT_TEMPLATE_PROVISIONING=True)
+class TemplateSchemaProvisioningTests(TestCase):
+    def _create_client(self, schema_name):
+        client = Client(schema_name=schema_name, name=schema_name, slug=schema_name.replace('_', '-'))
+        client.save(verbosity=0)
+        return client
+
+    def test_without_template_tenants_are_migrated(self):
+        self.assertFalse(template_is_current())
+        with self.assertLogs(LOGGER, 'INFO'):
+            self.assertFalse(clone_from_template('never_created'))
+        self.assertFalse(schema_exists('never_created'))
+
+    def test_refresh_then_clone(self):
+        self.assertTrue(refresh_template_schema())
+        self.assertTrue(template_is_current())
+        self.assertFalse(refresh_template_schema())
+
+        with self.assertLogs(LOGGER, 'INFO') as logs:
+            self._create_client('cloned')
+        self.assertIn('Cloned schema "cloned"', logs.output[0])
+
+        with schema_context('cloned'):
+            user = User.objects.create_user(username='first', password='pw-12345')
+        self.assertEqual(user.pk, 1)
+        with schema_context('test_tenant_template'):
+            self.assertFalse(User.objects.exists())
+
+    def test_stale_template_falls_back_to_migrations(self):
+        refresh_template_schema()
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "DELETE FROM test_tenant_template.django_migrations "
+                "WHERE id = (SELECT max(id) FROM test_tenant_template.django_migrations)"
+            )
+        self.assertFalse(template_is_current())
+
+        with self.assertLogs(LOGGER, 'WARNING'):
+            self._create_client('migrated')
+        with schema_context('migrated'):
+            User.objects.create_user(username='first', password='pw-12345')
+
+    @override_settings(TENANT_TEMPLATE_PROVISIONING=False)
+    def test_disabled(self):
+        refresh_template_schema()
+        self.assertFalse(clone_from_template('never_created'))
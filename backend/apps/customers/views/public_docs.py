@@ -1,11 +1,22 @@
+from django.conf import settings
 from django.utils import timezone
+from django.utils.http import parse_etags
 from rest_framework import status
 from rest_framework.decorators import api_view, permission_classes
 from rest_framework.permissions import AllowAny
 from rest_framework.response import Response
 from django_tenants.utils import schema_context
 
-from apps.customers.services.doc_sharing import log_public_share_access, resolve_public_share
+from apps.customers.services.doc_sharing import (
+    cache_public_doc,
+    cached_public_doc_version,
+    get_cached_public_doc,
+    log_public_share_access,
+    public_doc_etag,
+    public_doc_pointer_key,
+    public_doc_version,
+    resolve_public_share,
+)
 from apps.workspace_docs.rendering import render_doc_content_html
 
 
@@ -16,6 +27,20 @@ def _client_ip(request) -> str | None:
     return request.META.get('REMOTE_ADDR')
 
 
+def _etag_matches(request, etag: str) -> bool:
+    header = request.META.get('HTTP_IF_NONE_MATCH')
+    if not header:
+        return False
+    etags = parse_etags(header)
+    return '*' in etags or etag in etags
+
+
+def _with_cache_headers(response: Response, etag: str) -> Response:
+    response['ETag'] = etag
+    response['Cache-Control'] = f'public, max-age={settings.PUBLIC_SHARE_CACHE_MAX_AGE}'
+    return response
+
+
 @api_view(['GET'])
 @permission_classes([AllowAny])
 def public_shared_doc(request, token):
@@ -25,6 +50,18 @@ def public_shared_doc(request, token):
 
     log_public_share_access(index, _client_ip(request))
 
+    # Fast path: the share index lives in the public schema, so a cached version
+    # lets us answer without touching the tenant schema at all.
+    pointer_key = public_doc_pointer_key(index)
+    version = cached_public_doc_version(pointer_key)
+    if version is not None:
+        etag = public_doc_etag(index.doc_id, version)
+        if _etag_matches(request, etag):
+            return _with_cache_headers(Response(status=status.HTTP_304_NOT_MODIFIED), etag)
+        payload = get_cached_public_doc(index, version)
+        if payload is not None:
+            return _with_cache_headers(Response(payload), etag)
+
     with schema_context(index.tenant_schema):
         from apps.workspace_docs.models import WorkspaceDoc
 
@@ -39,9 +76,20 @@ def public_shared_doc(request, token):
         if active_link.expires_at and active_link.expires_at <= timezone.now():
             return Response({'detail': 'Share link has expired.'}, status=status.HTTP_404_NOT_FOUND)
 
-        return Response({
-            'title': doc.title,
-            'content': doc.content,
-            'content_html': render_doc_content_html(doc.content, skip_title_heading=True),
-            'updated_at': doc.updated_at,
-        })
+        version = public_doc_version(doc)
+        payload = get_cached_public_doc(index, version) or _public_doc_payload(doc)
+
+    cache_public_doc(index, pointer_key, version, payload)
+    etag = public_doc_etag(index.doc_id, version)
+    if _etag_matches(request, etag):
+        return _with_cache_headers(Response(status=status.HTTP_304_NOT_MODIFIED), etag)
+    return _with_cache_headers(Response(payload), etag)
+
+
+def _public_doc_payload(doc) -> dict:
+    return {
+        'title': doc.title,
+        'content': doc.content,
+        'content_html': render_doc_content_html(doc.content, skip_title_heading=True),
+        'updated_at': doc.updated_at,
+    }
@@ -1,4 +1,5 @@
 from django.core.exceptions import ObjectDoesNotExist
+from django.db import transaction
 from rest_framework import status, viewsets
 from rest_framework.decorators import action
 from rest_framework.permissions import IsAuthenticated
@@ -20,7 +21,12 @@ from apps.customers.serializers.tenants import (
     TenantUserCreateSerializer,
     TenantUserSerializer,
 )
-from apps.customers.services.plans import assign_plan_to_client, get_client_plan_usage
+from apps.customers.services.plans import (
+    assign_plan_to_client,
+    get_client_plan_usage,
+    get_plan_usage_by_schema,
+    invalidate_plan_entitlements,
+)
 from apps.customers.services.tenants import (
     TenantProvisionError,
     create_client_user,
@@ -42,6 +48,10 @@ class ServerPlanViewSet(viewsets.ModelViewSet):
     queryset = Plan.objects.all().order_by('monthly_price')
     http_method_names = ['get', 'post', 'patch', 'head', 'options']
 
+    def perform_update(self, serializer):
+        plan = serializer.save()
+        invalidate_plan_entitlements(plan)
+
 
 class ServerTenantViewSet(viewsets.ModelViewSet):
     authentication_classes = [PlatformJWTAuthentication]
@@ -65,12 +75,12 @@ class ServerTenantViewSet(viewsets.ModelViewSet):
         return ClientListSerializer
 
     def list(self, request, *args, **kwargs):
-        queryset = self.get_queryset()
+        clients = list(self.get_queryset())
+        usage_by_schema = get_plan_usage_by_schema(clients)
         payload = []
-        for client in queryset:
+        for client in clients:
             data = ClientListSerializer(client).data
-            usage = get_client_plan_usage(client)
-            data['user_count'] = usage.get('users', 0)
+            data['user_count'] = usage_by_schema[client.schema_name]['users']
             data['subscription'] = build_subscription_summary(_subscription_for(client))
             payload.append(data)
         return Response(payload)
@@ -113,7 +123,7 @@ class ServerTenantViewSet(viewsets.ModelViewSet):
         return Response(_client_detail_payload(client), status=status.HTTP_201_CREATED)
 
     def partial_update(self, request, *args, **kwargs):
-        from apps.customers.services.login_accounts import resync_client_login_accounts
+        from apps.customers.services.login_accounts import schedule_login_account_resync
 
         client = self.get_object()
         was_inactive = not client.is_active
@@ -124,7 +134,11 @@ class ServerTenantViewSet(viewsets.ModelViewSet):
 
         client = serializer.save()
         if client.login_domain != old_login_domain:
-            resync_client_login_accounts(client)
+            try:
+                schedule_login_account_resync(client)
+            except TenantProvisionError as exc:
+                transaction.set_rollback(True)
+                return Response({'detail': exc.message}, status=exc.status_code)
 
         if was_inactive and client.is_active:
             reactivate_client(client=client)
@@ -12,8 +12,10 @@ from apps.projects.models import Project
 from apps.tickets.models import Ticket
 from apps.timelogs.models import WorkLog
 from apps.activity.models import ActivityLog
+from apps.core.transactions import read_only_safe_methods
 
 
+@read_only_safe_methods
 @api_view(['GET'])
 @permission_classes([IsAuthenticated])
 def employee_dashboard(request):
@@ -129,6 +131,7 @@ def employee_dashboard(request):
     })
 
 
+@read_only_safe_methods
 @api_view(['GET'])
 @permission_classes([IsAuthenticated, IsManagerOrAdmin])
 def manager_dashboard(request):
@@ -235,6 +238,7 @@ def manager_dashboard(request):
     })
 
 
+@read_only_safe_methods
 @api_view(['GET'])
 @permission_classes([IsAuthenticated])
 def admin_dashboard(request):
@@ -334,6 +338,7 @@ from django.db.models import Q
 from django.db.models.functions import TruncWeek, TruncDay
 
 
+@read_only_safe_methods
 @api_view(['GET'])
 @permission_classes([IsAuthenticated])
 def employee_reports(request):
@@ -430,6 +435,7 @@ def employee_reports(request):
     })
 
 
+@read_only_safe_methods
 @api_view(['GET'])
 @permission_classes([IsAuthenticated])
 def manager_reports(request):
@@ -535,6 +541,7 @@ def manager_reports(request):
     })
 
 
+@read_only_safe_methods
 @api_view(['GET'])
 @permission_classes([IsAuthenticated])
 def admin_reports(request):
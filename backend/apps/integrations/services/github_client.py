@@ -6,6 +6,8 @@ from typing import Any
 import requests
 from django.conf import settings
 
+from apps.core.instrumentation import track_external
+
 logger = logging.getLogger(__name__)
 
 GITHUB_API = 'https://api.github.com'
@@ -30,13 +32,14 @@ class GitHubClient:
 
     def _request(self, method: str, path: str, **kwargs) -> Any:
         url = path if path.startswith('http') else f'{GITHUB_API}{path}'
-        response = requests.request(
-            method,
-            url,
-            headers=self._headers(),
-            timeout=30,
-            **kwargs,
-        )
+        with track_external('github'):
+            response = requests.request(
+                method,
+                url,
+                headers=self._headers(),
+                timeout=30,
+                **kwargs,
+            )
         if response.status_code >= 400:
             detail = response.text[:500]
             raise GitHubAPIError(
@@ -9,6 +9,8 @@ from urllib.parse import urlencode
 import requests
 from django.conf import settings
 
+from apps.core.instrumentation import track_external
+
 
 GITHUB_AUTHORIZE_URL = 'https://github.com/login/oauth/authorize'
 GITHUB_TOKEN_URL = 'https://github.com/login/oauth/access_token'
@@ -57,17 +59,18 @@ def build_authorize_url(tenant_slug: str, user_id: int) -> str:
 
 
 def exchange_code_for_token(code: str) -> dict:
-    response = requests.post(
-        GITHUB_TOKEN_URL,
-        headers={'Accept': 'application/json'},
-        data={
-            'client_id': settings.GITHUB_CLIENT_ID,
-            'client_secret': settings.GITHUB_CLIENT_SECRET,
-            'code': code,
-            'redirect_uri': settings.GITHUB_OAUTH_REDIRECT_URI,
-        },
-        timeout=30,
-    )
+    with track_external('github'):
+        response = requests.post(
+            GITHUB_TOKEN_URL,
+            headers={'Accept': 'application/json'},
+            data={
+                'client_id': settings.GITHUB_CLIENT_ID,
+                'client_secret': settings.GITHUB_CLIENT_SECRET,
+                'code': code,
+                'redirect_uri': settings.GITHUB_OAUTH_REDIRECT_URI,
+            },
+            timeout=30,
+        )
     response.raise_for_status()
     payload = response.json()
     if payload.get('error'):
@@ -76,14 +79,15 @@ def exchange_code_for_token(code: str) -> dict:
 
 
 def fetch_github_user(access_token: str) -> dict:
-    response = requests.get(
-        GITHUB_USER_URL,
-        headers={
-            'Authorization': f'Bearer {access_token}',
-            'Accept': 'application/vnd.github+json',
-            'X-GitHub-Api-Version': '2022-11-28',
-        },
-        timeout=30,
-    )
+    with track_external('github'):
+        response = requests.get(
+            GITHUB_USER_URL,
+            headers={
+                'Authorization': f'Bearer {access_token}',
+                'Accept': 'application/vnd.github+json',
+                'X-GitHub-Api-Version': '2022-11-28',
+            },
+            timeout=30,
+        )
     response.raise_for_status()
     return response.json()
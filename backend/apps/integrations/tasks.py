@@ -33,3 +33,47 @@ def sync_ticket_status_to_github_task(self, tenant_schema: str, ticket_id: int,
             logger.warning('GitHub sync skipped: ticket %s not found', ticket_id)
             return
         sync_ticket_status_to_github(ticket, new_status)
+
+
+@shared_task(
+    bind=True,
+    max_retries=3,
+    default_retry_delay=15,
+    acks_late=True,
+    autoretry_for=(Exception,),
+)
+def sync_tickets_to_github_task(
+    self,
+    tenant_schema: str,
+    status_changes: dict,
+    content_ticket_ids: list,
+    frontend_base_url: str | None = None,
+):
+    """Grouped GitHub sync for a bulk ticket update (status and/or content changes)."""
+    from apps.integrations.services.github_sync import (
+        sync_ticket_content_to_github,
+        sync_ticket_status_to_github,
+    )
+    from apps.tickets.models import Ticket
+
+    tenant = resolve_tenant(tenant_schema)
+    if tenant is None:
+        logger.warning('GitHub sync skipped: unknown tenant %s', tenant_schema)
+        return
+
+    # JSON task payloads turn int keys into strings.
+    status_changes = {int(pk): new_status for pk, new_status in status_changes.items()}
+    content_ticket_ids = set(content_ticket_ids)
+    ticket_ids = set(status_changes) | content_ticket_ids
+
+    with schema_context(tenant.schema_name):
+        connection.set_tenant(tenant)
+        tickets = (
+            Ticket.objects.filter(pk__in=ticket_ids, github_link__isnull=False)
+            .select_related('project', 'github_link')
+        )
+        for ticket in tickets:
+            if ticket.pk in status_changes:
+                sync_ticket_status_to_github(ticket, status_changes[ticket.pk])
+            if ticket.pk in content_ticket_ids:
+                sync_ticket_content_to_github(ticket, frontend_base_url=frontend_base_url)
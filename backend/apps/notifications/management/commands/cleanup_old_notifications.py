@@ -1,13 +1,20 @@
-from django.core.management.base import BaseCommand
-from django.utils import timezone
-from datetime import timedelta
-from apps.notifications.models import Notification
+from apps.core.tenant_jobs import TenantJobCommand
 
 
-class Command(BaseCommand):
-    help = 'Delete notifications older than 7 days'
+class Command(TenantJobCommand):
+    help = 'Delete notifications older than 7 days (every tenant)'
+
+    def add_arguments(self, parser):
+        super().add_arguments(parser)
+        parser.add_argument('--days', type=int, default=7, help='Keep notifications newer than this')
+
+    def describe_result(self, result) -> str:
+        return f'deleted {result} old notification(s)'
 
     def handle(self, *args, **options):
-        cutoff = timezone.now() - timedelta(days=7)
-        deleted, _ = Notification.objects.filter(created_at__lt=cutoff).delete()
-        self.stdout.write(self.style.SUCCESS(f'Deleted {deleted} old notifications'))
+        self.run_job(
+            'cleanup_old_notifications',
+            job_name='cleanup_old_notifications',
+            options=options,
+            job_kwargs={'days': options['days']},
+        )
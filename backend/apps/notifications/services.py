@@ -1,6 +1,8 @@
 import logging
+from datetime import timedelta
 
 from django.conf import settings
+from django.utils import timezone
 
 from .models import Notification
 from .tasks import send_ticket_assignment_email
@@ -70,3 +72,59 @@ def notify_ticket_assigned(*, assignee, ticket, assigned_by) -> None:
             assignee.id,
             ticket.id,
         )
+
+
+def notify_tickets_assigned(*, assignments, assigned_by) -> None:
+    """
+    Batched notify_ticket_assigned for (assignee, ticket) pairs: one INSERT for the
+    in-app notifications, then one queued email per assignment. Never raises to callers.
+    """
+    assignments = [
+        (assignee, ticket)
+        for assignee, ticket in assignments
+        if assignee.id != assigned_by.id and assignee.is_active
+    ]
+    if not assignments:
+        return
+
+    try:
+        Notification.objects.bulk_create([
+            Notification(
+                user=assignee,
+                message=_assignment_message(ticket, assigned_by),
+                ticket_id=ticket.id,
+                ticket_title=ticket.title[:255],
+            )
+            for assignee, ticket in assignments
+        ])
+    except Exception:
+        logger.exception(
+            'Failed to create in-app notifications for %d ticket assignments',
+            len(assignments),
+        )
+
+    if not settings.EMAIL_ENABLED:
+        return
+
+    for assignee, ticket in assignments:
+        if not assignee.email:
+            logger.warning(
+                'Skipping assignment email: assignee %s has no email address',
+                assignee.username,
+            )
+            continue
+        try:
+            send_ticket_assignment_email.delay(assignee.id, ticket.id, assigned_by.id)
+        except Exception:
+            logger.exception(
+                'Failed to queue assignment email (assignee=%s, ticket=%s)',
+                assignee.id,
+                ticket.id,
+            )
+
+
+def delete_old_notifications(*, days: int = 7) -> int:
+    """Delete notifications older than `days` in the current tenant schema."""
+    cutoff = timezone.now() - timedelta(days=days)
+    deleted, _ = Notification.objects.filter(created_at__lt=cutoff).delete()
+    return deleted
@@ -5,6 +5,8 @@ from django.conf import settings
 from django.core.mail import EmailMultiAlternatives
 from django.template.loader import render_to_string
 
+from apps.core.instrumentation import track_external
+
 from .email_utils import build_assignment_email_context
 
 logger = logging.getLogger(__name__)
@@ -58,7 +60,8 @@ def send_ticket_assignment_email(self, assignee_id, ticket_id, assigned_by_id):
             to=[assignee.email],
         )
         message.attach_alternative(html_body, 'text/html')
-        message.send(fail_silently=False)
+        with track_external('smtp'):
+            message.send(fail_silently=False)
     except Exception as exc:
         logger.exception(
             'Failed to send assignment email to %s for ticket %s',
@@ -5,16 +5,17 @@ from rest_framework.permissions import IsAuthenticated
 from django.utils import timezone
 from datetime import timedelta
 
+from apps.core.transactions import ReadOnlySafeMethodsMixin
+
 from .models import Notification
 from .serializers import NotificationSerializer
 
 
-class NotificationViewSet(mixins.DestroyModelMixin, viewsets.ReadOnlyModelViewSet):
+class NotificationViewSet(ReadOnlySafeMethodsMixin, mixins.DestroyModelMixin, viewsets.ReadOnlyModelViewSet):
     permission_classes = [IsAuthenticated]
     serializer_class = NotificationSerializer
 
     def get_queryset(self):
-        self._cleanup_old_read()
         return Notification.objects.filter(
             user=self.request.user
         ).order_by('-created_at')
@@ -0,0 +1,73 @@
+import statistics
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+from django_tenants.utils import schema_context
+
+from apps.projects.models import Project
+from apps.search.services import build_search_query, search_tickets
+from apps.tickets.models import Ticket
+
+DEFAULT_QUERIES = ['login timeout', 'payment', '"export report"', 'crash -android', 'slow dashboard']
+
+# Synthetic rows are generated in SQL so a million tickets load in seconds, not hours.
+GENERATE_TICKETS_SQL = """
+INSERT INTO tickets (
+    ticket_id, title, description, type, priority, status,
+    project_id, created_by_id, created_at, updated_at
+)
+SELECT
+    'BENCH-' || g,
+    words[1 + g %% 11] || ' ' || words[1 + (g / 11) %% 11] || ' issue ' || g,
+    'Users report ' || words[1 + (g / 7) %% 11] || ' problems after the '
+        || words[1 + (g / 3) %% 11] || ' change. ' || md5(g::text),
+    'task', 'medium', 'new', %s, %s, now(), now()
+FROM generate_series(1, %s) AS g,
+     (SELECT ARRAY['login', 'timeout', 'payment', 'export', 'report', 'crash', 'android',
+                   'slow', 'dashboard', 'email', 'upload'] AS words) AS vocab
+"""
+
+
+class Command(BaseCommand):
+    help = (
+        'Measure full-text ticket search latency against synthetic rows. '
+        'Rows are inserted inside a transaction and rolled back afterwards.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--schema', required=True, help='Tenant schema to benchmark in.')
+        parser.add_argument('--rows', type=int, default=1_000_000)
+        parser.add_argument('--runs', type=int, default=20, help='Timed runs per query.')
+        parser.add_argument('--limit', type=int, default=20)
+        parser.add_argument('--query', action='append', dest='queries', help='Query to time (repeatable).')
+
+    def handle(self, *args, **options):
+        queries = options['queries'] or DEFAULT_QUERIES
+        with schema_context(options['schema']), transaction.atomic():
+            project = Project.objects.select_related('created_by').first()
+            if project is None:
+                raise CommandError('The benchmark needs at least one project in the tenant.')
+
+            started = time.perf_counter()
+            with connection.cursor() as cursor:
+                cursor.execute(GENERATE_TICKETS_SQL, [project.pk, project.created_by_id, options['rows']])
+                cursor.execute('ANALYZE tickets')
+            self.stdout.write(f'Inserted {options["rows"]} tickets in {time.perf_counter() - started:.1f}s')
+
+            tickets = Ticket.objects.all()
+            for text in queries:
+                query = build_search_query(text)
+                timings = []
+                for _ in range(options['runs']):
+                    started = time.perf_counter()
+                    results = search_tickets(tickets, query, limit=options['limit'])
+                    timings.append((time.perf_counter() - started) * 1000)
+                timings.sort()
+                p95 = timings[max(int(len(timings) * 0.95) - 1, 0)]
+                self.stdout.write(
+                    f'{text!r}: {len(results)} results, '
+                    f'p50 {statistics.median(timings):.1f}ms, p95 {p95:.1f}ms',
+                )
+
+            transaction.set_rollback(True)
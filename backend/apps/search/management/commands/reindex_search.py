@@ -0,0 +1,25 @@
+from django.core.management.base import BaseCommand
+from django_tenants.utils import get_public_schema_name, get_tenant_model, schema_context
+
+from apps.search.services import reindex_search_vectors
+
+
+class Command(BaseCommand):
+    help = 'Rebuild full-text search vectors for tickets, comments and workspace docs.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--schema', help='Only reindex this tenant schema.')
+
+    def handle(self, *args, **options):
+        Client = get_tenant_model()
+        clients = Client.objects.exclude(schema_name=get_public_schema_name())
+        if options['schema']:
+            clients = clients.filter(schema_name=options['schema'])
+
+        for client in clients:
+            with schema_context(client.schema_name):
+                counts = reindex_search_vectors()
+            summary = ', '.join(f'{count} {table}' for table, count in counts.items())
+            self.stdout.write(f'{client.schema_name}: {summary}')
+
+        self.stdout.write(self.style.SUCCESS('Search reindex complete.'))
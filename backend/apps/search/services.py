@@ -0,0 +1,175 @@
+"""
+Full-text search over tickets, comments and workspace docs.
+
+Each table keeps a weighted `search_vector` column (GIN indexed) that a
+database trigger refreshes on write; see the `*_search_vector` migrations.
+`reindex_search_vectors` rebuilds them with the same weights.
+"""
+
+from __future__ import annotations
+
+import html
+
+from django.contrib.postgres.search import SearchHeadline, SearchQuery, SearchRank, SearchVector
+from django.db.models import F, QuerySet
+
+from apps.comments.models import Comment
+from apps.tickets.models import Ticket
+from apps.workspace_docs.models import WorkspaceDoc
+
+SEARCH_CONFIG = 'english'
+SEARCH_TYPES = ('ticket', 'comment', 'doc')
+MAX_RESULTS = 50
+
+# ts_headline output is escaped before we add <mark> tags, so the
+# highlight delimiters must be characters that never appear in content.
+_MARK_START = '\x02'
+_MARK_STOP = '\x03'
+
+
+def build_search_query(text: str) -> SearchQuery:
+    return SearchQuery(text, search_type='websearch', config=SEARCH_CONFIG)
+
+
+def _headline(field: str, query: SearchQuery) -> SearchHeadline:
+    return SearchHeadline(
+        field,
+        query,
+        config=SEARCH_CONFIG,
+        start_sel=_MARK_START,
+        stop_sel=_MARK_STOP,
+        max_words=30,
+        min_words=10,
+        max_fragments=2,
+        fragment_delimiter=' … ',
+    )
+
+
+def _snippet(raw: str | None) -> str:
+    escaped = html.escape(raw or '')
+    return escaped.replace(_MARK_START, '<mark>').replace(_MARK_STOP, '</mark>')
+
+
+def _ranked(queryset: QuerySet, query: SearchQuery, limit: int) -> QuerySet:
+    return (
+        queryset.filter(search_vector=query)
+        .annotate(rank=SearchRank(F('search_vector'), query))
+        .order_by('-rank', '-pk')[:limit]
+    )
+
+
+def search_tickets(queryset: QuerySet, query: SearchQuery, *, limit: int) -> list[dict]:
+    rows = _ranked(queryset, query, limit).annotate(snippet=_headline('description', query)).values(
+        'id', 'ticket_id', 'title', 'status', 'project_id', 'rank', 'snippet',
+    )
+    return [
+        {
+            'type': 'ticket',
+            'id': row['id'],
+            'ticket_id': row['ticket_id'],
+            'title': row['title'],
+            'status': row['status'],
+            'project_id': row['project_id'],
+            'rank': row['rank'],
+            'snippet': _snippet(row['snippet']),
+        }
+        for row in rows
+    ]
+
+
+def search_comments(queryset: QuerySet, query: SearchQuery, *, limit: int) -> list[dict]:
+    rows = _ranked(queryset, query, limit).annotate(snippet=_headline('content', query)).values(
+        'id', 'ticket_id', 'ticket__ticket_id', 'ticket__title', 'created_at', 'rank', 'snippet',
+    )
+    return [
+        {
+            'type': 'comment',
+            'id': row['id'],
+            'ticket': row['ticket_id'],
+            'ticket_id': row['ticket__ticket_id'],
+            'title': row['ticket__title'],
+            'created_at': row['created_at'],
+            'rank': row['rank'],
+            'snippet': _snippet(row['snippet']),
+        }
+        for row in rows
+    ]
+
+
+def search_docs(queryset: QuerySet, query: SearchQuery, *, limit: int) -> list[dict]:
+    rows = _ranked(queryset, query, limit).annotate(snippet=_headline('content_text', query)).values(
+        'id', 'title', 'emoji', 'project_id', 'updated_at', 'rank', 'snippet',
+    )
+    return [
+        {
+            'type': 'doc',
+            'id': row['id'],
+            'title': row['title'],
+            'emoji': row['emoji'],
+            'project_id': row['project_id'],
+            'updated_at': row['updated_at'],
+            'rank': row['rank'],
+            'snippet': _snippet(row['snippet']),
+        }
+        for row in rows
+    ]
+
+
+def search_workspace(
+    text: str,
+    *,
+    tickets: QuerySet | None = None,
+    comments: QuerySet | None = None,
+    docs: QuerySet | None = None,
+    limit: int = 20,
+) -> list[dict]:
+    """
+    Rank matches across the given (already access-filtered) querysets.
+
+    Pass None for a type to skip it. Results from all types are merged by rank.
+    """
+    query = build_search_query(text)
+    results: list[dict] = []
+    if tickets is not None:
+        results.extend(search_tickets(tickets, query, limit=limit))
+    if comments is not None:
+        results.extend(search_comments(comments, query, limit=limit))
+    if docs is not None:
+        results.extend(search_docs(docs, query, limit=limit))
+    results.sort(key=lambda result: result['rank'], reverse=True)
+    return results[:limit]
+
+
+def reindex_search_vectors() -> dict[str, int]:
+    """Rebuild search vectors in the current tenant schema. Returns rows touched per table."""
+    from apps.workspace_docs.rendering import extract_doc_text
+
+    counts = {
+        'tickets': Ticket.objects.update(
+            search_vector=(
+                SearchVector('ticket_id', weight='A', config=SEARCH_CONFIG)
+                + SearchVector('title', weight='A', config=SEARCH_CONFIG)
+                + SearchVector('description', weight='B', config=SEARCH_CONFIG)
+            ),
+        ),
+        'comments': Comment.objects.update(
+            search_vector=SearchVector('content', config=SEARCH_CONFIG),
+        ),
+    }
+
+    batch: list[WorkspaceDoc] = []
+    for doc in WorkspaceDoc.objects.only('id', 'content').iterator(chunk_size=500):
+        doc.content_text = extract_doc_text(doc.content)
+        batch.append(doc)
+        if len(batch) >= 500:
+            WorkspaceDoc.objects.bulk_update(batch, ['content_text'])
+            batch = []
+    if batch:
+        WorkspaceDoc.objects.bulk_update(batch, ['content_text'])
+    counts['docs'] = WorkspaceDoc.objects.update(
+        search_vector=(
+            SearchVector('title', weight='A', config=SEARCH_CONFIG)
+            + SearchVector('content_text', weight='B', config=SEARCH_CONFIG)
+        ),
+    )
+    return counts
@@ -0,0 +1,77 @@
+from django.db import connection
+from rest_framework.test import APIRequestFactory, force_authenticate
+
+from apps.comments.models import Comment
+from apps.core.testing import MainTenantTestCase
+from apps.customers.models import Domain
+from apps.customers.tenant_resolution import internal_domain_for
+from apps.projects.models import Project
+from apps.search.services import reindex_search_vectors
+from apps.search.views import search
+from apps.tickets.models import Ticket
+from apps.users.models import User
+from apps.workspace_docs.models import WorkspaceDoc
+
+
+def _doc_content(*paragraphs):
+    return {
+        'type': 'doc',
+        'content': [
+            {'type': 'paragraph', 'content': [{'type': 'text', 'text': text}]}
+            for text in paragraphs
+        ],
+    }
+
+
+class SearchTestCase(MainTenantTestCase):
+    def setUp(self):
+        super().setUp()
+        Domain.objects.create(domain=internal_domain_for('main'), tenant=self.tenant, is_primary=True)
+
+        self.admin = User.objects.create_user(
+            username='admin', email='admin@example.com', password='pw-12345', role='admin',
+        )
+        self.employee = User.objects.create_user(
+            username='emp', email='emp@example.com', password='pw-12345', role='employee',
+        )
+        self.project = Project.objects.create(name='Payments', created_by=self.admin)
+        self.ticket = Ticket.objects.create(
+            title='Checkout timeout',
+            description='Payment <b>gateway</b> times out after 30 seconds.',
+            project=self.project,
+            created_by=self.admin,
+        )
+        Comment.objects.create(ticket=self.ticket, author=self.admin, content='Gateway logs show retries.')
+        WorkspaceDoc.objects.create(
+            title='Gateway runbook',
+            content=_doc_content('Restart the payment gateway workers.'),
+            created_by=self.admin,
+        )
+
+    def _search(self, user, **params):
+        request = APIRequestFactory().get('/api/search/', params)
+        force_authenticate(request, user=user)
+        return search(request)
+
+    def test_ranks_across_types_with_escaped_snippets(self):
+        response = self._search(self.admin, q='gateway')
+        self.assertEqual(response.status_code, 200)
+        types = {result['type'] for result in response.data['results']}
+        self.assertEqual(types, {'ticket', 'comment', 'doc'})
+
+        ticket = next(r for r in response.data['results'] if r['type'] == 'ticket')
+        self.assertIn('<mark>gateway</mark>', ticket['snippet'])
+        self.assertNotIn('<b>', ticket['snippet'])
+
+    def test_respects_ticket_and_doc_visibility(self):
+        response = self._search(self.employee, q='gateway')
+        self.assertEqual(response.data['results'], [])
+
+    def test_trigger_and_reindex_keep_vectors_current(self):
+        Ticket.objects.filter(pk=self.ticket.pk).update(title='Refund webhook')
+        self.assertEqual(self._search(self.admin, q='webhook', type='ticket').data['results'][0]['id'], self.ticket.pk)
+
+        with connection.cursor() as cursor:
+            cursor.execute('UPDATE tickets SET search_vector = NULL')
+        reindex_search_vectors()
+        self.assertEqual(len(self._search(self.admin, q='refund', type='ticket').data['results']), 1)
@@ -0,0 +1,45 @@
+from rest_framework.decorators import api_view, permission_classes
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.response import Response
+
+from apps.comments.models import Comment
+from apps.core.access import accessible_ticket_ids_for_user, accessible_workspace_docs
+from apps.search.services import MAX_RESULTS, SEARCH_TYPES, search_workspace
+from apps.tickets.models import Ticket
+from apps.workspace_docs.models import WorkspaceDoc
+
+
+@api_view(['GET'])
+@permission_classes([IsAuthenticated])
+def search(request):
+    """
+    Unified search across tickets, comments and workspace docs.
+
+    Query params:
+    - q: search text (websearch syntax: "quoted phrases", -exclusions, OR)
+    - type: comma-separated subset of ticket,comment,doc (default: all)
+    - limit: max results, up to 50 (default 20)
+    """
+    user = request.user
+    text = request.query_params.get('q', '').strip()
+    if not text:
+        return Response({'query': '', 'results': []})
+
+    requested = request.query_params.get('type')
+    types = {t.strip() for t in requested.split(',')} if requested else set(SEARCH_TYPES)
+    try:
+        limit = min(max(int(request.query_params.get('limit', 20)), 1), MAX_RESULTS)
+    except ValueError:
+        limit = 20
+
+    ticket_ids = accessible_ticket_ids_for_user(user)
+    visible_docs = accessible_workspace_docs(user, WorkspaceDoc.objects.filter(is_archived=False))
+
+    results = search_workspace(
+        text,
+        tickets=Ticket.objects.filter(pk__in=ticket_ids) if 'ticket' in types else None,
+        comments=Comment.objects.filter(ticket_id__in=ticket_ids) if 'comment' in types else None,
+        docs=WorkspaceDoc.objects.filter(pk__in=visible_docs.values('pk')) if 'doc' in types else None,
+        limit=limit,
+    )
+    return Response({'query': text, 'results': results})
@@ -0,0 +1,296 @@
+"""
+Bulk ticket import from CSV or JSON Lines.
+
+Rows are validated in chunks against user/project lookups loaded once up
+front. Each valid chunk is written in one transaction: a single ticket_id
+block, one bulk INSERT each for tickets, assignee rows, comments and
+activity entries. Assignment notifications are optional.
+"""
+
+from __future__ import annotations
+
+import csv
+import io
+import json
+import time
+from collections.abc import Callable, Iterable, Iterator
+from dataclasses import dataclass, field
+from datetime import date
+
+from django.db import transaction
+from django.utils import timezone
+from django.utils.html import strip_tags
+
+from apps.activity.utils import log_activities
+from apps.comments.models import Comment
+from apps.notifications.services import notify_tickets_assigned
+from apps.projects.models import Project
+from apps.users.models import User
+
+from .models import Ticket, allocate_ticket_ids
+from .serializers import sanitize_multiline_text
+
+IMPORT_CHUNK_SIZE = 500
+# Per-row errors kept in the summary; the rest are only counted.
+MAX_REPORTED_ERRORS = 200
+
+_TYPES = {value for value, _ in Ticket.TYPE_CHOICES}
+_PRIORITIES = {value for value, _ in Ticket.PRIORITY_CHOICES}
+_STATUSES = {value for value, _ in Ticket.STATUS_CHOICES}
+_STATUS_TIMESTAMPS = {'in_progress': 'in_progress_at', 'qa': 'qa_at', 'closed': 'closed_at'}
+
+
+class TicketImportError(Exception):
+    """The import file itself cannot be read."""
+
+
+@dataclass
+class TicketImportResult:
+    created: int = 0
+    failed: int = 0
+    errors: list[dict] = field(default_factory=list)
+    elapsed_seconds: float = 0.0
+
+    @property
+    def rows_per_second(self) -> float:
+        total = self.created + self.failed
+        return round(total / self.elapsed_seconds, 1) if self.elapsed_seconds else 0.0
+
+    def as_dict(self) -> dict:
+        return {
+            'created': self.created,
+            'failed': self.failed,
+            'errors': self.errors,
+            'elapsed_seconds': round(self.elapsed_seconds, 2),
+            'rows_per_second': self.rows_per_second,
+        }
+
+
+def read_import_rows(stream, fmt: str) -> Iterator[tuple[int, dict]]:
+    """Yield (line number, row) from a text or binary CSV / JSONL stream."""
+    if isinstance(stream, (io.RawIOBase, io.BufferedIOBase)) or 'b' in getattr(stream, 'mode', ''):
+        stream = io.TextIOWrapper(stream, encoding='utf-8-sig')
+    if fmt == 'csv':
+        reader = csv.DictReader(stream)
+        try:
+            for row in reader:
+                yield reader.line_num, row
+        except csv.Error as exc:
+            # line_num only counts lines fully read; the bad one is the next.
+            raise TicketImportError(f'Line {reader.line_num + 1}: invalid CSV ({exc}).') from exc
+    elif fmt == 'jsonl':
+        for line_num, line in enumerate(stream, start=1):
+            if not line.strip():
+                continue
+            try:
+                row = json.loads(line)
+            except ValueError as exc:
+                raise TicketImportError(f'Line {line_num}: invalid JSON ({exc}).') from exc
+            if not isinstance(row, dict):
+                raise TicketImportError(f'Line {line_num}: expected a JSON object.')
+            yield line_num, row
+    else:
+        raise TicketImportError(f'Unsupported import format: {fmt}.')
+
+
+def import_format_for(filename: str) -> str:
+    return 'jsonl' if filename.lower().endswith(('.jsonl', '.ndjson')) else 'csv'
+
+
+def _split_names(value) -> list[str]:
+    if not value:
+        return []
+    if isinstance(value, str):
+        value = value.replace(',', ';').split(';')
+    return [str(item).strip() for item in value if str(item).strip()]
+
+
+class TicketImporter:
+    """
+    Imports ticket rows on behalf of `imported_by`.
+
+    `progress` is called after every chunk with the running TicketImportResult.
+    """
+
+    def __init__(
+        self,
+        *,
+        imported_by: User,
+        chunk_size: int = IMPORT_CHUNK_SIZE,
+        notify: bool = False,
+        dry_run: bool = False,
+        progress: Callable[[TicketImportResult], None] | None = None,
+    ):
+        self.imported_by = imported_by
+        self.chunk_size = chunk_size
+        self.notify = notify
+        self.dry_run = dry_run
+        self.progress = progress
+        self._users: dict[str, User] = {}
+        self._projects: dict[str, int] = {}
+
+    def _load_lookups(self) -> None:
+        for user in User.objects.only('id', 'username', 'email', 'is_active'):
+            self._users[user.username.lower()] = user
+            if user.email:
+                self._users.setdefault(user.email.lower(), user)
+        for project_id, name in Project.objects.values_list('id', 'name'):
+            self._projects[str(project_id)] = project_id
+            self._projects.setdefault(name.strip().lower(), project_id)
+
+    def run(self, rows: Iterable[tuple[int, dict]]) -> TicketImportResult:
+        result = TicketImportResult()
+        started = time.perf_counter()
+        self._load_lookups()
+
+        chunk: list[tuple[int, dict]] = []
+        for numbered_row in rows:
+            chunk.append(numbered_row)
+            if len(chunk) >= self.chunk_size:
+                self._import_chunk(chunk, result)
+                result.elapsed_seconds = time.perf_counter() - started
+                chunk = []
+        if chunk:
+            self._import_chunk(chunk, result)
+        result.elapsed_seconds = time.perf_counter() - started
+        return result
+
+    def _import_chunk(self, chunk: list[tuple[int, dict]], result: TicketImportResult) -> None:
+        cleaned = []
+        for line_num, row in chunk:
+            values, errors = self._clean_row(row)
+            if errors:
+                result.failed += 1
+                if len(result.errors) < MAX_REPORTED_ERRORS:
+                    result.errors.append({'line': line_num, 'errors': errors})
+            else:
+                cleaned.append(values)
+
+        if cleaned and not self.dry_run:
+            self._write_chunk(cleaned)
+        result.created += len(cleaned)
+        if self.progress:
+            self.progress(result)
+
+    def _clean_row(self, row: dict) -> tuple[dict, dict]:
+        errors: dict[str, str] = {}
+
+        title = strip_tags(str(row.get('title') or '')).strip()
+        if not title:
+            errors['title'] = 'This field is required.'
+        elif len(title) > 255:
+            errors['title'] = 'Ensure this field has no more than 255 characters.'
+
+        values = {
+            'title': title,
+            'description': sanitize_multiline_text(str(row.get('description') or '')),
+            'type': str(row.get('type') or 'task').strip().lower(),
+            'priority': str(row.get('priority') or 'medium').strip().lower(),
+            'status': str(row.get('status') or 'new').strip().lower(),
+        }
+        for name, allowed in (('type', _TYPES), ('priority', _PRIORITIES), ('status', _STATUSES)):
+            if values[name] not in allowed:
+                errors[name] = f'"{values[name]}" is not a valid choice.'
+
+        project_ref = str(row.get('project') or '').strip().lower()
+        values['project_id'] = self._projects.get(project_ref)
+        if values['project_id'] is None:
+            errors['project'] = f'Unknown project "{row.get("project") or ""}".'
+
+        values['created_by'] = self.imported_by
+        if row.get('created_by'):
+            values['created_by'] = self._users.get(str(row['created_by']).strip().lower())
+            if values['created_by'] is None:
+                errors['created_by'] = f'Unknown user "{row["created_by"]}".'
+
+        values['assignees'] = []
+        for name in _split_names(row.get('assignees')):
+            user = self._users.get(name.lower())
+            if user is None:
+                errors['assignees'] = f'Unknown user "{name}".'
+            elif user not in values['assignees']:
+                values['assignees'].append(user)
+
+        values['due_date'] = None
+        if row.get('due_date'):
+            try:
+                values['due_date'] = date.fromisoformat(str(row['due_date']).strip())
+            except ValueError:
+                errors['due_date'] = 'Use YYYY-MM-DD.'
+
+        values['comments'] = []
+        comments = row.get('comments') or []
+        if isinstance(comments, str):
+            try:
+                comments = json.loads(comments)
+            except ValueError:
+                comments = None
+        if not isinstance(comments, list):
+            errors['comments'] = 'Expected a list of {"author", "content"} objects.'
+            comments = []
+        for comment in comments:
+            if not isinstance(comment, dict):
+                comment = {}
+            author = self._users.get(str(comment.get('author') or '').strip().lower())
+            content = sanitize_multiline_text(str(comment.get('content') or ''))
+            if not content or author is None:
+                errors['comments'] = 'Each comment needs a known author and non-empty content.'
+                break
+            values['comments'].append((author, content))
+
+        return values, errors
+
+    @transaction.atomic
+    def _write_chunk(self, rows: list[dict]) -> None:
+        now = timezone.now()
+        ticket_ids = allocate_ticket_ids(len(rows))
+        tickets = []
+        for values, ticket_id in zip(rows, ticket_ids):
+            ticket = Ticket(
+                ticket_id=ticket_id,
+                title=values['title'],
+                description=values['description'],
+                type=values['type'],
+                priority=values['priority'],
+                status=values['status'],
+                project_id=values['project_id'],
+                created_by=values['created_by'],
+                due_date=values['due_date'],
+            )
+            timestamp_field = _STATUS_TIMESTAMPS.get(values['status'])
+            if timestamp_field:
+                setattr(ticket, timestamp_field, now)
+            tickets.append(ticket)
+        Ticket.objects.bulk_create(tickets)
+
+        Through = Ticket.assignees.through
+        Through.objects.bulk_create([
+            Through(ticket_id=ticket.pk, user_id=user.pk)
+            for ticket, values in zip(tickets, rows)
+            for user in values['assignees']
+        ])
+        Comment.objects.bulk_create([
+            Comment(ticket=ticket, author=author, content=content)
+            for ticket, values in zip(tickets, rows)
+            for author, content in values['comments']
+        ])
+        log_activities(
+            {
+                'action': 'create',
+                'user': self.imported_by,
+                'instance': ticket,
+                'description': f'Imported ticket {ticket.ticket_id}: {ticket.title}',
+                'extra_data': {'source': 'import'},
+            }
+            for ticket in tickets
+        )
+
+        if self.notify:
+            assignments = [
+                (user, ticket)
+                for ticket, values in zip(tickets, rows)
+                for user in values['assignees']
+            ]
+            transaction.on_commit(
+                lambda: notify_tickets_assigned(assignments=assignments, assigned_by=self.imported_by),
+            )
@@ -0,0 +1,63 @@
+from django.core.management.base import BaseCommand, CommandError
+from django_tenants.utils import schema_context
+
+from apps.tickets.importer import (
+    IMPORT_CHUNK_SIZE,
+    TicketImporter,
+    TicketImportError,
+    import_format_for,
+    read_import_rows,
+)
+from apps.users.models import User
+
+
+class Command(BaseCommand):
+    help = (
+        'Import tickets from a CSV or JSON Lines file into a tenant. Columns: title, description, '
+        'type, priority, status, project (id or name), created_by, assignees (";"-separated '
+        'usernames or emails), due_date, comments (JSON list of {"author", "content"}).'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('path', help='CSV or JSONL file (format inferred from the extension).')
+        parser.add_argument('--schema', required=True, help='Tenant schema to import into.')
+        parser.add_argument('--user', required=True, help='Username recorded as the importer / default creator.')
+        parser.add_argument('--format', dest='fmt', choices=['csv', 'jsonl'], help='Override the file format.')
+        parser.add_argument('--chunk-size', type=int, default=IMPORT_CHUNK_SIZE)
+        parser.add_argument('--notify', action='store_true', help='Send assignment notifications.')
+        parser.add_argument('--dry-run', action='store_true', help='Validate only; write nothing.')
+
+    def handle(self, *args, **options):
+        fmt = options['fmt'] or import_format_for(options['path'])
+        with schema_context(options['schema']):
+            try:
+                imported_by = User.objects.get(username=options['user'])
+            except User.DoesNotExist as exc:
+                raise CommandError(f'No user "{options["user"]}" in schema {options["schema"]}.') from exc
+
+            importer = TicketImporter(
+                imported_by=imported_by,
+                chunk_size=options['chunk_size'],
+                notify=options['notify'],
+                dry_run=options['dry_run'],
+                progress=self._report_progress,
+            )
+            try:
+                with open(options['path'], encoding='utf-8-sig', newline='') as stream:
+                    result = importer.run(read_import_rows(stream, fmt))
+            except (OSError, TicketImportError) as exc:
+                raise CommandError(str(exc)) from exc
+
+        for error in result.errors:
+            self.stderr.write(f'line {error["line"]}: {error["errors"]}')
+        verb = 'Validated' if options['dry_run'] else 'Imported'
+        self.stdout.write(self.style.SUCCESS(
+            f'{verb} {result.created} tickets, {result.failed} rejected, '
+            f'{result.elapsed_seconds:.1f}s ({result.rows_per_second} rows/s).'
+        ))
+
+    def _report_progress(self, result):
+        self.stdout.write(
+            f'  {result.created + result.failed} rows processed '
+            f'({result.failed} rejected, {result.rows_per_second} rows/s)'
+        )
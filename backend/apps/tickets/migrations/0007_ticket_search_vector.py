@@ -0,0 +1,49 @@
+import django.contrib.postgres.indexes
+import django.contrib.postgres.search
+from django.db import migrations
+
+SEARCH_VECTOR_SQL = """
+    setweight(to_tsvector('pg_catalog.english', coalesce({row}ticket_id, '')), 'A')
+    || setweight(to_tsvector('pg_catalog.english', coalesce({row}title, '')), 'A')
+    || setweight(to_tsvector('pg_catalog.english', coalesce({row}description, '')), 'B')
+"""
+
+CREATE_TRIGGER_SQL = f"""
+CREATE OR REPLACE FUNCTION tickets_search_vector_trigger() RETURNS trigger AS $$
+BEGIN
+    NEW.search_vector := {SEARCH_VECTOR_SQL.format(row='NEW.')};
+    RETURN NEW;
+END
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER tickets_search_vector_update
+    BEFORE INSERT OR UPDATE OF ticket_id, title, description ON tickets
+    FOR EACH ROW EXECUTE PROCEDURE tickets_search_vector_trigger();
+
+UPDATE tickets SET search_vector = {SEARCH_VECTOR_SQL.format(row='')};
+"""
+
+DROP_TRIGGER_SQL = """
+DROP TRIGGER IF EXISTS tickets_search_vector_update ON tickets;
+DROP FUNCTION IF EXISTS tickets_search_vector_trigger();
+"""
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tickets', '0006_ticket_due_date'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='ticket',
+            name='search_vector',
+            field=django.contrib.postgres.search.SearchVectorField(editable=False, null=True),
+        ),
+        migrations.AddIndex(
+            model_name='ticket',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['search_vector'], name='tickets_search_idx'),
+        ),
+        migrations.RunSQL(CREATE_TRIGGER_SQL, DROP_TRIGGER_SQL),
+    ]
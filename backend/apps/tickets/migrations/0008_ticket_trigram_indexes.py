@@ -0,0 +1,36 @@
+import django.contrib.postgres.indexes
+import django.db.models.functions.text
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tickets', '0007_ticket_search_vector'),
+    ]
+
+    operations = [
+        # Installed into public so every tenant schema sees it via search_path.
+        migrations.RunSQL(
+            'CREATE EXTENSION IF NOT EXISTS pg_trgm WITH SCHEMA public;',
+            migrations.RunSQL.noop,
+        ),
+        migrations.AddIndex(
+            model_name='ticket',
+            index=django.contrib.postgres.indexes.GinIndex(
+                django.contrib.postgres.indexes.OpClass(
+                    django.db.models.functions.text.Upper('ticket_id'),
+                    name='gin_trgm_ops',
+                ),
+                name='tickets_ticket_id_trgm_idx',
+            ),
+        ),
+        migrations.AddIndex(
+            model_name='ticket',
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=['title'],
+                name='tickets_title_trgm_idx',
+                opclasses=['gin_trgm_ops'],
+            ),
+        ),
+    ]
@@ -0,0 +1,35 @@
+from django.db import migrations, models
+
+# Start each day's counter after the highest suffix already used that day so
+# sequential ids never collide with the old random ones. Existing ids are untouched.
+SEED_COUNTERS_SQL = r"""
+INSERT INTO ticket_id_counters (day, last_value)
+SELECT to_date(substring(ticket_id from 5 for 8), 'YYYYMMDD'),
+       max(substring(ticket_id from 14)::integer)
+FROM tickets
+WHERE ticket_id ~ '^TKT-\d{8}-\d{1,7}$'
+GROUP BY 1
+ON CONFLICT (day) DO UPDATE
+    SET last_value = GREATEST(ticket_id_counters.last_value, EXCLUDED.last_value);
+"""
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tickets', '0008_ticket_trigram_indexes'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='TicketIdCounter',
+            fields=[
+                ('day', models.DateField(primary_key=True, serialize=False)),
+                ('last_value', models.PositiveIntegerField(default=0)),
+            ],
+            options={
+                'db_table': 'ticket_id_counters',
+            },
+        ),
+        migrations.RunSQL(SEED_COUNTERS_SQL, migrations.RunSQL.noop),
+    ]
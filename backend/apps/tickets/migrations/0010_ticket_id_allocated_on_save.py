@@ -0,0 +1,16 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tickets', '0009_ticket_id_counter'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='ticket',
+            name='ticket_id',
+            field=models.CharField(blank=True, max_length=20, unique=True),
+        ),
+    ]
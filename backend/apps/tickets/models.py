@@ -1,13 +1,39 @@
-from django.db import models
+from django.contrib.postgres.indexes import GinIndex, OpClass
+from django.contrib.postgres.search import SearchVectorField
+from django.db import connection, models
+from django.db.models.functions import Upper
 from django.utils import timezone
 from apps.users.models import User
 from apps.projects.models import Project
 
 
+def allocate_ticket_ids(count: int = 1, *, day=None) -> list[str]:
+    """
+    Reserve `count` consecutive ticket ids for `day` (default: today).
+
+    Ids come from a per-day counter row in the tenant schema, so they are
+    monotonic and never collide. The row stays locked until the surrounding
+    transaction ends; bulk creators should reserve a whole range in one call.
+    """
+    day = day or timezone.now().date()
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f"""
+            INSERT INTO {TicketIdCounter._meta.db_table} (day, last_value) VALUES (%s, %s)
+            ON CONFLICT (day) DO UPDATE
+                SET last_value = {TicketIdCounter._meta.db_table}.last_value + EXCLUDED.last_value
+            RETURNING last_value
+            """,
+            [day, count],
+        )
+        last_value = cursor.fetchone()[0]
+    prefix = f"TKT-{day.strftime('%Y%m%d')}-"
+    return [f'{prefix}{n:04d}' for n in range(last_value - count + 1, last_value + 1)]
+
+
 def generate_ticket_id():
-    import random
-    import string
-    return f"TKT-{timezone.now().strftime('%Y%m%d')}-{''.join(random.choices(string.digits, k=4))}"
+    # No longer a field default (building a Ticket must not write); kept for migration 0001.
+    return allocate_ticket_ids(1)[0]
 
 
 from apps.core.media_paths import tenant_scoped_upload_path
@@ -39,7 +65,8 @@ class Ticket(models.Model):
         ('reopened', 'Reopened'),
     ]
     
-    ticket_id = models.CharField(max_length=20, unique=True, default=generate_ticket_id)
+    # Allocated in save() when left blank; bulk creators reserve ids with allocate_ticket_ids.
+    ticket_id = models.CharField(max_length=20, unique=True, blank=True)
     title = models.CharField(max_length=255)
     description = models.TextField()
     type = models.CharField(max_length=20, choices=TYPE_CHOICES, default='task')
@@ -55,6 +82,8 @@ class Ticket(models.Model):
     qa_at = models.DateTimeField(null=True, blank=True)
     closed_at = models.DateTimeField(null=True, blank=True)
     due_date = models.DateField(null=True, blank=True)
+    # Maintained by a database trigger from ticket_id, title and description.
+    search_vector = SearchVectorField(null=True, editable=False)
     
     class Meta:
         db_table = 'tickets'
@@ -64,11 +93,33 @@ class Ticket(models.Model):
         indexes = [
             models.Index(fields=['due_date']),
             models.Index(fields=['project', 'status']),
+            GinIndex(fields=['search_vector'], name='tickets_search_idx'),
+            # pg_trgm indexes for quick-open; ticket_id__icontains compiles to UPPER(ticket_id) LIKE.
+            GinIndex(OpClass(Upper('ticket_id'), name='gin_trgm_ops'), name='tickets_ticket_id_trgm_idx'),
+            GinIndex(fields=['title'], opclasses=['gin_trgm_ops'], name='tickets_title_trgm_idx'),
         ]
     
     def __str__(self):
         return f"{self.ticket_id} - {self.title}"
 
+    def save(self, *args, **kwargs):
+        if not self.ticket_id:
+            self.ticket_id = allocate_ticket_ids(1)[0]
+        super().save(*args, **kwargs)
+
+
+class TicketIdCounter(models.Model):
+    """Last ticket_id sequence number handed out per day (one row per day, per tenant schema)."""
+
+    day = models.DateField(primary_key=True)
+    last_value = models.PositiveIntegerField(default=0)
+
+    class Meta:
+        db_table = 'ticket_id_counters'
+
+    def __str__(self):
+        return f"{self.day}: {self.last_value}"
+
 
 class TicketMedia(models.Model):
     MEDIA_TYPES = [
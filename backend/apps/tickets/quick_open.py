@@ -0,0 +1,70 @@
+"""
+Quick-open ticket lookup: fuzzy ticket_id / title matching backed by pg_trgm
+GIN indexes, boosted by the tickets the user opened recently.
+"""
+
+from __future__ import annotations
+
+from django.contrib.postgres.search import TrigramSimilarity, TrigramWordSimilarity
+from django.core.cache import caches
+from django.db import connection, transaction
+from django.db.models import Case, FloatField, Q, Value, When
+from django.db.models.functions import Greatest
+
+from apps.core.access import accessible_ticket_ids_for_user
+from apps.tickets.models import Ticket
+
+RECENT_TICKETS_LIMIT = 20
+RECENT_TICKETS_TTL = 60 * 60 * 24 * 30
+RECENT_BOOST = 0.3
+# Trigram indexes cannot narrow fragments shorter than three characters,
+# so those only match against the user's recent tickets.
+MIN_INDEXED_LENGTH = 3
+# pg_trgm's default word-similarity cut-off (0.6) drops most one-letter typos.
+WORD_SIMILARITY_THRESHOLD = 0.45
+QUICK_OPEN_FIELDS = ('id', 'ticket_id', 'title', 'status', 'priority', 'project_id', 'project__name')
+
+
+def _recent_key(user) -> str:
+    # The `tenant` cache alias namespaces keys by schema.
+    return f'tickets:recent:{user.pk}'
+
+
+def recent_ticket_ids(user) -> list[int]:
+    return caches['tenant'].get(_recent_key(user)) or []
+
+
+def remember_recent_ticket(user, ticket_pk: int) -> None:
+    recent = [pk for pk in recent_ticket_ids(user) if pk != ticket_pk]
+    recent.insert(0, ticket_pk)
+    caches['tenant'].set(_recent_key(user), recent[:RECENT_TICKETS_LIMIT], RECENT_TICKETS_TTL)
+
+
+def quick_open_tickets(user, text: str, *, limit: int = 10) -> list[dict]:
+    text = text.strip()
+    recent = recent_ticket_ids(user)
+    visible = Ticket.objects.filter(pk__in=accessible_ticket_ids_for_user(user))
+
+    if len(text) < MIN_INDEXED_LENGTH:
+        rows = visible.filter(pk__in=recent)
+        if text:
+            rows = rows.filter(Q(ticket_id__icontains=text) | Q(title__icontains=text))
+        by_pk = {row['id']: row for row in rows.values(*QUICK_OPEN_FIELDS)}
+        return [by_pk[pk] for pk in recent if pk in by_pk][:limit]
+
+    score = (
+        Greatest(TrigramSimilarity('ticket_id', text), TrigramWordSimilarity(text, 'title'))
+        + Case(When(ticket_id__iexact=text, then=Value(1.0)), default=Value(0.0), output_field=FloatField())
+        + Case(When(pk__in=recent, then=Value(RECENT_BOOST)), default=Value(0.0), output_field=FloatField())
+    )
+    with transaction.atomic(), connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT set_config('pg_trgm.word_similarity_threshold', %s, true)",
+            [str(WORD_SIMILARITY_THRESHOLD)],
+        )
+        return list(
+            visible.filter(Q(ticket_id__icontains=text) | Q(title__trigram_word_similar=text))
+            .annotate(score=score)
+            .order_by('-score', '-created_at')
+            .values(*QUICK_OPEN_FIELDS)[:limit]
+        )
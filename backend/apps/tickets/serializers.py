@@ -158,7 +158,7 @@ class _TicketCoreSerializer(serializers.ModelSerializer):
         return _ticket_is_overdue(obj)
 
     def get_assignees(self, obj):
-        return list(obj.assignees.values_list('id', flat=True))
+        return [u.id for u in obj.assignees.all()]
 
     def get_assignees_list(self, obj):
         return [_build_assignee_dict(u) for u in obj.assignees.all()]
@@ -193,7 +193,8 @@ class TicketSerializer(_TicketCoreSerializer):
         fields = _TicketCoreSerializer.Meta.fields + ['media_files', 'comments', 'github_link']
 
     def get_media_files(self, obj):
-        attachments = obj.media_files.filter(comment__isnull=True)
+        # Filter in Python so the prefetched media_files are reused; comment images are excluded.
+        attachments = [media for media in obj.media_files.all() if media.comment_id is None]
         return TicketMediaSerializer(
             attachments,
             many=True,
@@ -284,3 +285,21 @@ class TicketStatusSerializer(serializers.ModelSerializer):
     class Meta:
         model  = Ticket
         fields = ['status']
+
+
+class TicketBulkUpdateSerializer(serializers.Serializer):
+    MAX_TICKETS = 200
+
+    ids      = serializers.ListField(child=serializers.IntegerField(), allow_empty=False, max_length=MAX_TICKETS)
+    status   = serializers.ChoiceField(choices=Ticket.STATUS_CHOICES, required=False)
+    priority = serializers.ChoiceField(choices=Ticket.PRIORITY_CHOICES, required=False)
+    assign   = serializers.ListField(child=serializers.IntegerField(), required=False, default=list)
+    unassign = serializers.ListField(child=serializers.IntegerField(), required=False, default=list)
+
+    def validate(self, attrs):
+        if not any((attrs.get('status'), attrs.get('priority'), attrs['assign'], attrs['unassign'])):
+            raise serializers.ValidationError('Provide at least one of status, priority, assign or unassign.')
+        if set(attrs['assign']) & set(attrs['unassign']):
+            raise serializers.ValidationError('A user cannot be both assigned and unassigned.')
+        attrs['ids'] = list(dict.fromkeys(attrs['ids']))
+        return attrs
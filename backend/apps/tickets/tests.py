@@ -1,10 +1,30 @@
+import csv
+import datetime
+import io
+import json
+import os
+import tempfile
+
+from django.core.cache import caches
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import call_command
+from django.db import connection
 from django.test import TestCase
-from rest_framework.test import APIClient
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIClient, APIRequestFactory, force_authenticate
 from rest_framework import status
+from apps.activity.models import ActivityLog
+from apps.comments.models import Comment
+from apps.core.access import ProjectMembership, user_can_access_ticket
+from apps.core.testing import MainTenantTestCase
+from apps.notifications.models import Notification
 from apps.users.models import User
 from apps.projects.models import Project
-from apps.tickets.models import Ticket
+from apps.tickets.models import Ticket, TicketIdCounter, TicketMedia, allocate_ticket_ids
+from apps.tickets.quick_open import quick_open_tickets, remember_recent_ticket
 from apps.tickets.serializers import sanitize_multiline_text
+from apps.tickets.views import TicketViewSet
+from apps.timelogs.models import WorkLog
 
 
 class SanitizeMultilineTextTestCase(TestCase):
@@ -472,4 +492,378 @@ class TicketStatsTestCase(TestCase):
 
         self.assertEqual(stats_response.status_code, status.HTTP_200_OK)
         self.assertEqual(list_response.status_code, status.HTTP_200_OK)
-        self.assertEqual(list_response.data['count'], stats_response.data['total'])
\ No newline at end of file
+        self.assertEqual(list_response.data['count'], stats_response.data['total'])
+
+
+class QuickOpenTestCase(MainTenantTestCase):
+    def setUp(self):
+        caches['tenant'].clear()
+        super().setUp()
+
+        self.admin = User.objects.create_user(username='admin', email='a@test.com', password='pw', role='admin')
+        self.employee = User.objects.create_user(username='emp', email='e@test.com', password='pw', role='employee')
+        project = Project.objects.create(name='Payments', created_by=self.admin)
+        self.checkout = Ticket.objects.create(
+            ticket_id='TKT-20260101-1234', title='Checkout button broken',
+            description='x', project=project, created_by=self.admin,
+        )
+        self.refund = Ticket.objects.create(
+            ticket_id='TKT-20260102-5678', title='Refund checkout emails',
+            description='x', project=project, created_by=self.admin,
+        )
+
+    def test_matches_ticket_id_fragments_and_fuzzy_titles(self):
+        self.assertEqual([r['id'] for r in quick_open_tickets(self.admin, '1234')], [self.checkout.pk])
+        self.assertEqual(quick_open_tickets(self.admin, 'TKT-20260102-5678')[0]['id'], self.refund.pk)
+        self.assertEqual(
+            {r['id'] for r in quick_open_tickets(self.admin, 'chekout')},
+            {self.checkout.pk, self.refund.pk},
+        )
+
+    def test_recent_tickets_are_boosted_and_visibility_respected(self):
+        remember_recent_ticket(self.admin, self.refund.pk)
+        self.assertEqual(quick_open_tickets(self.admin, 'checkout')[0]['id'], self.refund.pk)
+        self.assertEqual([r['id'] for r in quick_open_tickets(self.admin, '')], [self.refund.pk])
+        self.assertEqual(quick_open_tickets(self.employee, 'checkout'), [])
+
+
+class TicketIdAllocationTestCase(MainTenantTestCase):
+    def setUp(self):
+        super().setUp()
+
+        self.user = User.objects.create_user(username='admin', email='a@test.com', password='pw', role='admin')
+        self.project = Project.objects.create(name='Payments', created_by=self.user)
+
+    def test_ids_are_sequential_per_day(self):
+        day = datetime.date(2026, 1, 1)
+        self.assertEqual(allocate_ticket_ids(day=day), ['TKT-20260101-0001'])
+        self.assertEqual(
+            allocate_ticket_ids(3, day=day),
+            ['TKT-20260101-0002', 'TKT-20260101-0003', 'TKT-20260101-0004'],
+        )
+        self.assertEqual(allocate_ticket_ids(day=datetime.date(2026, 1, 2)), ['TKT-20260102-0001'])
+
+    def test_default_ticket_ids_do_not_collide(self):
+        tickets = [
+            Ticket.objects.create(title=f'T{i}', description='x', project=self.project, created_by=self.user)
+            for i in range(50)
+        ]
+        ids = [ticket.ticket_id for ticket in tickets]
+        self.assertEqual(len(set(ids)), 50)
+        self.assertEqual(ids, sorted(ids))
+
+    def test_building_a_ticket_does_not_allocate(self):
+        ticket = Ticket(title='Draft', description='x', project=self.project, created_by=self.user)
+        self.assertEqual(ticket.ticket_id, '')
+        self.assertFalse(TicketIdCounter.objects.exists())
+
+        ticket.save()
+        self.assertEqual(TicketIdCounter.objects.get().last_value, 1)
+        self.assertTrue(ticket.ticket_id.endswith('-0001'))
+
+
+class BulkTicketUpdateTestCase(MainTenantTestCase):
+    def setUp(self):
+        super().setUp()
+
+        self.manager = User.objects.create_user(username='mgr', email='m@test.com', password='pw', role='manager')
+        self.dev = User.objects.create_user(username='dev', email='d@test.com', password='pw', role='employee')
+        self.project = Project.objects.create(name='Payments', created_by=self.manager)
+        self.project.members.add(self.dev)
+        self.tickets = [
+            Ticket.objects.create(title=f'T{i}', description='x', project=self.project, created_by=self.manager)
+            for i in range(5)
+        ]
+
+    def _bulk(self, user, payload):
+        request = APIRequestFactory().post('/api/tickets/tickets/bulk/', payload, format='json')
+        force_authenticate(request, user=user)
+        return TicketViewSet.as_view({'post': 'bulk'})(request)
+
+    def test_assign_and_start_in_one_request(self):
+        ids = [t.pk for t in self.tickets]
+        response = self._bulk(self.manager, {
+            'ids': ids, 'status': 'in_progress', 'priority': 'high', 'assign': [self.dev.pk],
+        })
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data['updated'], 5)
+        self.assertEqual(set(Ticket.objects.values_list('status', 'priority')), {('in_progress', 'high')})
+        self.assertEqual(Ticket.assignees.through.objects.filter(user=self.dev).count(), 5)
+        self.assertEqual(WorkLog.objects.filter(end_time__isnull=True).count(), 5)
+        self.assertEqual(Notification.objects.filter(user=self.dev).count(), 5)
+        self.assertEqual(ActivityLog.objects.filter(action='status_change').count(), 5)
+
+    def test_invalid_transition_rejects_whole_batch(self):
+        closed = self.tickets[0]
+        Ticket.objects.filter(pk=closed.pk).update(status='closed')
+        response = self._bulk(self.manager, {'ids': [t.pk for t in self.tickets], 'status': 'qa'})
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(set(response.data['errors']), {t.pk for t in self.tickets})
+        self.assertFalse(Ticket.objects.filter(status='qa').exists())
+
+    def test_employee_cannot_change_priority_of_others_tickets(self):
+        response = self._bulk(self.dev, {'ids': [self.tickets[0].pk], 'priority': 'critical'})
+        self.assertEqual(response.status_code, 400)
+        self.assertIn(self.tickets[0].pk, response.data['errors'])
+
+
+class TicketExportTestCase(MainTenantTestCase):
+    def setUp(self):
+        super().setUp()
+
+        self.manager = User.objects.create_user(username='mgr', email='m@test.com', password='pw', role='manager')
+        self.dev = User.objects.create_user(username='dev', email='d@test.com', password='pw', role='employee')
+        self.outsider = User.objects.create_user(username='out', email='o@test.com', password='pw', role='employee')
+        self.project = Project.objects.create(name='Payments', created_by=self.manager)
+        self.assigned = Ticket.objects.create(
+            title='Refund, "partial"', description='x', project=self.project, created_by=self.manager,
+        )
+        self.assigned.assignees.add(self.dev, self.manager)
+        self.unassigned = Ticket.objects.create(
+            title='Ledger', description='x', project=self.project, created_by=self.manager, status='closed',
+        )
+
+    def _export(self, user, **params):
+        request = APIRequestFactory().get('/api/tickets/tickets/export/', params)
+        force_authenticate(request, user=user)
+        response = TicketViewSet.as_view({'get': 'export'})(request)
+        body = b''.join(response.streaming_content).decode() if response.status_code == 200 else ''
+        return response, body
+
+    def test_csv_export_aggregates_assignees(self):
+        response, body = self._export(self.manager)
+        self.assertEqual(response.status_code, 200)
+        self.assertIn('attachment; filename="tickets-', response['Content-Disposition'])
+        rows = {row['ticket_id']: row for row in csv.DictReader(io.StringIO(body))}
+        self.assertEqual(rows[self.assigned.ticket_id]['assignees'], 'dev;mgr')
+        self.assertEqual(rows[self.assigned.ticket_id]['title'], 'Refund, "partial"')
+        self.assertEqual(rows[self.unassigned.ticket_id]['assignees'], '')
+        self.assertEqual(rows[self.unassigned.ticket_id]['project'], 'Payments')
+
+    def test_assignee_export_lists_every_assignee(self):
+        # Both the employee's visibility filter and ?assignee= join assignees.
+        for user, params in ((self.dev, {}), (self.manager, {'assignee': self.dev.pk})):
+            response, body = self._export(user, **params)
+            self.assertEqual(response.status_code, 200)
+            rows = {row['ticket_id']: row for row in csv.DictReader(io.StringIO(body))}
+            self.assertEqual(rows[self.assigned.ticket_id]['assignees'], 'dev;mgr')
+
+    def test_jsonl_export_honours_filters_and_visibility(self):
+        response, body = self._export(self.manager, file_format='jsonl', status='closed')
+        self.assertEqual(response['Content-Type'], 'application/x-ndjson')
+        rows = [json.loads(line) for line in body.splitlines()]
+        self.assertEqual([row['ticket_id'] for row in rows], [self.unassigned.ticket_id])
+        self.assertEqual(rows[0]['assignees'], [])
+
+        _, body = self._export(self.outsider)
+        self.assertEqual(body.splitlines()[1:], [])
+
+    def test_rejects_unknown_format(self):
+        response, _ = self._export(self.manager, file_format='xlsx')
+        self.assertEqual(response.status_code, 400)
+
+
+class TicketImportTestCase(MainTenantTestCase):
+    def setUp(self):
+        super().setUp()
+
+        self.admin = User.objects.create_user(username='boss', email='boss@test.com', password='pw', role='admin')
+        self.dev = User.objects.create_user(username='dev', email='dev@test.com', password='pw', role='employee')
+        self.project = Project.objects.create(name='Payments', created_by=self.admin)
+
+    def _upload(self, user, name, content, **data):
+        data['file'] = SimpleUploadedFile(name, content.encode())
+        request = APIRequestFactory().post('/api/tickets/tickets/import/', data, format='multipart')
+        force_authenticate(request, user=user)
+        return TicketViewSet.as_view({'post': 'import_tickets'})(request)
+
+    def test_csv_import_creates_tickets_assignees_and_ids_in_one_block(self):
+        content = (
+            'title,description,priority,status,project,assignees,due_date\n'
+            'Broken refunds,Fails on <b>partial</b>,high,in_progress,Payments,dev;boss@test.com,2026-01-31\n'
+            'Ledger drift,,low,new,%d,,\n'
+            ',missing title,low,new,Payments,,\n'
+            'Bad refs,x,urgent,new,Nope,ghost,\n'
+        ) % self.project.pk
+        response = self._upload(self.admin, 'tickets.csv', content)
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual((response.data['created'], response.data['failed']), (2, 2))
+        self.assertEqual([e['line'] for e in response.data['errors']], [4, 5])
+        self.assertEqual(set(response.data['errors'][1]['errors']), {'priority', 'project', 'assignees'})
+
+        refunds = Ticket.objects.get(title='Broken refunds')
+        self.assertEqual(refunds.description, 'Fails on partial')
+        self.assertIsNotNone(refunds.in_progress_at)
+        self.assertEqual(set(refunds.assignees.values_list('username', flat=True)), {'dev', 'boss'})
+        ledger = Ticket.objects.get(title='Ledger drift')
+        self.assertEqual(int(ledger.ticket_id[-4:]), int(refunds.ticket_id[-4:]) + 1)
+        self.assertEqual(ActivityLog.objects.filter(action='create').count(), 2)
+
+    def test_jsonl_import_with_comments_and_dry_run(self):
+        line = json.dumps({
+            'title': 'Imported', 'project': 'payments', 'created_by': 'dev',
+            'comments': [{'author': 'boss', 'content': 'First!'}],
+        })
+        response = self._upload(self.admin, 'tickets.jsonl', line + '\n', dry_run='true')
+        self.assertEqual((response.status_code, response.data['created']), (200, 1))
+        self.assertFalse(Ticket.objects.exists())
+
+        response = self._upload(self.admin, 'tickets.jsonl', line + '\n')
+        self.assertEqual(response.status_code, 201)
+        ticket = Ticket.objects.get()
+        self.assertEqual(ticket.created_by, self.dev)
+        self.assertEqual(list(Comment.objects.values_list('author__username', 'content')), [('boss', 'First!')])
+
+    def test_jsonl_non_string_choices_are_row_errors(self):
+        lines = [
+            json.dumps({'title': 'Numeric', 'project': 'Payments', 'priority': 2, 'status': None, 'type': True}),
+            json.dumps({'title': 'Fine', 'project': self.project.pk}),
+        ]
+        response = self._upload(self.admin, 'tickets.jsonl', '\n'.join(lines) + '\n')
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual((response.data['created'], response.data['failed']), (1, 1))
+        self.assertEqual(response.data['errors'][0]['line'], 1)
+        self.assertEqual(set(response.data['errors'][0]['errors']), {'priority', 'type'})
+
+    def test_malformed_csv_is_a_bad_request(self):
+        oversized = 'x' * (csv.field_size_limit() + 1)
+        response = self._upload(self.admin, 'tickets.csv', f'title,project\n{oversized},Payments\n')
+        self.assertEqual(response.status_code, 400)
+        self.assertIn('Line 2: invalid CSV', str(response.data))
+
+    def test_non_admin_cannot_import(self):
+        response = self._upload(self.dev, 'tickets.csv', 'title,project\nX,Payments\n')
+        self.assertEqual(response.status_code, 403)
+
+    def test_command_reports_progress(self):
+        with tempfile.NamedTemporaryFile('w', suffix='.csv', delete=False) as handle:
+            handle.write('title,project\n' + ''.join(f'Row {i},Payments\n' for i in range(5)))
+        self.addCleanup(os.unlink, handle.name)
+        out = io.StringIO()
+        call_command('import_tickets', handle.name, schema='main', user='boss', chunk_size=2, stdout=out)
+        self.assertEqual(Ticket.objects.count(), 5)
+        self.assertIn('Imported 5 tickets, 0 rejected', out.getvalue())
+        self.assertEqual(out.getvalue().count('rows processed'), 3)
+
+
+class RequestMembershipTestCase(MainTenantTestCase):
+    def setUp(self):
+        super().setUp()
+
+        self.manager = User.objects.create_user(username='mgr', email='m@test.com', password='pw', role='manager')
+        self.dev = User.objects.create_user(username='dev', email='d@test.com', password='pw', role='employee')
+        self.peer = User.objects.create_user(username='peer', email='p@test.com', password='pw', role='employee')
+        self.outsider = User.objects.create_user(username='out', email='o@test.com', password='pw', role='employee')
+        self.project = Project.objects.create(name='Payments', created_by=self.manager)
+        self.project.members.add(self.dev, self.peer)
+        self.ticket = Ticket.objects.create(
+            title='Refunds', description='x', project=self.project, created_by=self.manager,
+        )
+
+    def _action(self, name, user, payload=None):
+        request = APIRequestFactory().post(
+            f'/api/tickets/tickets/{self.ticket.pk}/{name}/', payload or {}, format='json'
+        )
+        force_authenticate(request, user=user)
+        with CaptureQueriesContext(connection) as queries:
+            response = TicketViewSet.as_view({'post': name})(request, id=self.ticket.pk)
+        membership_sql = [
+            q['sql'] for q in queries.captured_queries
+            if 'project_members' in q['sql'] and not q['sql'].startswith('SET search_path')
+        ]
+        return response, membership_sql
+
+    def test_assign_loads_each_membership_once(self):
+        response, membership_sql = self._action('assign_ticket', self.dev, {'user_id': self.peer.pk})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data['assignees'], [self.peer.pk])
+        # The requester's project ids (shared by get_object and the check), then the project's members.
+        self.assertEqual(len(membership_sql), 2)
+
+    def test_assign_rejects_non_member_target(self):
+        response, _ = self._action('assign_ticket', self.dev, {'user_id': self.outsider.pk})
+        self.assertEqual(response.status_code, 400)
+        self.assertFalse(self.ticket.assignees.exists())
+
+    def test_self_assign_reuses_membership(self):
+        response, membership_sql = self._action('self_assign', self.dev)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(membership_sql), 1)
+
+        response, _ = self._action('self_assign', self.outsider)
+        self.assertEqual(response.status_code, 404)
+
+    def test_assignee_without_membership_keeps_ticket_access(self):
+        self.ticket.assignees.add(self.outsider)
+        ticket = Ticket.objects.prefetch_related('assignees').select_related('project').get(pk=self.ticket.pk)
+        membership = ProjectMembership(self.outsider)
+        self.assertFalse(membership.is_member(self.project.pk))
+        with self.assertNumQueries(0):
+            self.assertTrue(user_can_access_ticket(self.outsider, ticket, membership=membership))
+
+
+class TicketSerializerQueryCountTestCase(MainTenantTestCase):
+    def setUp(self):
+        super().setUp()
+
+        self.manager = User.objects.create_user(username='mgr', email='m@test.com', password='pw', role='manager')
+        self.dev = User.objects.create_user(username='dev', email='d@test.com', password='pw', role='employee')
+        self.project = Project.objects.create(name='Payments', created_by=self.manager)
+        self.project.members.add(self.dev)
+
+    def _add_tickets(self, count):
+        for i in range(count):
+            ticket = Ticket.objects.create(
+                title=f'T{i}', description='x', project=self.project, created_by=self.manager,
+            )
+            ticket.assignees.add(self.dev, self.manager)
+            comment = Comment.objects.create(ticket=ticket, author=self.dev, content='Looks good')
+            TicketMedia.objects.create(
+                ticket=ticket, file='t/log.txt', file_name='log.txt', file_type='document',
+                file_size=1, uploaded_by=self.dev,
+            )
+            TicketMedia.objects.create(
+                ticket=ticket, comment=comment, file='t/shot.png', file_name='shot.png',
+                file_type='image', file_size=1, uploaded_by=self.manager,
+            )
+        return ticket
+
+    def _queries(self, action, user, **kwargs):
+        request = APIRequestFactory().get('/api/tickets/tickets/')
+        force_authenticate(request, user=user)
+        with CaptureQueriesContext(connection) as queries:
+            response = TicketViewSet.as_view({'get': action})(request, **kwargs)
+            response.render()
+        self.assertEqual(response.status_code, 200)
+        count = sum(1 for q in queries.captured_queries if not q['sql'].startswith('SET search_path'))
+        return response, count
+
+    def test_list_query_count_does_not_grow_with_rows(self):
+        self._add_tickets(2)
+        _, few = self._queries('list', self.dev)
+        self._add_tickets(8)
+        response, many = self._queries('list', self.dev)
+        self.assertEqual(response.data['count'], 10)
+        self.assertEqual(many, few)
+        self.assertEqual(sorted(response.data['results'][0]['assignees']), sorted([self.dev.pk, self.manager.pk]))
+
+    def test_detail_and_comments_query_counts_do_not_grow_with_children(self):
+        ticket = self._add_tickets(1)
+        _, detail_few = self._queries('retrieve', self.dev, id=ticket.pk)
+        _, comments_few = self._queries('comments', self.dev, id=ticket.pk)
+        for _ in range(4):
+            Comment.objects.create(ticket=ticket, author=self.manager, content='More')
+            TicketMedia.objects.create(
+                ticket=ticket, file='t/more.txt', file_name='more.txt', file_type='document',
+                file_size=1, uploaded_by=self.manager,
+            )
+
+        response, detail_many = self._queries('retrieve', self.dev, id=ticket.pk)
+        self.assertEqual(detail_many, detail_few)
+        self.assertEqual(len(response.data['media_files']), 5)
+        self.assertEqual(len(response.data['comments']), 5)
+        self.assertEqual(response.data['media_files'][0]['uploaded_by_username'], str(self.manager))
+
+        response, comments_many = self._queries('comments', self.dev, id=ticket.pk)
+        self.assertEqual(comments_many, comments_few)
+        self.assertEqual([c['user_name'] for c in response.data][:2], ['dev', 'mgr'])
@@ -6,24 +6,37 @@ from rest_framework.exceptions import ValidationError, PermissionDenied
 from django_filters.rest_framework import DjangoFilterBackend
 from django_filters import FilterSet, NumberFilter
 import django_filters
-from django.db.models import Q, Count
+from collections import defaultdict
+
+from django.contrib.postgres.aggregates import ArrayAgg
+from django.db.models import Q, Count, F, Prefetch, Value
 from django.utils import timezone
 
 from apps.users.models import User
-from apps.notifications.services import notify_ticket_assigned
+from apps.projects.models import ProjectMember
+from apps.notifications.services import notify_ticket_assigned, notify_tickets_assigned
 from apps.comments.models import Comment
 from apps.comments.utils import notify_comment_mentions
 from apps.timelogs.models import WorkLog
-from apps.activity.utils import log_activity
-from apps.core.access import user_can_create_ticket_on_project
+from apps.activity.utils import log_activities, log_activity
+from apps.core.access import (
+    accessible_ticket_ids_for_user,
+    request_membership,
+    ticket_has_assignee,
+    user_can_create_ticket_on_project,
+)
+from apps.core.exports import export_format, stream_export
 
+from .importer import MAX_REPORTED_ERRORS, TicketImporter, TicketImportError, import_format_for, read_import_rows
 from .models import Ticket, TicketMedia
+from .quick_open import quick_open_tickets, remember_recent_ticket
 from .serializers import (
     TicketSerializer,
     TicketListSerializer,
     TicketCreateSerializer,
     TicketUpdateSerializer,
     TicketStatusSerializer,
+    TicketBulkUpdateSerializer,
     TicketCommentSerializer,
     TicketMediaSerializer,
     validate_file,
@@ -32,6 +45,26 @@ from .serializers import (
 )
 
 LIST_ACTIONS = frozenset({'list', 'my_tickets', 'by_project'})
+# Detail actions that never serialize the ticket itself, so get_object() skips the prefetches.
+TICKET_ONLY_ACTIONS = frozenset({'destroy', 'upload_media', 'delete_media', 'comments'})
+
+# Export column -> key in the `values()` row.
+TICKET_EXPORT_COLUMNS = {
+    'ticket_id': 'ticket_id',
+    'title': 'title',
+    'type': 'type',
+    'priority': 'priority',
+    'status': 'status',
+    'project': 'project_name',
+    'created_by': 'created_by_username',
+    'assignees': 'assignee_usernames',
+    'created_at': 'created_at',
+    'updated_at': 'updated_at',
+    'in_progress_at': 'in_progress_at',
+    'qa_at': 'qa_at',
+    'closed_at': 'closed_at',
+    'due_date': 'due_date',
+}
 
 
 # ---------------------------------------------------------------------------
@@ -71,7 +104,24 @@ class IsCreatorOrManagerOrAdmin(IsAuthenticated):
         user = request.user
         if user.role in ['admin', 'manager']:
             return True
-        return obj.created_by == user
+        return obj.created_by_id == user.id
+
+
+# ---------------------------------------------------------------------------
+# Querysets
+# ---------------------------------------------------------------------------
+
+def _media_with_uploader():
+    return TicketMedia.objects.select_related('uploaded_by')
+
+
+def _comments_for_serializer():
+    """Comments with everything TicketCommentSerializer reads, so serializing adds no queries."""
+    return (
+        Comment.objects
+        .select_related('author')
+        .prefetch_related(Prefetch('media_files', queryset=_media_with_uploader()))
+    )
 
 
 # ---------------------------------------------------------------------------
@@ -109,24 +159,32 @@ class TicketViewSet(viewsets.ModelViewSet):
         if user.role == 'admin':
             return base_qs.all()
 
+        # Memberships come from the request's ProjectMembership, which the
+        # actions below reuse for their own checks.
+        project_ids = request_membership(self.request).project_ids
+
         if user.role == 'manager':
             return base_qs.filter(
-                Q(project__created_by=user) |
-                Q(project__members=user)    |
-                Q(assignees=user)           |
+                Q(project__created_by=user)   |
+                Q(project_id__in=project_ids) |
+                Q(assignees=user)             |
                 Q(created_by=user)
             ).distinct()
 
         # Employee
         return base_qs.filter(
-            Q(assignees=user)       |
-            Q(project__members=user) |
+            Q(assignees=user)             |
+            Q(project_id__in=project_ids) |
             Q(created_by=user)
         ).distinct()
 
     def _queryset_for_action(self):
+        if self.action == 'export':
+            return Ticket.objects.all()
         if self.action in LIST_ACTIONS:
             return self._ticket_list_queryset()
+        if self.action in TICKET_ONLY_ACTIONS:
+            return Ticket.objects.select_related('project')
         return self._ticket_detail_queryset()
 
     def _ticket_list_queryset(self):
@@ -149,7 +207,11 @@ class TicketViewSet(viewsets.ModelViewSet):
             Ticket.objects
             .select_related('project', 'created_by')
             .select_related('github_link')
-            .prefetch_related('assignees', 'media_files', 'comments__author', 'comments__media_files')
+            .prefetch_related(
+                'assignees',
+                Prefetch('media_files', queryset=_media_with_uploader()),
+                Prefetch('comments', queryset=_comments_for_serializer()),
+            )
         )
 
     def filter_queryset(self, queryset):
@@ -204,16 +266,20 @@ class TicketViewSet(viewsets.ModelViewSet):
         ticket = self.get_object()
         try:
             from apps.integrations.services.github_sync import pull_github_issue_state_for_ticket
-            pull_github_issue_state_for_ticket(ticket)
+            synced = pull_github_issue_state_for_ticket(ticket)
         except Exception:
-            pass
-        ticket = self._ticket_detail_queryset().get(pk=ticket.pk)
+            synced = False
+        if synced:
+            ticket = self._ticket_detail_queryset().get(pk=ticket.pk)
+        remember_recent_ticket(request.user, ticket.pk)
         serializer = self.get_serializer(ticket)
         return Response(serializer.data)
 
     def perform_create(self, serializer):
         project = serializer.validated_data['project']
-        if not user_can_create_ticket_on_project(self.request.user, project):
+        if not user_can_create_ticket_on_project(
+            self.request.user, project, membership=request_membership(self.request)
+        ):
             raise PermissionDenied('You must be a project member to create tickets on this project.')
 
         ticket = serializer.save(created_by=self.request.user)
@@ -467,10 +533,302 @@ class TicketViewSet(viewsets.ModelViewSet):
         result['total'] = sum(result[key] for key in TICKET_STATUS_KEYS)
         return Response(result)
 
+    # ------------------------------------------------------------------
+    # Bulk operations
+    # ------------------------------------------------------------------
+
+    @action(detail=False, methods=['post'], url_path='bulk')
+    def bulk(self, request):
+        """
+        Apply one status / priority / assignment change to many tickets.
+
+        Body: {"ids": [...], "status"?, "priority"?, "assign"?: [user_id], "unassign"?: [user_id]}
+        Every ticket is checked with the same rules as the single-ticket actions
+        before anything is written; if any fails, nothing changes and the
+        per-ticket errors are returned.
+        """
+        serializer = TicketBulkUpdateSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        data         = serializer.validated_data
+        user         = request.user
+        new_status   = data.get('status')
+        new_priority = data.get('priority')
+        assign_ids   = set(data['assign'])
+        unassign_ids = set(data['unassign'])
+
+        tickets = list(
+            Ticket.objects
+            .filter(pk__in=data['ids'])
+            .filter(pk__in=accessible_ticket_ids_for_user(user))
+            .select_related('project')
+        )
+        targets = User.objects.in_bulk(assign_ids | unassign_ids)
+        missing_users = (assign_ids | unassign_ids) - set(targets)
+        if missing_users:
+            return Response(
+                {'error': f'Users not found: {sorted(missing_users)}'},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        Assignee = Ticket.assignees.through
+        assignees_by_ticket = defaultdict(set)
+        for ticket_id, user_id in Assignee.objects.filter(ticket__in=tickets).values_list('ticket_id', 'user_id'):
+            assignees_by_ticket[ticket_id].add(user_id)
+
+        members_by_project = defaultdict(set)
+        memberships = ProjectMember.objects.filter(project_id__in={t.project_id for t in tickets})
+        for project_id, user_id in memberships.values_list('project_id', 'user_id'):
+            members_by_project[project_id].add(user_id)
+
+        errors = {pk: ['Ticket not found.'] for pk in set(data['ids']) - {t.pk for t in tickets}}
+        for ticket in tickets:
+            problems = self._bulk_ticket_problems(
+                ticket,
+                user=user,
+                new_status=new_status,
+                new_priority=new_priority,
+                assign=[targets[pk] for pk in assign_ids],
+                unassign_ids=unassign_ids,
+                members=members_by_project[ticket.project_id],
+                assignee_ids=assignees_by_ticket[ticket.pk],
+            )
+            if problems:
+                errors[ticket.pk] = problems
+        if errors:
+            return Response(
+                {'error': 'No tickets were updated.', 'errors': errors},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        now            = timezone.now()
+        old_status     = {t.pk: t.status for t in tickets}
+        old_priority   = {t.pk: t.priority for t in tickets}
+        status_changes = {t.pk: new_status for t in tickets if new_status and t.status != new_status}
+        activities     = []
+
+        # Assignments: reopening a closed ticket clears its assignees first, as in update_status.
+        reopened = [pk for pk in status_changes if old_status[pk] == 'closed' and new_status == 'reopened']
+        if reopened:
+            Assignee.objects.filter(ticket_id__in=reopened).delete()
+            for pk in reopened:
+                assignees_by_ticket[pk] = set()
+        if unassign_ids:
+            Assignee.objects.filter(ticket__in=tickets, user_id__in=unassign_ids).delete()
+        new_assignments = [
+            (targets[user_id], ticket)
+            for ticket in tickets
+            for user_id in assign_ids
+            if user_id not in assignees_by_ticket[ticket.pk]
+        ]
+        Assignee.objects.bulk_create(
+            [Assignee(ticket_id=ticket.pk, user_id=target.pk) for target, ticket in new_assignments],
+            ignore_conflicts=True,
+        )
+
+        # Work logs, mirroring _handle_work_log_on_status_change.
+        closing = [pk for pk in status_changes if new_status == 'closed']
+        ended_logs = list(WorkLog.objects.filter(ticket_id__in=closing, end_time__isnull=True).select_related('user'))
+        for log in ended_logs:
+            log.end_time = now
+            log.duration_minutes = int((now - log.start_time).total_seconds() / 60)
+        WorkLog.objects.bulk_update(ended_logs, ['end_time', 'duration_minutes'])
+
+        starting = [
+            pk for pk in status_changes
+            if new_status == 'in_progress' and old_status[pk] in ['new', 'reopened']
+        ]
+        busy = set(
+            WorkLog.objects.filter(ticket_id__in=starting, end_time__isnull=True).values_list('ticket_id', flat=True)
+        )
+        WorkLog.objects.bulk_create([
+            WorkLog(ticket_id=pk, user=user, start_time=now) for pk in starting if pk not in busy
+        ])
+
+        for ticket in tickets:
+            if ticket.pk in status_changes:
+                ticket.status = new_status
+            if new_priority:
+                ticket.priority = new_priority
+            ticket.updated_at = now
+        Ticket.objects.bulk_update(tickets, ['status', 'priority', 'updated_at'])
+
+        by_pk = {t.pk: t for t in tickets}
+        for log in ended_logs:
+            activities.append({
+                'action': 'work_log', 'user': log.user, 'instance': by_pk[log.ticket_id],
+                'description': f"Work session ended (ticket closed) - {log.duration_minutes} minutes logged",
+            })
+        for pk in starting:
+            if pk not in busy:
+                activities.append({
+                    'action': 'work_log', 'user': user, 'instance': by_pk[pk],
+                    'description': "Work session started",
+                })
+        for pk in reopened:
+            activities.append({
+                'action': 'status_change', 'user': user, 'instance': by_pk[pk],
+                'description': "Ticket reopened - assignees cleared, ready for new assignment",
+            })
+        for ticket in tickets:
+            if ticket.pk in status_changes:
+                activities.append({
+                    'action': 'status_change', 'user': user, 'instance': ticket,
+                    'description': (
+                        f"Changed ticket {ticket.ticket_id} status from "
+                        f"'{old_status[ticket.pk]}' to '{new_status}'"
+                    ),
+                    'extra_data': {'old_status': old_status[ticket.pk], 'new_status': new_status},
+                })
+            if new_priority and old_priority[ticket.pk] != new_priority:
+                activities.append({
+                    'action': 'update', 'user': user, 'instance': ticket,
+                    'description': (
+                        f"Updated ticket {ticket.ticket_id}: priority from "
+                        f"'{old_priority[ticket.pk]}' to '{new_priority}'"
+                    ),
+                })
+            for user_id in unassign_ids & assignees_by_ticket[ticket.pk]:
+                activities.append({
+                    'action': 'update', 'user': user, 'instance': ticket,
+                    'description': f"Removed {targets[user_id].username} from ticket {ticket.ticket_id}",
+                })
+        for target, ticket in new_assignments:
+            activities.append({
+                'action': 'update', 'user': user, 'instance': ticket,
+                'description': f"Assigned ticket {ticket.ticket_id} to {target.username}",
+            })
+        log_activities(activities)
+
+        notify_tickets_assigned(assignments=new_assignments, assigned_by=user)
+
+        content_changed = [pk for pk in old_priority if new_priority and old_priority[pk] != new_priority]
+        tenant = getattr(request, 'tenant', None)
+        if tenant is not None and (status_changes or content_changed):
+            from apps.integrations.tasks import sync_tickets_to_github_task
+            from apps.notifications.email_utils import get_frontend_base_url
+            sync_tickets_to_github_task.delay(
+                tenant.schema_name,
+                status_changes,
+                content_changed,
+                get_frontend_base_url(request),
+            )
+
+        updated = self._ticket_list_queryset().filter(pk__in=by_pk)
+        return Response({
+            'updated': len(tickets),
+            'tickets': TicketListSerializer(updated, many=True, context=self.get_serializer_context()).data,
+        })
+
+    def _bulk_ticket_problems(
+        self, ticket, *, user, new_status, new_priority, assign, unassign_ids, members, assignee_ids,
+    ) -> list:
+        """Per-ticket checks for bulk(), matching the single-ticket actions' rules."""
+        problems            = []
+        is_manager_or_admin = user.role in ['admin', 'manager']
+        is_creator          = ticket.created_by_id == user.id
+
+        if new_priority and not (is_manager_or_admin or is_creator):
+            problems.append('Only the ticket creator, managers or admins can change priority.')
+
+        if assign:
+            if not (is_manager_or_admin or is_creator or user.id in members):
+                problems.append('Only project members, managers, admins, or ticket creators can assign tickets.')
+            for target in assign:
+                if target.id not in members and target.role not in ['admin', 'manager']:
+                    problems.append(f'{target.username} is not a member of this project.')
+
+        if unassign_ids - {user.id} and not (is_manager_or_admin or is_creator):
+            problems.append('Only managers or ticket creators can remove other assignees.')
+
+        if new_status and new_status != ticket.status:
+            valid_transitions = self._get_valid_transitions(ticket.status)
+            final_assignees = (
+                set() if new_status == 'reopened' and ticket.status == 'closed' else set(assignee_ids)
+            )
+            final_assignees = (final_assignees | {target.id for target in assign}) - unassign_ids
+            if new_status not in valid_transitions:
+                problems.append(
+                    f"Cannot transition from '{ticket.status}' to '{new_status}'. "
+                    f"Valid transitions: {valid_transitions}"
+                )
+            elif new_status == 'in_progress' and not final_assignees:
+                problems.append('Cannot move to In Progress without an assignee. Please assign the ticket first.')
+
+        return problems
+
     # ------------------------------------------------------------------
     # Assignment actions
     # ------------------------------------------------------------------
 
+    @action(detail=False, methods=['get'], url_path='quick-open')
+    def quick_open(self, request):
+        """Top fuzzy matches on ticket_id/title for the quick-open palette (?q=&limit=)."""
+        try:
+            limit = min(max(int(request.query_params.get('limit', 10)), 1), 25)
+        except ValueError:
+            limit = 10
+        return Response(quick_open_tickets(request.user, request.query_params.get('q', ''), limit=limit))
+
+    @action(detail=False, methods=['get'])
+    def export(self, request):
+        """Stream every visible ticket matching the list filters (?file_format=csv|jsonl)."""
+        fmt = export_format(request)
+        visible = self.filter_queryset(self.get_queryset())
+        # Aggregate over a fresh queryset: the visibility filter may already join
+        # assignees (on the requesting user), which ArrayAgg would otherwise reuse.
+        rows = (
+            Ticket.objects.filter(pk__in=visible.values('pk'))
+            .order_by(*(visible.query.order_by or Ticket._meta.ordering))
+            .annotate(
+                project_name=F('project__name'),
+                created_by_username=F('created_by__username'),
+                assignee_usernames=ArrayAgg(
+                    'assignees__username',
+                    distinct=True,
+                    ordering='assignees__username',
+                    filter=Q(assignees__isnull=False),
+                    default=Value([]),
+                ),
+            )
+            .values(*TICKET_EXPORT_COLUMNS.values())
+        )
+        return stream_export(
+            rows,
+            columns=TICKET_EXPORT_COLUMNS,
+            fmt=fmt,
+            filename='tickets',
+        )
+
+    @action(detail=False, methods=['post'], url_path='import')
+    def import_tickets(self, request):
+        """
+        Admin-only bulk import of a CSV/JSONL `file` (see the import_tickets command
+        for columns). Pass `notify=true` to send assignment notifications and
+        `dry_run=true` to only validate.
+        """
+        if request.user.role != 'admin':
+            raise PermissionDenied('Only admins can import tickets.')
+        upload = request.FILES.get('file')
+        if upload is None:
+            return Response({'error': 'Upload a CSV or JSONL file as "file".'}, status=status.HTTP_400_BAD_REQUEST)
+
+        truthy = {'1', 'true', 'yes', 'on'}
+        importer = TicketImporter(
+            imported_by=request.user,
+            notify=str(request.data.get('notify', '')).lower() in truthy,
+            dry_run=str(request.data.get('dry_run', '')).lower() in truthy,
+        )
+        fmt = request.data.get('file_format') or import_format_for(upload.name)
+        try:
+            result = importer.run(read_import_rows(upload.file, fmt))
+        except (TicketImportError, UnicodeDecodeError) as exc:
+            return Response({'error': str(exc)}, status=status.HTTP_400_BAD_REQUEST)
+
+        payload = result.as_dict()
+        payload['errors_truncated'] = result.failed > MAX_REPORTED_ERRORS
+        created = result.created and not importer.dry_run
+        return Response(payload, status=status.HTTP_201_CREATED if created else status.HTTP_200_OK)
+
     @action(detail=False, methods=['get'])
     def my_tickets(self, request):
         """Get tickets assigned to the current user."""
@@ -516,9 +874,10 @@ class TicketViewSet(viewsets.ModelViewSet):
         except User.DoesNotExist:
             return Response({'error': 'User not found'}, status=status.HTTP_404_NOT_FOUND)
 
+        membership          = request_membership(request)
         is_manager_or_admin = user.role in ['admin', 'manager']
         is_creator          = ticket.created_by_id == user.id
-        is_project_member   = ticket.project.members.filter(id=user.id).exists()
+        is_project_member   = membership.is_member(ticket.project_id)
 
         if not is_manager_or_admin and not is_creator and not is_project_member:
             return Response(
@@ -527,8 +886,8 @@ class TicketViewSet(viewsets.ModelViewSet):
             )
 
         target_is_member = (
-            ticket.project.members.filter(id=target_user.id).exists()
-            or target_user.role in ['admin', 'manager']
+            target_user.role in ['admin', 'manager']
+            or membership.user_is_member(target_user.id, ticket.project_id)
         )
         if not target_is_member:
             return Response(
@@ -536,7 +895,7 @@ class TicketViewSet(viewsets.ModelViewSet):
                 status=status.HTTP_400_BAD_REQUEST,
             )
 
-        if ticket.assignees.filter(id=target_user.id).exists():
+        if ticket_has_assignee(ticket, target_user.id):
             return Response(TicketSerializer(ticket).data)
 
         ticket.assignees.add(target_user)
@@ -601,8 +960,8 @@ class TicketViewSet(viewsets.ModelViewSet):
         ticket    = self.get_object()
         user      = request.user
         is_member = (
-            ticket.project.members.filter(id=user.id).exists()
-            or user.role in ['admin', 'manager']
+            user.role in ['admin', 'manager']
+            or request_membership(request).is_member(ticket.project_id)
         )
         if not is_member:
             return Response(
@@ -631,8 +990,8 @@ class TicketViewSet(viewsets.ModelViewSet):
         ticket    = self.get_object()
         user      = request.user
         is_member = (
-            ticket.project.members.filter(id=user.id).exists()
-            or user.role in ['admin', 'manager']
+            user.role in ['admin', 'manager']
+            or request_membership(request).is_member(ticket.project_id)
         )
         if not is_member:
             return Response(
@@ -710,11 +1069,7 @@ class TicketViewSet(viewsets.ModelViewSet):
         ticket = self.get_object()
 
         if request.method == 'GET':
-            comments = (
-                Comment.objects.filter(ticket=ticket)
-                .prefetch_related('media_files')
-                .order_by('created_at')
-            )
+            comments = _comments_for_serializer().filter(ticket=ticket).order_by('created_at')
             serializer = TicketCommentSerializer(
                 comments,
                 many=True,
@@ -763,7 +1118,7 @@ class TicketViewSet(viewsets.ModelViewSet):
         if content:
             notify_comment_mentions(request.user, ticket, content)
 
-        comment = Comment.objects.prefetch_related('media_files').get(pk=comment.pk)
+        comment = _comments_for_serializer().get(pk=comment.pk)
         return Response(
             TicketCommentSerializer(comment, context=self.get_serializer_context()).data,
             status=status.HTTP_201_CREATED,
@@ -0,0 +1,74 @@
+import resource
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+from django_tenants.utils import schema_context
+
+from apps.core.exports import iter_export_rows
+from apps.tickets.models import Ticket
+from apps.timelogs.models import WorkLog
+from apps.timelogs.serializers import WorkLogSerializer
+from apps.timelogs.views import WORKLOG_EXPORT_COLUMNS
+
+GENERATE_WORKLOGS_SQL = """
+INSERT INTO work_logs (ticket_id, user_id, start_time, end_time, duration_minutes, notes, created_at)
+SELECT %s, %s,
+       now() - make_interval(mins => g),
+       now() - make_interval(mins => g) + interval '45 minutes',
+       45, 'Benchmark session ' || g, now()
+FROM generate_series(1, %s) AS g
+"""
+
+
+class Command(BaseCommand):
+    help = (
+        'Measure the streaming work log export against synthetic rows, next to the '
+        'paginated serializer path it replaces. Rows are rolled back afterwards.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--schema', required=True, help='Tenant schema to benchmark in.')
+        parser.add_argument('--rows', type=int, default=1_000_000)
+        parser.add_argument('--format', dest='fmt', choices=['csv', 'jsonl'], default='csv')
+        parser.add_argument(
+            '--serializer-sample', type=int, default=20_000,
+            help='Rows pushed through WorkLogSerializer for the baseline (0 to skip).',
+        )
+
+    def handle(self, *args, **options):
+        rows = options['rows']
+        with schema_context(options['schema']), transaction.atomic():
+            ticket = Ticket.objects.first()
+            if ticket is None:
+                raise CommandError('The benchmark needs at least one ticket in the tenant.')
+
+            started = time.perf_counter()
+            with connection.cursor() as cursor:
+                cursor.execute(GENERATE_WORKLOGS_SQL, [ticket.pk, ticket.created_by_id, rows])
+                cursor.execute('ANALYZE work_logs')
+            self.stdout.write(f'Inserted {rows} work logs in {time.perf_counter() - started:.1f}s')
+
+            queryset = WorkLog.objects.order_by('start_time', 'id').values(*WORKLOG_EXPORT_COLUMNS.values())
+            rss_before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+            started = time.perf_counter()
+            size = 0
+            for chunk in iter_export_rows(queryset.iterator(chunk_size=2000), WORKLOG_EXPORT_COLUMNS, options['fmt']):
+                size += len(chunk)
+            elapsed = time.perf_counter() - started
+            rss_growth = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss - rss_before
+            self.stdout.write(
+                f'Streaming {options["fmt"]}: {elapsed:.1f}s, {rows / elapsed:,.0f} rows/s, '
+                f'{size / 2**20:.0f} MiB written, peak RSS growth {rss_growth / 1024:.1f} MiB',
+            )
+
+            sample = min(options['serializer_sample'], rows)
+            if sample:
+                started = time.perf_counter()
+                WorkLogSerializer(WorkLog.objects.select_related('user', 'ticket')[:sample], many=True).data
+                elapsed = time.perf_counter() - started
+                self.stdout.write(
+                    f'Serializer baseline: {sample} rows in {elapsed:.1f}s, {sample / elapsed:,.0f} rows/s',
+                )
+
+            transaction.set_rollback(True)
@@ -1,11 +1,16 @@
+import csv
+import io
+
 from django.test import TestCase
 from django.utils import timezone
-from rest_framework.test import APIClient
+from rest_framework.test import APIClient, APIRequestFactory, force_authenticate
 from rest_framework import status
+from apps.core.testing import MainTenantTestCase
 from apps.users.models import User
 from apps.projects.models import Project
 from apps.tickets.models import Ticket
 from apps.timelogs.models import WorkLog
+from apps.timelogs.views import WorkLogViewSet
 
 
 class WorkLogAPITestCase(TestCase):
@@ -234,4 +239,33 @@ class WorkLogAPITestCase(TestCase):
         
         self.client.force_authenticate(user=outsider)
         response = self.client.post(f'/api/tickets/{self.ticket.id}/start_work/')
-        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
\ No newline at end of file
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+
+class WorkLogExportTestCase(MainTenantTestCase):
+    def setUp(self):
+        super().setUp()
+
+        self.manager = User.objects.create_user(username='mgr', email='m@test.com', password='pw', role='manager')
+        self.dev = User.objects.create_user(username='dev', email='d@test.com', password='pw', role='employee')
+        project = Project.objects.create(name='Payments', created_by=self.manager)
+        project.members.add(self.dev)
+        ticket = Ticket.objects.create(title='Refunds', description='x', project=project, created_by=self.manager)
+        now = timezone.now()
+        for user in (self.manager, self.dev):
+            WorkLog.objects.create(ticket=ticket, user=user, start_time=now, end_time=now + timezone.timedelta(minutes=30))
+
+    def _export(self, user):
+        request = APIRequestFactory().get('/api/timelogs/worklogs/export/')
+        force_authenticate(request, user=user)
+        response = WorkLogViewSet.as_view({'get': 'export'})(request)
+        return list(csv.DictReader(io.StringIO(b''.join(response.streaming_content).decode())))
+
+    def test_employee_exports_only_own_logs(self):
+        rows = self._export(self.dev)
+        self.assertEqual([row['user'] for row in rows], ['dev'])
+        self.assertEqual(rows[0]['duration_minutes'], '30')
+        self.assertEqual(rows[0]['ticket_title'], 'Refunds')
+
+    def test_manager_exports_team_logs(self):
+        self.assertEqual(sorted(row['user'] for row in self._export(self.manager)), ['dev', 'mgr'])
@@ -9,6 +9,19 @@ from .models import WorkLog
 from .serializers import WorkLogSerializer, WorkLogCreateSerializer, WorkLogUpdateSerializer
 from apps.activity.utils import log_activity
 from apps.core.access import get_accessible_ticket, accessible_ticket_ids_for_user
+from apps.core.exports import export_format, stream_export
+
+# Export column -> key in the `values()` row.
+WORKLOG_EXPORT_COLUMNS = {
+    'id': 'id',
+    'ticket_id': 'ticket__ticket_id',
+    'ticket_title': 'ticket__title',
+    'user': 'user__username',
+    'start_time': 'start_time',
+    'end_time': 'end_time',
+    'duration_minutes': 'duration_minutes',
+    'notes': 'notes',
+}
 
 
 class IsWorkLogOwnerOrAdmin(IsAuthenticated):
@@ -244,3 +257,17 @@ class WorkLogViewSet(viewsets.ModelViewSet):
         logs = WorkLog.objects.filter(user=request.user).order_by('-start_time')
         serializer = WorkLogSerializer(logs, many=True)
         return Response(serializer.data)
+
+    @action(detail=False, methods=['get'])
+    def export(self, request):
+        """Stream visible work logs (?file_format=csv|jsonl&start_date=&end_date=)."""
+        fmt = export_format(request)
+        queryset = self.get_queryset()
+        start_date = request.query_params.get('start_date')
+        end_date = request.query_params.get('end_date')
+        if start_date:
+            queryset = queryset.filter(start_time__date__gte=start_date)
+        if end_date:
+            queryset = queryset.filter(start_time__date__lte=end_date)
+        rows = queryset.order_by('start_time', 'id').values(*WORKLOG_EXPORT_COLUMNS.values())
+        return stream_export(rows, columns=WORKLOG_EXPORT_COLUMNS, fmt=fmt, filename='worklogs')
@@ -1,6 +1,62 @@
+from django.conf import settings
+from django.contrib.auth import get_user_model
 from django.db import connection
+from django.utils.functional import SimpleLazyObject
+from django_tenants.utils import schema_context
 from rest_framework_simplejwt.authentication import JWTAuthentication
-from rest_framework_simplejwt.exceptions import InvalidToken
+from rest_framework_simplejwt.exceptions import AuthenticationFailed, InvalidToken
+from rest_framework_simplejwt.settings import api_settings
+
+from .user_state import get_user_state
+
+
+def _load_user(user_id, schema_name):
+    from .models import User
+
+    with schema_context(schema_name):
+        return User.objects.get(pk=user_id)
+
+
+class TenantTokenUser(SimpleLazyObject):
+    """
+    request.user when JWT_LIGHTWEIGHT_USER is on.
+
+    `id`, `pk`, `username`, `role` and `is_active` come from the access token
+    and the user-state cache. Touching anything else, including isinstance()
+    checks and passing the user to an ORM filter, loads the real User once and
+    behaves exactly like it from then on.
+    """
+
+    def __init__(self, *, user_id, username, role, schema_name):
+        self.__dict__['_token_fields'] = {'id': user_id, 'username': username, 'role': role}
+        super().__init__(lambda: _load_user(user_id, schema_name))
+
+    @property
+    def id(self):
+        return self.__dict__['_token_fields']['id']
+
+    @property
+    def pk(self):
+        return self.id
+
+    @property
+    def username(self):
+        return self.__dict__['_token_fields']['username']
+
+    @property
+    def role(self):
+        return self.__dict__['_token_fields']['role']
+
+    # Only active users are ever authenticated.
+    is_active = True
+    is_authenticated = True
+    is_anonymous = False
+
+    def is_admin(self):
+        return self.role == 'admin'
+
+    def is_manager(self):
+        return self.role == 'manager'
 
 
 class TenantJWTAuthentication(JWTAuthentication):
@@ -28,4 +84,24 @@ class TenantJWTAuthentication(JWTAuthentication):
     def get_user(self, validated_token):
         if validated_token.get('auth_type') == 'platform':
             raise InvalidToken('Platform token cannot be used on tenant routes.')
-        return super().get_user(validated_token)
+        if not settings.JWT_LIGHTWEIGHT_USER:
+            return super().get_user(validated_token)
+
+        try:
+            # simplejwt stores the id as a string; make pk comparisons behave like a loaded user's.
+            user_id = get_user_model()._meta.pk.to_python(validated_token[api_settings.USER_ID_CLAIM])
+        except KeyError as exc:
+            raise InvalidToken('Token contained no recognizable user identification') from exc
+
+        state = get_user_state(user_id)
+        if state is None:
+            raise AuthenticationFailed('User not found', code='user_not_found')
+        if not state['is_active']:
+            raise AuthenticationFailed('User is inactive', code='user_inactive')
+
+        return TenantTokenUser(
+            user_id=user_id,
+            username=validated_token.get('username', ''),
+            role=state['role'],
+            schema_name=connection.schema_name,
+        )
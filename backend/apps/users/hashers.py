@@ -0,0 +1,16 @@
+from django.conf import settings
+from django.contrib.auth.hashers import PBKDF2PasswordHasher
+
+
+class ConfigurablePBKDF2PasswordHasher(PBKDF2PasswordHasher):
+    """
+    PBKDF2-SHA256 with its work factor taken from PASSWORD_HASH_ITERATIONS.
+
+    Keeps the `pbkdf2_sha256` algorithm name, so existing hashes still verify;
+    a hash made with a different iteration count is re-encoded at the configured
+    cost on the user's next successful login (Django's `must_update`).
+    """
+
+    @property
+    def iterations(self):
+        return settings.PASSWORD_HASH_ITERATIONS
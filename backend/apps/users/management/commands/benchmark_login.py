@@ -0,0 +1,55 @@
+import statistics
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.test.utils import CaptureQueriesContext, override_settings
+
+from apps.users.serializers import CustomTokenObtainPairSerializer
+
+
+class Command(BaseCommand):
+    help = (
+        'Time the login path (account lookup, subscription check, password hash, tokens) '
+        'for one account, optionally at several PASSWORD_HASH_ITERATIONS values. '
+        "The account's hash is left at the configured cost when done."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('login', help='Sign-in address, e.g. bench0@bench-0.bench')
+        parser.add_argument('password')
+        parser.add_argument('--runs', type=int, default=10, help='Timed logins per cost.')
+        parser.add_argument(
+            '--iterations',
+            type=int,
+            action='append',
+            help='PBKDF2 iterations to compare (repeatable; default: the configured value).',
+        )
+
+    def _login(self, login, password):
+        serializer = CustomTokenObtainPairSerializer(data={'username': login, 'password': password})
+        valid = serializer.is_valid()
+        connection.set_schema_to_public()
+        if not valid:
+            raise CommandError(f'Login failed: {serializer.errors}')
+
+    def handle(self, *args, **options):
+        login, password = options['login'], options['password']
+        for iterations in options['iterations'] or [settings.PASSWORD_HASH_ITERATIONS]:
+            with override_settings(PASSWORD_HASH_ITERATIONS=iterations):
+                # The first login re-hashes the password at this cost and warms the caches.
+                self._login(login, password)
+                with CaptureQueriesContext(connection) as queries:
+                    self._login(login, password)
+                timings = []
+                for _ in range(options['runs']):
+                    started = time.perf_counter()
+                    self._login(login, password)
+                    timings.append(time.perf_counter() - started)
+            median = statistics.median(timings)
+            self.stdout.write(
+                f'{iterations:>8} iterations: median {median * 1000:.1f}ms, '
+                f'{1 / median:.1f} logins/s per core, {len(queries)} queries'
+            )
+        self._login(login, password)
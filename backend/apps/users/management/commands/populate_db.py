@@ -8,6 +8,7 @@ from apps.customers.services.login_accounts import (
 )
 from apps.customers.services.plans import assign_plan_to_client, ensure_default_plans, get_subscription_display
 from apps.customers.tenant_resolution import internal_domain_for
+from benchmarks.dataset import SCALES, is_populated, populate_schema
 from populate import DEFAULT_TENANT_SCHEMA, main
 
 DEFAULT_MAIN_LOGIN_DOMAIN = 'technest.com'
@@ -16,7 +17,7 @@ DEFAULT_MAIN_LOGIN_DOMAIN = 'technest.com'
 class Command(BaseCommand):
     help = (
         'Populate TicketHub with realistic dummy data inside a tenant schema. '
-        'Use --clear to wipe tenant data first.'
+        'Use --clear to wipe tenant data first, --scale to add bulk synthetic data for load tests.'
     )
 
     def add_arguments(self, parser):
@@ -35,6 +36,12 @@ class Command(BaseCommand):
             default='',
             help=f'Login domain postfix (default: {DEFAULT_MAIN_LOGIN_DOMAIN} for main, else slug.local)',
         )
+        parser.add_argument(
+            '--scale',
+            choices=sorted(SCALES),
+            help='Also add synthetic bench* users, projects and tickets at this size (e.g. large = 50k tickets)',
+        )
+        parser.add_argument('--seed', type=int, default=0, help='Random seed for --scale data')
 
     def handle(self, *args, **options):
         schema_name = options['schema'].strip()
@@ -52,12 +59,23 @@ class Command(BaseCommand):
         self.stdout.write(f'Populating tenant schema: {schema_name}')
         with schema_context(schema_name):
             main(clear=options['clear'])
+            if options['scale']:
+                self._populate_scale(options['scale'], seed=options['seed'])
 
         synced = resync_client_login_accounts(tenant)
         self.stdout.write(self.style.SUCCESS(
             f'Synced {synced} login account(s) (@{tenant.login_domain})'
         ))
 
+    def _populate_scale(self, scale_name: str, *, seed: int):
+        if is_populated():
+            self.stdout.write(f'Synthetic data already present, skipping --scale {scale_name}')
+            return
+        counts = populate_schema(SCALES[scale_name], seed=seed)
+        self.stdout.write(self.style.SUCCESS(
+            f'Added {scale_name} synthetic data: ' + ', '.join(f'{count} {name}' for name, count in counts.items())
+        ))
+
     def _ensure_tenant(self, schema_name: str, *, login_domain: str = ''):
         Tenant = get_tenant_model()
         slug = schema_name.replace('_', '-')
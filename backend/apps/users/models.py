@@ -1,5 +1,7 @@
 from django.contrib.auth.models import AbstractUser
-from django.db import models
+from django.db import connection, models
+
+from .user_state import invalidate_user_state
 
 
 class UserRole(models.Model):
@@ -38,6 +40,10 @@ class User(AbstractUser):
     
     def __str__(self):
         return f"{self.username} ({self.get_role_display()})"
+
+    def save(self, *args, **kwargs):
+        super().save(*args, **kwargs)
+        invalidate_user_state(connection.schema_name, self.pk)
     
     def is_admin(self):
         return self.role == 'admin'
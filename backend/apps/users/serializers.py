@@ -6,7 +6,7 @@ from rest_framework_simplejwt.tokens import RefreshToken
 
 from apps.customers.tenant_resolution import resolve_tenant, set_tenant
 from apps.customers.services.login_accounts import resolve_login_account
-from apps.customers.services.plans import get_subscription_display, sync_subscription_status
+from apps.customers.services.plans import entitlements_expired, get_client_entitlements, sync_subscription_status
 from .models import User, UserRole
 
 
@@ -203,9 +203,9 @@ class CustomTokenObtainPairSerializer(TokenObtainPairSerializer):
                 code='authorization',
             )
 
-        sync_subscription_status(client)
-        subscription = get_subscription_display(client)
-        if subscription is None or subscription.is_effectively_expired:
+        entitlements = get_client_entitlements(client)
+        if not entitlements['subscribed'] or entitlements_expired(entitlements):
+            sync_subscription_status(client)
             raise serializers.ValidationError(
                 {'detail': 'Your subscription has expired. Please contact support to renew.'},
                 code='authorization',
@@ -221,34 +221,15 @@ class CustomTokenObtainPairSerializer(TokenObtainPairSerializer):
                     code='authorization',
                 )
 
-            authenticate_kwargs = {
-                self.username_field: tenant_user.username,
-                'password': attrs['password'],
-            }
-            try:
-                authenticate_kwargs['request'] = self.context['request']
-            except KeyError:
-                pass
-
-            self.user = authenticate(**authenticate_kwargs)
-
-            if not self.user:
-                raise serializers.ValidationError(
-                    {'detail': 'Invalid username or password. Please check your credentials and try again.'},
-                    code='authorization',
-                )
-
-            if self.user.pk != login_account.tenant_user_id:
+            # Check the password on the user already loaded instead of authenticate(),
+            # which would look the same user up again by username. check_password
+            # re-hashes at the configured PASSWORD_HASH_ITERATIONS when needed.
+            if not tenant_user.check_password(attrs['password']) or not tenant_user.is_active:
                 raise serializers.ValidationError(
                     {'detail': 'Invalid username or password. Please check your credentials and try again.'},
                     code='authorization',
                 )
-
-            if not self.user.is_active:
-                raise serializers.ValidationError(
-                    {'detail': 'Your account is inactive. Please contact your administrator.'},
-                    code='authorization',
-                )
+            self.user = tenant_user
 
             refresh = self.get_token(self.user)
             user_data = UserSerializer(self.user).data
@@ -1,13 +1,23 @@
-from django.test import TestCase
+from django.core.cache import cache
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
 from django.contrib.auth import get_user_model
 from django_tenants.utils import get_tenant_model, schema_context
-from rest_framework.test import APIClient
+from rest_framework.exceptions import AuthenticationFailed
+from rest_framework.test import APIClient, APIRequestFactory, force_authenticate
 from rest_framework import status
 
-from apps.customers.models import Domain
+from apps.core.testing import MainTenantTestCase
+from apps.customers.models import Domain, Plan
 from apps.customers.services.login_accounts import register_login_account
+from apps.customers.services.plans import assign_plan_to_client
+from apps.customers.services.tenants import deactivate_client
 from apps.customers.tenant_resolution import internal_domain_for
+from .authentication import TenantJWTAuthentication
+from .management_views import DeactivateUserView
 from .models import User
+from .serializers import CustomTokenObtainPairSerializer, TenantRefreshToken
 
 User = get_user_model()
 
@@ -165,3 +175,100 @@ class AuthenticationTestCase(TestCase):
         self.client.force_authenticate(user=self.employee_user)
         response = self.client.post(f'/api/auth/users/{self.manager_user.id}/deactivate/')
         self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+
+class LoginFastPathTestCase(TestCase):
+    def setUp(self):
+        cache.clear()
+        Tenant = get_tenant_model()
+        self.tenant = Tenant(schema_name='main', name='Main', slug='main', login_domain='main.test', is_active=True)
+        self.tenant.save()
+        assign_plan_to_client(client=self.tenant, plan=Plan.objects.create(name='Basic', tier='standard'))
+        with schema_context('main'):
+            self.user = User.objects.create_user(username='Alice', password='pw-12345')
+        register_login_account(client=self.tenant, user=self.user)
+
+    def _login(self, username='alice@main.test', password='pw-12345'):
+        serializer = CustomTokenObtainPairSerializer(data={'username': username, 'password': password})
+        with CaptureQueriesContext(connection) as queries:
+            valid = serializer.is_valid()
+        connection.set_schema_to_public()
+        return valid, [q['sql'] for q in queries.captured_queries if not q['sql'].startswith('SET search_path')]
+
+    def test_login_loads_the_user_once(self):
+        self._login()
+        valid, queries = self._login(username='ALICE@Main.Test')
+
+        self.assertTrue(valid)
+        self.assertEqual(len([sql for sql in queries if 'FROM "users"' in sql]), 1)
+        self.assertIn('LOWER("customers_tenant_login_account"."username")', queries[0])
+
+    def test_wrong_password_and_inactive_user_are_rejected(self):
+        self.assertFalse(self._login(password='nope')[0])
+        with schema_context('main'):
+            User.objects.filter(pk=self.user.pk).update(is_active=False)
+        self.assertFalse(self._login()[0])
+
+    def test_login_rehashes_to_configured_cost(self):
+        with override_settings(PASSWORD_HASH_ITERATIONS=1000):
+            self.assertTrue(self._login()[0])
+            with schema_context('main'):
+                self.user.refresh_from_db()
+            self.assertTrue(self.user.password.startswith('pbkdf2_sha256$1000$'))
+            self.assertTrue(self._login()[0])
+
+
+class LightweightTokenUserTestCase(MainTenantTestCase):
+    tenant_fields = {'name': 'Main', 'login_domain': 'main.test'}
+
+    def setUp(self):
+        cache.clear()
+        super().setUp()
+        connection.set_tenant(self.tenant)
+        self.admin = User.objects.create_user(username='boss', password='pw-12345', role='admin')
+        self.user = User.objects.create_user(username='dev', password='pw-12345', email='dev@test.com')
+
+    def _authenticate(self, user, token=None):
+        token = token or TenantRefreshToken.for_user(user).access_token
+        request = APIRequestFactory().get('/api/auth/me/', HTTP_AUTHORIZATION=f'Bearer {token}')
+        with override_settings(JWT_LIGHTWEIGHT_USER=True):
+            return TenantJWTAuthentication().authenticate(request)[0]
+
+    def test_token_user_skips_the_users_table(self):
+        token = TenantRefreshToken.for_user(self.user).access_token
+        self._authenticate(self.user, token)
+        with CaptureQueriesContext(connection) as queries:
+            request_user = self._authenticate(self.user, token)
+            self.assertEqual((request_user.pk, request_user.role, request_user.is_active), (self.user.pk, 'employee', True))
+            self.assertFalse(request_user.is_admin())
+        self.assertEqual(len(queries), 0)
+
+        self.assertEqual(request_user.email, 'dev@test.com')
+        self.assertIsInstance(request_user, User)
+        self.assertEqual(request_user, self.user)
+
+    def test_role_change_is_picked_up(self):
+        self._authenticate(self.user)
+        self.user.role = 'manager'
+        with self.captureOnCommitCallbacks(execute=True):
+            self.user.save()
+            self.assertEqual(self._authenticate(self.user).role, 'employee')
+        self.assertEqual(self._authenticate(self.user).role, 'manager')
+
+    def test_deactivate_user_view_revokes(self):
+        self._authenticate(self.user)
+        request = APIRequestFactory().post(f'/api/auth/users/{self.user.pk}/deactivate/')
+        force_authenticate(request, user=self.admin)
+        with self.captureOnCommitCallbacks(execute=True):
+            self.assertEqual(DeactivateUserView.as_view()(request, user_id=self.user.pk).status_code, 200)
+
+        with self.assertRaises(AuthenticationFailed):
+            self._authenticate(self.user)
+
+    def test_deactivate_client_revokes(self):
+        self._authenticate(self.user)
+        with self.captureOnCommitCallbacks(execute=True):
+            deactivate_client(client=self.tenant)
+
+        with self.assertRaises(AuthenticationFailed):
+            self._authenticate(self.user)
@@ -0,0 +1,44 @@
+"""
+Short-lived cache of each tenant user's `is_active` and `role`.
+
+With JWT_LIGHTWEIGHT_USER, TenantJWTAuthentication answers most requests from
+the access token plus this cache instead of loading the users row. Anything
+that deactivates a user or changes their role drops the entry (User.save does
+this; tenant-wide bulk updates call `invalidate_tenant_user_state`), and the
+TTL bounds the rest. Invalidation waits for the surrounding transaction to
+commit, so a concurrent request cannot re-cache the old row in between.
+"""
+
+from django.core.cache import cache
+from django.db import connection, transaction
+
+from apps.core.cache import bump_namespace, versioned_key
+
+USER_STATE_TTL = 60
+
+
+def _user_state_key(schema_name: str, user_id) -> str:
+    return versioned_key(f'user_state:{schema_name}', user_id)
+
+
+def get_user_state(user_id) -> dict | None:
+    """`{'is_active': ..., 'role': ...}` for a user in the current schema, or None if it doesn't exist."""
+    from apps.users.models import User
+
+    key = _user_state_key(connection.schema_name, user_id)
+    state = cache.get(key)
+    if state is None:
+        state = User.objects.filter(pk=user_id).values('is_active', 'role').first() or {}
+        cache.set(key, state, USER_STATE_TTL)
+    return state or None
+
+
+def invalidate_user_state(schema_name: str, *user_ids) -> None:
+    transaction.on_commit(
+        lambda: cache.delete_many([_user_state_key(schema_name, user_id) for user_id in user_ids]),
+    )
+
+
+def invalidate_tenant_user_state(schema_name: str) -> None:
+    """Drop the cached state of every user in the tenant at once."""
+    transaction.on_commit(lambda: bump_namespace(f'user_state:{schema_name}'))
@@ -1,6 +1,7 @@
 import logging
 
 from django.contrib.auth.hashers import check_password
+from django.db import transaction
 from rest_framework import generics, permissions, status
 from rest_framework.decorators import api_view, permission_classes
 from rest_framework.exceptions import AuthenticationFailed, ValidationError
@@ -117,8 +118,9 @@ class TenantOrganizationView(APIView):
             return Response({'detail': 'No changes submitted.'}, status=status.HTTP_400_BAD_REQUEST)
 
         try:
-            client = update_client_login_domain(client=client, login_domain=login_domain)
+            client = update_client_login_domain(client=client, login_domain=login_domain, background=True)
         except TenantProvisionError as exc:
+            transaction.set_rollback(True)
             return Response({'detail': exc.message}, status=exc.status_code)
 
         return Response(
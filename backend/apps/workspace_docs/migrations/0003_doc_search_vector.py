@@ -0,0 +1,67 @@
+import django.contrib.postgres.indexes
+import django.contrib.postgres.search
+from django.db import migrations, models
+
+SEARCH_VECTOR_SQL = """
+    setweight(to_tsvector('pg_catalog.english', coalesce({row}title, '')), 'A')
+    || setweight(to_tsvector('pg_catalog.english', coalesce({row}content_text, '')), 'B')
+"""
+
+CREATE_TRIGGER_SQL = f"""
+CREATE OR REPLACE FUNCTION workspace_docs_search_vector_trigger() RETURNS trigger AS $$
+BEGIN
+    NEW.search_vector := {SEARCH_VECTOR_SQL.format(row='NEW.')};
+    RETURN NEW;
+END
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER workspace_docs_search_vector_update
+    BEFORE INSERT OR UPDATE OF title, content_text ON workspace_docs
+    FOR EACH ROW EXECUTE PROCEDURE workspace_docs_search_vector_trigger();
+"""
+
+DROP_TRIGGER_SQL = """
+DROP TRIGGER IF EXISTS workspace_docs_search_vector_update ON workspace_docs;
+DROP FUNCTION IF EXISTS workspace_docs_search_vector_trigger();
+"""
+
+
+def backfill_content_text(apps, schema_editor):
+    from apps.workspace_docs.rendering import extract_doc_text
+
+    WorkspaceDoc = apps.get_model('workspace_docs', 'WorkspaceDoc')
+    batch = []
+    for doc in WorkspaceDoc.objects.only('id', 'content').iterator(chunk_size=500):
+        doc.content_text = extract_doc_text(doc.content)
+        batch.append(doc)
+        if len(batch) >= 500:
+            WorkspaceDoc.objects.bulk_update(batch, ['content_text'])
+            batch = []
+    if batch:
+        WorkspaceDoc.objects.bulk_update(batch, ['content_text'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('workspace_docs', '0002_doc_emoji_stars_last_edited'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='workspacedoc',
+            name='content_text',
+            field=models.TextField(blank=True, default='', editable=False),
+        ),
+        migrations.AddField(
+            model_name='workspacedoc',
+            name='search_vector',
+            field=django.contrib.postgres.search.SearchVectorField(editable=False, null=True),
+        ),
+        migrations.AddIndex(
+            model_name='workspacedoc',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['search_vector'], name='workspace_docs_search_idx'),
+        ),
+        migrations.RunSQL(CREATE_TRIGGER_SQL, DROP_TRIGGER_SQL),
+        migrations.RunPython(backfill_content_text, migrations.RunPython.noop),
+    ]
@@ -1,5 +1,7 @@
 import uuid
 
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchVectorField
 from django.db import models
 
 from apps.projects.models import Project
@@ -31,6 +33,9 @@ class WorkspaceDoc(models.Model):
         blank=True,
     )
     is_archived = models.BooleanField(default=False)
+    content_text = models.TextField(blank=True, default='', editable=False)
+    # Maintained by a database trigger from title + content_text.
+    search_vector = SearchVectorField(null=True, editable=False)
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
@@ -40,11 +45,22 @@ class WorkspaceDoc(models.Model):
         indexes = [
             models.Index(fields=['project', 'is_archived']),
             models.Index(fields=['created_by', 'is_archived']),
+            GinIndex(fields=['search_vector'], name='workspace_docs_search_idx'),
         ]
 
     def __str__(self) -> str:
         return self.title
 
+    def save(self, *args, **kwargs):
+        from apps.workspace_docs.rendering import extract_doc_text
+
+        update_fields = kwargs.get('update_fields')
+        if update_fields is None or 'content' in update_fields:
+            self.content_text = extract_doc_text(self.content)
+            if update_fields is not None:
+                kwargs['update_fields'] = {*update_fields, 'content_text'}
+        super().save(*args, **kwargs)
+
 
 class DocVersion(models.Model):
     doc = models.ForeignKey(WorkspaceDoc, on_delete=models.CASCADE, related_name='versions')
@@ -50,6 +50,29 @@ def render_doc_content_html(content: dict, *, skip_title_heading: bool = False)
     return '\n'.join(parts)
 
 
+def extract_doc_text(content: dict) -> str:
+    """Plain text of a Tiptap/ProseMirror doc, one line per block, for search indexing."""
+    if not content or not isinstance(content, dict):
+        return ''
+
+    lines: list[str] = []
+
+    def walk(node: dict, buffer: list[str]) -> None:
+        for child in node.get('content') or []:
+            if not isinstance(child, dict):
+                continue
+            if child.get('type') == 'text':
+                buffer.append(child.get('text', ''))
+            elif child.get('content'):
+                inner: list[str] = []
+                walk(child, inner)
+                if inner:
+                    lines.append(''.join(inner))
+
+    walk(content, [])
+    return '\n'.join(line for line in lines if line.strip())
+
+
 def _render_list(block: dict) -> str:
     tag = 'ul' if block.get('type') == 'bulletList' else 'ol'
     items = block.get('content') or []
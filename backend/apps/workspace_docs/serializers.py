@@ -93,8 +93,8 @@ class WorkspaceDocSerializer(serializers.ModelSerializer):
         user = request.user if request else None
 
         if self.instance is None and project and user and user.role == 'employee':
-            from apps.core.access import user_can_access_project
-            if not user_can_access_project(user, project):
+            from apps.core.access import request_membership, user_can_access_project
+            if not user_can_access_project(user, project, membership=request_membership(request)):
                 raise serializers.ValidationError({'project': 'You are not a member of this project.'})
 
         return attrs
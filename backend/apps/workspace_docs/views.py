@@ -1,6 +1,6 @@
 from datetime import timedelta
 
-from django.db import models
+from django.db import transaction
 from django.utils import timezone
 from rest_framework import status, viewsets
 from rest_framework.decorators import action
@@ -8,8 +8,12 @@ from rest_framework.exceptions import NotFound, PermissionDenied
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 
-from apps.core.access import user_can_access_project
-from apps.customers.services.doc_sharing import create_public_share, revoke_public_share
+from apps.core.access import accessible_workspace_docs, user_can_access_project
+from apps.customers.services.doc_sharing import (
+    create_public_share,
+    invalidate_public_doc_cache,
+    revoke_public_share,
+)
 from apps.workspace_docs.models import DocShareLink, WorkspaceDoc, WorkspaceDocStar
 from apps.workspace_docs.permissions import CanCreateShareLink, WorkspaceDocPermission
 from apps.workspace_docs.serializers import (
@@ -47,21 +51,7 @@ class WorkspaceDocViewSet(viewsets.ModelViewSet):
         if query:
             qs = qs.filter(title__icontains=query)
 
-        if user.role == 'admin':
-            return qs.distinct()
-
-        if user.role == 'manager':
-            return qs.filter(
-                models.Q(project__isnull=True, created_by=user)
-                | models.Q(project__created_by=user)
-                | models.Q(project__members=user)
-                | models.Q(created_by=user)
-            ).distinct()
-
-        return qs.filter(
-            models.Q(project__isnull=True, created_by=user)
-            | models.Q(project__members=user)
-        ).distinct()
+        return accessible_workspace_docs(user, qs)
 
     def get_serializer_context(self):
         context = super().get_serializer_context()
@@ -86,12 +76,22 @@ class WorkspaceDocViewSet(viewsets.ModelViewSet):
             raise PermissionDenied('You are not a member of this project.')
         serializer.save()
 
+    def _invalidate_public_doc_on_commit(self, doc):
+        # Dropping the pointer before commit would let a concurrent public view re-cache the old row.
+        tenant_schema, doc_id = self.request.tenant.schema_name, doc.id
+        transaction.on_commit(lambda: invalidate_public_doc_cache(tenant_schema=tenant_schema, doc_id=doc_id))
+
+    def perform_update(self, serializer):
+        doc = serializer.save()
+        self._invalidate_public_doc_on_commit(doc)
+
     def destroy(self, request, *args, **kwargs):
         doc = self.get_object()
         if request.user.role != 'admin' and doc.created_by_id != request.user.id:
             raise PermissionDenied('Only the creator or an admin can delete this document.')
         doc.is_archived = True
         doc.save(update_fields=['is_archived', 'updated_at'])
+        self._invalidate_public_doc_on_commit(doc)
         return Response(status=status.HTTP_204_NO_CONTENT)
 
     @action(detail=True, methods=['post'])
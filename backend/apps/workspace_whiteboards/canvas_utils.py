@@ -31,36 +31,115 @@ def note_text_from_shape(shape: dict[str, Any]) -> str:
     return ''
 
 
-def attach_ticket_to_shape(
-    canvas_data: dict,
-    element_id: str,
-    *,
-    ticket_id: int,
-    ticket_ticket_id: str,
-) -> dict:
-    elements = _elements_list(canvas_data)
-    if not elements:
-        return canvas_data
-
-    updated_elements = []
-    found = False
-    for record in elements:
-        if record.get('id') == element_id and record.get('type') == 'note':
-            updated_elements.append({
-                **record,
-                'ticketId': ticket_id,
-                'ticketTicketId': ticket_ticket_id,
-            })
-            found = True
-        else:
-            updated_elements.append(record)
+DEFAULT_CAMERA = {'x': 0, 'y': 0, 'zoom': 1}
+CANVAS_OP_TYPES = ('add', 'update', 'delete', 'camera')
+
 
-    if not found:
-        return canvas_data
+class CanvasOpError(ValueError):
+    """Raised when an element-level op cannot be applied to a canvas."""
 
+
+def _normalized_canvas(canvas_data: dict) -> dict:
+    camera = canvas_data.get('camera') if isinstance(canvas_data, dict) else None
     return {
-        **canvas_data,
         'version': 1,
-        'elements': updated_elements,
-        'camera': canvas_data.get('camera') or {'x': 0, 'y': 0, 'zoom': 1},
+        'elements': _elements_list(canvas_data),
+        'camera': camera if isinstance(camera, dict) else dict(DEFAULT_CAMERA),
     }
+
+
+def apply_canvas_ops(canvas_data: dict, ops: list[dict[str, Any]]) -> dict:
+    """
+    Apply element-level ops to a canvas document and return the new document.
+
+    Supported ops:
+      - {'op': 'add', 'element': {...}}            (element must carry a new id)
+      - {'op': 'update', 'id': ..., 'changes': {...}}  (shallow merge)
+      - {'op': 'delete', 'id': ...}
+      - {'op': 'camera', 'camera': {...}}
+    """
+    canvas = _normalized_canvas(canvas_data)
+    elements = canvas['elements']
+    positions = {record.get('id'): index for index, record in enumerate(elements)}
+    deleted: set[int] = set()
+
+    for index, op in enumerate(ops):
+        if not isinstance(op, dict):
+            raise CanvasOpError(f'Op #{index} must be an object.')
+        kind = op.get('op')
+
+        if kind == 'add':
+            element = op.get('element')
+            if not isinstance(element, dict) or not element.get('id'):
+                raise CanvasOpError(f'Op #{index}: add requires an element with an id.')
+            element_id = element['id']
+            if element_id in positions:
+                raise CanvasOpError(f'Op #{index}: element {element_id} already exists.')
+            positions[element_id] = len(elements)
+            elements.append(element)
+
+        elif kind == 'update':
+            element_id = op.get('id')
+            changes = op.get('changes')
+            if element_id not in positions:
+                raise CanvasOpError(f'Op #{index}: element {element_id} not found.')
+            if not isinstance(changes, dict):
+                raise CanvasOpError(f'Op #{index}: update requires a changes object.')
+            if 'id' in changes and changes['id'] != element_id:
+                raise CanvasOpError(f'Op #{index}: element id cannot be changed.')
+            position = positions[element_id]
+            elements[position] = {**elements[position], **changes}
+
+        elif kind == 'delete':
+            element_id = op.get('id')
+            if element_id not in positions:
+                raise CanvasOpError(f'Op #{index}: element {element_id} not found.')
+            deleted.add(positions.pop(element_id))
+
+        elif kind == 'camera':
+            camera = op.get('camera')
+            if not isinstance(camera, dict):
+                raise CanvasOpError(f'Op #{index}: camera requires a camera object.')
+            canvas['camera'] = {**canvas['camera'], **camera}
+
+        else:
+            raise CanvasOpError(
+                f'Op #{index}: unsupported op {kind!r}. Use one of: {", ".join(CANVAS_OP_TYPES)}.'
+            )
+
+    if deleted:
+        canvas['elements'] = [e for i, e in enumerate(elements) if i not in deleted]
+    return canvas
+
+
+def diff_canvas_ops(old_canvas: dict, new_canvas: dict) -> list[dict[str, Any]]:
+    """Describe the change between two canvas documents as element-level ops."""
+    old_elements = {record.get('id'): record for record in _elements_list(old_canvas)}
+    new_elements = _elements_list(new_canvas)
+    new_ids = {record.get('id') for record in new_elements}
+
+    ops: list[dict[str, Any]] = []
+    for record in new_elements:
+        element_id = record.get('id')
+        previous = old_elements.get(element_id)
+        if previous is None:
+            ops.append({'op': 'add', 'element': record})
+            continue
+        changes = {key: value for key, value in record.items() if previous.get(key) != value}
+        removed = [key for key in previous if key not in record]
+        if removed:
+            # Shallow merges cannot drop keys; replace the element wholesale.
+            ops.append({'op': 'delete', 'id': element_id})
+            ops.append({'op': 'add', 'element': record})
+        elif changes:
+            ops.append({'op': 'update', 'id': element_id, 'changes': changes})
+
+    for element_id in old_elements:
+        if element_id not in new_ids:
+            ops.append({'op': 'delete', 'id': element_id})
+
+    old_camera = old_canvas.get('camera') if isinstance(old_canvas, dict) else None
+    new_camera = new_canvas.get('camera') if isinstance(new_canvas, dict) else None
+    if isinstance(new_camera, dict) and new_camera != old_camera:
+        ops.append({'op': 'camera', 'camera': new_camera})
+    return ops
@@ -0,0 +1,38 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('workspace_whiteboards', '0002_whiteboard_share_link'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='whiteboard',
+            name='revision',
+            field=models.PositiveIntegerField(
+                default=0,
+                help_text='Incremented on every canvas change; clients send it back as base_revision.',
+            ),
+        ),
+        migrations.AddField(
+            model_name='whiteboardversion',
+            name='revision',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='whiteboardversion',
+            name='ops',
+            field=models.JSONField(blank=True, default=list),
+        ),
+        migrations.AlterField(
+            model_name='whiteboardversion',
+            name='canvas_data',
+            field=models.JSONField(blank=True, null=True),
+        ),
+        migrations.AddIndex(
+            model_name='whiteboardversion',
+            index=models.Index(fields=['whiteboard', 'revision'], name='wb_versions_board_rev_idx'),
+        ),
+    ]
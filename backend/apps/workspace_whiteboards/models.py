@@ -30,6 +30,10 @@ class Whiteboard(models.Model):
         blank=True,
     )
     is_archived = models.BooleanField(default=False)
+    revision = models.PositiveIntegerField(
+        default=0,
+        help_text='Incremented on every canvas change; clients send it back as base_revision.',
+    )
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
@@ -46,14 +50,22 @@ class Whiteboard(models.Model):
 
 
 class WhiteboardVersion(models.Model):
+    """Op log entry — the element-level ops that moved a board to `revision`."""
+
     whiteboard = models.ForeignKey(Whiteboard, on_delete=models.CASCADE, related_name='versions')
-    canvas_data = models.JSONField()
+    revision = models.PositiveIntegerField(default=0)
+    ops = models.JSONField(default=list, blank=True)
+    # Legacy full snapshots; new versions only store ops.
+    canvas_data = models.JSONField(null=True, blank=True)
     edited_by = models.ForeignKey(User, on_delete=models.CASCADE, related_name='whiteboard_versions')
     created_at = models.DateTimeField(auto_now_add=True)
 
     class Meta:
         db_table = 'workspace_whiteboard_versions'
         ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['whiteboard', 'revision'], name='wb_versions_board_rev_idx'),
+        ]
 
     def __str__(self) -> str:
         return f'{self.whiteboard.title} @ {self.created_at}'
@@ -1,6 +1,6 @@
 from rest_framework import permissions
 
-from apps.core.access import user_can_access_project
+from apps.core.access import request_membership, user_can_access_project
 
 
 class WhiteboardPermission(permissions.BasePermission):
@@ -16,20 +16,20 @@ class WhiteboardPermission(permissions.BasePermission):
             if obj.created_by_id == user.id:
                 return True
             if obj.project_id:
-                return user_can_access_project(user, obj.project)
+                return user_can_access_project(user, obj.project, membership=request_membership(request))
             return user.role == 'manager'
 
         if view.action in ('destroy',) and obj.created_by_id != user.id:
             return False
 
-        if view.action in ('update', 'partial_update', 'convert_element'):
+        if view.action in ('update', 'partial_update', 'convert_element', 'apply_ops'):
             if obj.created_by_id == user.id:
                 return True
             if user.role == 'manager' and obj.project_id:
-                return user_can_access_project(user, obj.project)
+                return user_can_access_project(user, obj.project, membership=request_membership(request))
             return False
 
         if obj.project_id:
-            return user_can_access_project(user, obj.project)
+            return user_can_access_project(user, obj.project, membership=request_membership(request))
 
         return obj.created_by_id == user.id or user.role == 'manager'
@@ -1,8 +1,15 @@
 from rest_framework import serializers
+from django.db import transaction
 from django.utils import timezone
 
 from apps.notifications.email_utils import get_frontend_base_url
+from apps.workspace_whiteboards.canvas_utils import diff_canvas_ops
 from apps.workspace_whiteboards.models import Whiteboard, WhiteboardShareLink
+from apps.workspace_whiteboards.services import (
+    MAX_OPS_PER_PATCH,
+    lock_whiteboard,
+    record_whiteboard_version,
+)
 
 
 def empty_whiteboard_canvas() -> dict:
@@ -35,18 +42,18 @@ class WhiteboardSerializer(serializers.ModelSerializer):
     created_by_name = serializers.SerializerMethodField()
     last_edited_by_name = serializers.SerializerMethodField()
     project_name = serializers.CharField(source='project.name', read_only=True, default=None)
-    expected_updated_at = serializers.DateTimeField(write_only=True, required=False)
+    base_revision = serializers.IntegerField(write_only=True, required=False, min_value=0)
 
     class Meta:
         model = Whiteboard
         fields = [
             'id', 'title', 'canvas_data', 'project', 'project_name', 'created_by', 'created_by_name',
-            'last_edited_by', 'last_edited_by_name', 'is_archived', 'created_at', 'updated_at',
-            'expected_updated_at',
+            'last_edited_by', 'last_edited_by_name', 'is_archived', 'revision', 'created_at', 'updated_at',
+            'base_revision',
         ]
         read_only_fields = [
             'id', 'created_by', 'created_by_name', 'last_edited_by', 'last_edited_by_name',
-            'created_at', 'updated_at',
+            'revision', 'created_at', 'updated_at',
         ]
 
     def get_created_by_name(self, obj):
@@ -70,35 +77,35 @@ class WhiteboardSerializer(serializers.ModelSerializer):
         user = request.user if request else None
 
         if self.instance is None and project and user and user.role == 'employee':
-            from apps.core.access import user_can_access_project
-            if not user_can_access_project(user, project):
+            from apps.core.access import request_membership, user_can_access_project
+            if not user_can_access_project(user, project, membership=request_membership(request)):
                 raise serializers.ValidationError({'project': 'You are not a member of this project.'})
 
         return attrs
 
+    @transaction.atomic
     def update(self, instance, validated_data):
-        expected = validated_data.pop('expected_updated_at', None)
-        if expected is not None and instance.updated_at.isoformat() > expected.isoformat():
+        base_revision = validated_data.pop('base_revision', None)
+        locked = lock_whiteboard(instance)
+        instance.revision = locked.revision
+        instance.canvas_data = locked.canvas_data
+        if base_revision is not None and instance.revision != base_revision:
             raise serializers.ValidationError({
                 'detail': 'This whiteboard was updated by someone else. Reload to see the latest version.',
                 'code': 'stale_whiteboard',
-                'updated_at': instance.updated_at.isoformat(),
+                'revision': instance.revision,
             })
 
-        canvas_changed = (
-            'canvas_data' in validated_data
-            and validated_data['canvas_data'] != instance.canvas_data
-        )
+        ops = []
+        if 'canvas_data' in validated_data:
+            ops = diff_canvas_ops(instance.canvas_data or {}, validated_data['canvas_data'])
+        if ops:
+            validated_data['revision'] = instance.revision + 1
         validated_data['last_edited_by'] = self.context['request'].user
         instance = super().update(instance, validated_data)
 
-        if canvas_changed:
-            from apps.workspace_whiteboards.models import WhiteboardVersion
-            WhiteboardVersion.objects.create(
-                whiteboard=instance,
-                canvas_data=instance.canvas_data,
-                edited_by=self.context['request'].user,
-            )
+        if ops:
+            record_whiteboard_version(instance, ops=ops, user=self.context['request'].user)
         return instance
 
 
@@ -138,6 +145,16 @@ class ConvertElementSerializer(serializers.Serializer):
         return value.strip() if value else ''
 
 
+class WhiteboardOpsSerializer(serializers.Serializer):
+    base_revision = serializers.IntegerField(min_value=0)
+    ops = serializers.ListField(child=serializers.DictField(), allow_empty=False)
+
+    def validate_ops(self, value):
+        if len(value) > MAX_OPS_PER_PATCH:
+            raise serializers.ValidationError(f'At most {MAX_OPS_PER_PATCH} ops per request.')
+        return value
+
+
 class WhiteboardShareLinkSerializer(serializers.ModelSerializer):
     public_url = serializers.SerializerMethodField()
 
@@ -0,0 +1,99 @@
+"""Revisioned, op-based whiteboard updates."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from django.db import transaction
+
+from apps.workspace_whiteboards.canvas_utils import apply_canvas_ops
+from apps.workspace_whiteboards.models import Whiteboard, WhiteboardVersion
+
+MAX_OPS_PER_PATCH = 500
+
+
+class StaleWhiteboardError(Exception):
+    """The client edited an older revision than the one stored."""
+
+    def __init__(self, whiteboard: Whiteboard, base_revision: int):
+        super().__init__('This whiteboard was updated by someone else.')
+        self.whiteboard = whiteboard
+        self.base_revision = base_revision
+
+
+def record_whiteboard_version(
+    whiteboard: Whiteboard,
+    *,
+    ops: list[dict[str, Any]],
+    user,
+) -> WhiteboardVersion:
+    """Store the ops that produced the board's current revision."""
+    return WhiteboardVersion.objects.create(
+        whiteboard=whiteboard,
+        revision=whiteboard.revision,
+        ops=ops,
+        edited_by=user,
+    )
+
+
+def lock_whiteboard(whiteboard: Whiteboard) -> Whiteboard:
+    """Re-read a board's canvas and revision under a row lock (inside a transaction)."""
+    return (
+        Whiteboard.objects.select_for_update()
+        .only('revision', 'canvas_data')
+        .get(pk=whiteboard.pk)
+    )
+
+
+@transaction.atomic
+def apply_whiteboard_ops(
+    whiteboard: Whiteboard,
+    *,
+    base_revision: int,
+    ops: list[dict[str, Any]],
+    user,
+) -> tuple[Whiteboard, WhiteboardVersion]:
+    """
+    Apply element-level ops on top of `base_revision`.
+
+    Raises StaleWhiteboardError when another edit landed first and
+    CanvasOpError when an op does not fit the stored canvas.
+    """
+    current = Whiteboard.objects.select_for_update().get(pk=whiteboard.pk)
+    if current.revision != base_revision:
+        raise StaleWhiteboardError(current, base_revision)
+
+    current.canvas_data = apply_canvas_ops(current.canvas_data or {}, ops)
+    current.revision += 1
+    current.last_edited_by = user
+    current.save(update_fields=['canvas_data', 'revision', 'last_edited_by', 'updated_at'])
+    version = record_whiteboard_version(current, ops=ops, user=user)
+    return current, version
+
+
+def ops_since(whiteboard: Whiteboard, base_revision: int) -> list[dict[str, Any]] | None:
+    """
+    Return the ops a client at `base_revision` missed, oldest first.
+
+    Returns None when the history has a gap (legacy snapshot versions or a
+    revision from the future), in which case the client must reload.
+    """
+    if base_revision > whiteboard.revision:
+        return None
+
+    versions = list(
+        WhiteboardVersion.objects.filter(
+            whiteboard=whiteboard,
+            revision__gt=base_revision,
+        )
+        .order_by('revision')
+        .values_list('revision', 'ops')
+    )
+    expected = list(range(base_revision + 1, whiteboard.revision + 1))
+    if [revision for revision, _ in versions] != expected:
+        return None
+
+    missed: list[dict[str, Any]] = []
+    for _, version_ops in versions:
+        missed.extend(version_ops or [])
+    return missed
@@ -0,0 +1,153 @@
+from unittest import mock
+
+from django.db import transaction
+from django.test import SimpleTestCase
+from rest_framework.test import APIRequestFactory, force_authenticate
+
+from apps.core.testing import MainTenantTestCase
+from apps.projects.models import Project
+from apps.users.models import User
+from apps.workspace_whiteboards.canvas_utils import CanvasOpError, apply_canvas_ops, diff_canvas_ops
+from apps.workspace_whiteboards.models import Whiteboard
+from apps.workspace_whiteboards.services import apply_whiteboard_ops, lock_whiteboard, ops_since
+from apps.workspace_whiteboards.views import WhiteboardViewSet
+
+
+def _canvas(*elements, camera=None):
+    return {
+        'version': 1,
+        'elements': list(elements),
+        'camera': camera or {'x': 0, 'y': 0, 'zoom': 1},
+    }
+
+
+class ApplyCanvasOpsTestCase(SimpleTestCase):
+    def test_add_update_delete_and_camera(self):
+        canvas = _canvas({'id': 'a', 'type': 'note', 'text': 'one'}, {'id': 'b', 'type': 'geo'})
+        result = apply_canvas_ops(canvas, [
+            {'op': 'add', 'element': {'id': 'c', 'type': 'text', 'text': 'new'}},
+            {'op': 'update', 'id': 'a', 'changes': {'text': 'edited'}},
+            {'op': 'delete', 'id': 'b'},
+            {'op': 'camera', 'camera': {'zoom': 2}},
+        ])
+        self.assertEqual([e['id'] for e in result['elements']], ['a', 'c'])
+        self.assertEqual(result['elements'][0]['text'], 'edited')
+        self.assertEqual(result['camera'], {'x': 0, 'y': 0, 'zoom': 2})
+        self.assertEqual(canvas['elements'][0]['text'], 'one')
+
+    def test_rejects_unknown_element(self):
+        with self.assertRaises(CanvasOpError):
+            apply_canvas_ops(_canvas(), [{'op': 'update', 'id': 'missing', 'changes': {'x': 1}}])
+
+    def test_rejects_duplicate_add(self):
+        with self.assertRaises(CanvasOpError):
+            apply_canvas_ops(_canvas({'id': 'a'}), [{'op': 'add', 'element': {'id': 'a'}}])
+
+    def test_rejects_unknown_op(self):
+        with self.assertRaises(CanvasOpError):
+            apply_canvas_ops(_canvas(), [{'op': 'replace'}])
+
+
+class DiffCanvasOpsTestCase(SimpleTestCase):
+    def test_diff_round_trips_through_apply(self):
+        old = _canvas(
+            {'id': 'a', 'type': 'note', 'text': 'one', 'ticketId': 4},
+            {'id': 'b', 'type': 'geo', 'x': 1},
+            {'id': 'c', 'type': 'geo', 'x': 2},
+        )
+        new = _canvas(
+            {'id': 'a', 'type': 'note', 'text': 'one'},
+            {'id': 'b', 'type': 'geo', 'x': 5},
+            {'id': 'd', 'type': 'text', 'text': 'hi'},
+            camera={'x': 10, 'y': 0, 'zoom': 1},
+        )
+        ops = diff_canvas_ops(old, new)
+        rebuilt = apply_canvas_ops(old, ops)
+        self.assertEqual(
+            sorted(rebuilt['elements'], key=lambda e: e['id']),
+            sorted(new['elements'], key=lambda e: e['id']),
+        )
+        self.assertEqual(rebuilt['camera'], new['camera'])
+
+    def test_unchanged_canvas_has_no_ops(self):
+        canvas = _canvas({'id': 'a', 'type': 'note'})
+        self.assertEqual(diff_canvas_ops(canvas, canvas), [])
+
+
+class WhiteboardEndpointTestCase(MainTenantTestCase):
+    def setUp(self):
+        super().setUp()
+
+        self.user = User.objects.create_user(username='admin', email='a@test.com', password='pw', role='admin')
+        project = Project.objects.create(name='Payments', created_by=self.user)
+        self.initial_canvas = _canvas(
+            {'id': 'note-1', 'type': 'note', 'text': 'Fix login'},
+            {'id': 'geo-1', 'type': 'geo', 'x': 0},
+        )
+        self.board = Whiteboard.objects.create(
+            title='Planning', project=project, created_by=self.user, canvas_data=self.initial_canvas,
+        )
+        self.factory = APIRequestFactory()
+
+    def post(self, action, url_path, data):
+        request = self.factory.post(f'/api/whiteboards/{self.board.id}/{url_path}/', data, format='json')
+        force_authenticate(request, user=self.user)
+        with transaction.atomic():  # as ATOMIC_REQUESTS would
+            return WhiteboardViewSet.as_view({'post': action})(request, id=self.board.id)
+
+    def ops(self, base_revision, ops):
+        return self.post('apply_ops', 'ops', {'base_revision': base_revision, 'ops': ops})
+
+    def assert_op_log_matches_canvas(self):
+        self.board.refresh_from_db()
+        replayed = apply_canvas_ops(self.initial_canvas, ops_since(self.board, 0))
+        self.assertEqual(replayed, self.board.canvas_data)
+
+    def test_ops_advance_the_revision(self):
+        response = self.ops(0, [{'op': 'update', 'id': 'geo-1', 'changes': {'x': 5}}])
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data['revision'], 1)
+        self.assert_op_log_matches_canvas()
+
+    def test_stale_ops_return_missed_ops(self):
+        move = {'op': 'update', 'id': 'geo-1', 'changes': {'x': 5}}
+        self.ops(0, [move])
+
+        response = self.ops(0, [{'op': 'delete', 'id': 'geo-1'}])
+        self.assertEqual(response.status_code, 409)
+        self.assertEqual(response.data['revision'], 1)
+        self.assertEqual(response.data['missed_ops'], [move])
+
+    def test_invalid_op_is_rejected(self):
+        response = self.ops(0, [{'op': 'update', 'id': 'missing', 'changes': {'x': 1}}])
+        self.assertEqual(response.status_code, 400)
+        self.board.refresh_from_db()
+        self.assertEqual(self.board.revision, 0)
+
+    def test_convert_element_keeps_concurrent_ops(self):
+        def lock_after_concurrent_edit(whiteboard):
+            # Another client's op lands after the view loaded the board but before it locks it.
+            apply_whiteboard_ops(
+                whiteboard,
+                base_revision=0,
+                ops=[{'op': 'update', 'id': 'geo-1', 'changes': {'x': 9}}],
+                user=self.user,
+            )
+            return lock_whiteboard(whiteboard)
+
+        with mock.patch(
+            'apps.workspace_whiteboards.views.lock_whiteboard', side_effect=lock_after_concurrent_edit,
+        ):
+            response = self.post('convert_element', 'convert-element', {'element_id': 'note-1'})
+
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(response.data['revision'], 2)
+        elements = {e['id']: e for e in response.data['canvas_data']['elements']}
+        self.assertEqual(elements['geo-1']['x'], 9)
+        self.assertEqual(elements['note-1']['ticketId'], response.data['ticket']['id'])
+        self.assert_op_log_matches_canvas()
+
+    def test_convert_element_rejects_linked_note(self):
+        self.assertEqual(self.post('convert_element', 'convert-element', {'element_id': 'note-1'}).status_code, 201)
+        response = self.post('convert_element', 'convert-element', {'element_id': 'note-1'})
+        self.assertEqual(response.status_code, 400)
@@ -1,6 +1,6 @@
 from datetime import timedelta
 
-from django.db import models
+from django.db import models, transaction
 from django.utils import timezone
 from rest_framework import status, viewsets
 from rest_framework.decorators import action
@@ -14,16 +14,23 @@ from apps.tickets.models import Ticket
 from apps.tickets.serializers import TicketSerializer
 from apps.workspace_docs.permissions import CanCreateShareLink
 from apps.workspace_whiteboards.canvas_utils import (
-    attach_ticket_to_shape,
+    CanvasOpError,
     find_note_shape,
     note_text_from_shape,
 )
 from apps.workspace_whiteboards.models import Whiteboard, WhiteboardShareLink
 from apps.workspace_whiteboards.permissions import WhiteboardPermission
+from apps.workspace_whiteboards.services import (
+    StaleWhiteboardError,
+    apply_whiteboard_ops,
+    lock_whiteboard,
+    ops_since,
+)
 from apps.workspace_whiteboards.serializers import (
     ConvertElementSerializer,
     WhiteboardCreateSerializer,
     WhiteboardListSerializer,
+    WhiteboardOpsSerializer,
     WhiteboardSerializer,
     WhiteboardShareCreateSerializer,
     WhiteboardShareLinkSerializer,
@@ -119,52 +126,77 @@ class WhiteboardViewSet(viewsets.ModelViewSet):
                 'detail': 'Link this whiteboard to a project before converting notes to tickets.',
             })
 
-        shape = find_note_shape(whiteboard.canvas_data or {}, element_id)
-        if shape is None:
-            raise ValidationError({'element_id': 'Sticky note not found on this whiteboard.'})
-
-        existing_ticket_id = (shape.get('meta') or {}).get('ticketId')
-        if existing_ticket_id:
-            raise ValidationError({'detail': 'This sticky note is already linked to a ticket.'})
-
-        title = serializer.validated_data.get('title') or note_text_from_shape(shape) or 'Untitled'
         project = whiteboard.project
         user = request.user
         if not user_can_create_ticket_on_project(user, project):
             raise PermissionDenied('You must be a project member to create tickets on this project.')
 
-        ticket = Ticket.objects.create(
-            title=title,
-            description=f'Created from whiteboard "{whiteboard.title}".',
-            type='task',
-            priority='medium',
-            project=project,
-            created_by=user,
-        )
-
-        updated_canvas = attach_ticket_to_shape(
-            whiteboard.canvas_data or {},
-            element_id,
-            ticket_id=ticket.id,
-            ticket_ticket_id=ticket.ticket_id,
-        )
-        whiteboard.canvas_data = updated_canvas
-        whiteboard.last_edited_by = user
-        whiteboard.save(update_fields=['canvas_data', 'last_edited_by', 'updated_at'])
-
-        from apps.workspace_whiteboards.models import WhiteboardVersion
-        WhiteboardVersion.objects.create(
-            whiteboard=whiteboard,
-            canvas_data=whiteboard.canvas_data,
-            edited_by=user,
-        )
+        with transaction.atomic():
+            # Read the note from the locked row so ops applied concurrently are not lost.
+            locked = lock_whiteboard(whiteboard)
+            shape = find_note_shape(locked.canvas_data or {}, element_id)
+            if shape is None:
+                raise ValidationError({'element_id': 'Sticky note not found on this whiteboard.'})
+
+            if shape.get('ticketId') or (shape.get('meta') or {}).get('ticketId'):
+                raise ValidationError({'detail': 'This sticky note is already linked to a ticket.'})
+
+            title = serializer.validated_data.get('title') or note_text_from_shape(shape) or 'Untitled'
+            ticket = Ticket.objects.create(
+                title=title,
+                description=f'Created from whiteboard "{whiteboard.title}".',
+                type='task',
+                priority='medium',
+                project=project,
+                created_by=user,
+            )
+            whiteboard, _version = apply_whiteboard_ops(
+                whiteboard,
+                base_revision=locked.revision,
+                ops=[{
+                    'op': 'update',
+                    'id': element_id,
+                    'changes': {'ticketId': ticket.id, 'ticketTicketId': ticket.ticket_id},
+                }],
+                user=user,
+            )
 
         return Response({
             'ticket': TicketSerializer(ticket, context=self.get_serializer_context()).data,
             'canvas_data': whiteboard.canvas_data,
+            'revision': whiteboard.revision,
             'updated_at': whiteboard.updated_at.isoformat(),
         }, status=status.HTTP_201_CREATED)
 
+    @action(detail=True, methods=['post'], url_path='ops')
+    def apply_ops(self, request, id=None):
+        """Apply element-level ops (add/update/delete/camera) on top of base_revision."""
+        whiteboard = self.get_object()
+        serializer = WhiteboardOpsSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+
+        try:
+            whiteboard, _version = apply_whiteboard_ops(
+                whiteboard,
+                base_revision=serializer.validated_data['base_revision'],
+                ops=serializer.validated_data['ops'],
+                user=request.user,
+            )
+        except StaleWhiteboardError as exc:
+            return Response({
+                'detail': 'This whiteboard was updated by someone else. Rebase your changes or reload.',
+                'code': 'stale_whiteboard',
+                'revision': exc.whiteboard.revision,
+                'missed_ops': ops_since(exc.whiteboard, exc.base_revision),
+            }, status=status.HTTP_409_CONFLICT)
+        except CanvasOpError as exc:
+            raise ValidationError({'ops': str(exc)}) from exc
+
+        return Response({
+            'revision': whiteboard.revision,
+            'updated_at': whiteboard.updated_at.isoformat(),
+        })
+
     @action(detail=True, methods=['post'], permission_classes=[IsAuthenticated, CanCreateShareLink])
     def share(self, request, id=None):
         whiteboard = self.get_object()
@@ -0,0 +1,8 @@
+"""
+Backend benchmarks: synthetic dataset, micro-benchmarks and locust scenarios.
+
+    python manage.py generate_benchmark_data --tenants 2 --scale small
+    python -m benchmarks.run micro                       # pytest-benchmark
+    python -m benchmarks.run load --host http://localhost:8000
+    python -m benchmarks.run compare OLD.json NEW.json
+"""
@@ -0,0 +1,103 @@
+"""
+Micro-benchmarks for hot backend functions (pytest-benchmark).
+
+    python -m pytest benchmarks/bench_hot_paths.py --benchmark-json=benchmarks/results/micro.json
+"""
+
+from datetime import timedelta
+
+import pytest
+from django.utils import timezone
+from rest_framework.test import APIRequestFactory
+
+from benchmarks.dataset import WORDS
+
+
+def _doc_content(paragraphs=200):
+    blocks = [{'type': 'heading', 'attrs': {'level': 1}, 'content': [{'type': 'text', 'text': 'Runbook'}]}]
+    for i in range(paragraphs):
+        blocks.append({'type': 'paragraph', 'content': [
+            {'type': 'text', 'text': f'{WORDS[i % len(WORDS)]} step {i} '},
+            {'type': 'text', 'text': 'important', 'marks': [{'type': 'bold'}]},
+            {'type': 'text', 'text': ' <script>alert(1)</script>'},
+        ]})
+        if i % 20 == 0:
+            blocks.append({'type': 'bulletList', 'content': [
+                {'type': 'listItem', 'content': [{'type': 'paragraph', 'content': [{'type': 'text', 'text': 'item'}]}]}
+                for _ in range(5)
+            ]})
+    return {'type': 'doc', 'content': blocks}
+
+
+def _request_for(user):
+    request = APIRequestFactory().get('/api/tickets/tickets/')
+    request.user = user
+    return request
+
+
+def test_render_doc_content_html(benchmark):
+    from apps.workspace_docs.rendering import render_doc_content_html
+
+    html = benchmark(render_doc_content_html, _doc_content(), skip_title_heading=True)
+    assert '<script>' not in html
+
+
+def test_parse_mentioned_users(benchmark, in_bench_schema):
+    from apps.comments.utils import parse_mentioned_users
+    from apps.projects.models import Project
+
+    project = Project.objects.order_by('pk').first()
+    names = [member.get_full_name() for member in project.members.all()[:3]]
+    content = ' '.join(f'ping @{name} about {WORDS[i]}' for i, name in enumerate(names)) * 5
+    mentioned = benchmark(parse_mentioned_users, content, project)
+    assert mentioned
+
+
+def test_aggregate_stats_for_employee(benchmark, in_bench_schema):
+    from apps.attendance.models import Attendance
+    from apps.users.models import User
+
+    employee = User.objects.filter(role='employee').order_by('pk').first()
+    end = timezone.localdate()
+    stats = benchmark(Attendance.aggregate_stats_for_employee, employee, end - timedelta(days=30), end)
+    assert stats['total_working_days'] > 0
+
+
+@pytest.mark.parametrize('serializer_name', ['TicketListSerializer', 'TicketSerializer'])
+def test_ticket_serializer_page(benchmark, in_bench_schema, serializer_name):
+    from apps.tickets import serializers
+    from apps.tickets.views import TicketViewSet
+    from apps.users.models import User
+
+    admin = User.objects.get(username='bench0')
+    view = TicketViewSet()
+    view.action = 'list' if serializer_name == 'TicketListSerializer' else 'retrieve'
+    view.request = _request_for(admin)
+    serializer_class = getattr(serializers, serializer_name)
+    context = {'request': view.request}
+
+    def serialize_page():
+        page = list(view._queryset_for_action().order_by('-created_at')[:20])
+        return serializer_class(page, many=True, context=context).data
+
+    data = benchmark(serialize_page)
+    assert len(data) == 20
+
+
+def test_login(benchmark, bench_tenant, db):
+    from django.db import connection
+
+    from apps.customers.services.login_accounts import resync_client_login_accounts
+    from apps.users.serializers import CustomTokenObtainPairSerializer
+    from benchmarks.dataset import BENCH_PASSWORD, bench_login
+
+    resync_client_login_accounts(bench_tenant)
+    data = {'username': bench_login(bench_tenant.schema_name, 'bench1'), 'password': BENCH_PASSWORD}
+
+    def login():
+        serializer = CustomTokenObtainPairSerializer(data=data)
+        valid = serializer.is_valid()
+        connection.set_schema_to_public()
+        return valid
+
+    assert benchmark(login)
@@ -0,0 +1,23 @@
+import pytest
+from django_tenants.utils import schema_context
+
+from benchmarks.dataset import SCALES, bench_schema_name, ensure_bench_tenant, is_populated, populate_schema
+
+BENCH_SCHEMA = bench_schema_name(0)
+
+
+@pytest.fixture(scope='session')
+def bench_tenant(django_db_setup, django_db_blocker):
+    """One seeded benchmark tenant, created once per run in the test database."""
+    with django_db_blocker.unblock():
+        tenant = ensure_bench_tenant(BENCH_SCHEMA)
+        with schema_context(BENCH_SCHEMA):
+            if not is_populated():
+                populate_schema(SCALES['small'], seed=0)
+    return tenant
+
+
+@pytest.fixture
+def in_bench_schema(bench_tenant, db):
+    with schema_context(bench_tenant.schema_name):
+        yield bench_tenant
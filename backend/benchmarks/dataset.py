@@ -0,0 +1,349 @@
+"""
+Synthetic multi-tenant dataset for benchmarks and load tests.
+
+Every tenant gets the same deterministic (seeded) shape: users, projects with
+members, tickets with assignees, comments, work logs, activity entries and
+attendance. Rows whose primary keys are needed later go through bulk_create
+in batches; leaf rows (through table, comments, work logs, activity,
+attendance) are streamed with COPY. Every user shares one precomputed
+password hash, and several tenants can be filled in parallel processes.
+"""
+
+from __future__ import annotations
+
+import csv
+import io
+import json
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import asdict, dataclass
+from datetime import timedelta
+
+from django.contrib.auth.hashers import make_password
+from django.db import connection, connections, transaction
+from django.utils import timezone
+
+BENCH_PASSWORD = 'bench-pass-2026'
+BENCH_SCHEMA_PREFIX = 'bench'
+BATCH_SIZE = 2000
+
+WORDS = (
+    'login', 'timeout', 'payment', 'export', 'report', 'crash', 'android', 'slow',
+    'dashboard', 'email', 'upload', 'invoice', 'search', 'profile', 'sync', 'webhook',
+)
+
+
+@dataclass(frozen=True)
+class DatasetScale:
+    users: int
+    projects: int
+    tickets: int
+    comments_per_ticket: int
+    worklogs_per_ticket: int
+    attendance_days: int
+
+
+SCALES = {
+    'tiny': DatasetScale(users=8, projects=2, tickets=60, comments_per_ticket=1, worklogs_per_ticket=1, attendance_days=10),
+    'small': DatasetScale(users=25, projects=5, tickets=1_000, comments_per_ticket=2, worklogs_per_ticket=1, attendance_days=30),
+    'medium': DatasetScale(users=100, projects=20, tickets=10_000, comments_per_ticket=3, worklogs_per_ticket=2, attendance_days=60),
+    'large': DatasetScale(users=300, projects=50, tickets=50_000, comments_per_ticket=4, worklogs_per_ticket=2, attendance_days=90),
+}
+
+
+def bench_schema_name(index: int) -> str:
+    return f'{BENCH_SCHEMA_PREFIX}_{index}'
+
+
+def bench_login(schema_name: str, username: str) -> str:
+    """Sign-in address for a generated user (see ensure_bench_tenant for the domain)."""
+    return f'{username}@{schema_name.replace("_", "-")}.bench'
+
+
+def ensure_bench_tenant(schema_name: str):
+    """Create (or reuse) a tenant with a domain, login domain and the default plan."""
+    from django_tenants.utils import get_tenant_model
+
+    from apps.customers.models import Domain
+    from apps.customers.services.plans import assign_plan_to_client, ensure_default_plans, get_subscription_display
+    from apps.customers.tenant_resolution import internal_domain_for
+
+    Client = get_tenant_model()
+    slug = schema_name.replace('_', '-')
+    tenant = Client.objects.filter(schema_name=schema_name).first()
+    if tenant is None:
+        tenant = Client(
+            schema_name=schema_name,
+            name=f'Benchmark {schema_name}',
+            slug=slug,
+            login_domain=f'{slug}.bench',
+            is_active=True,
+        )
+        tenant.save()
+        Domain.objects.create(domain=internal_domain_for(schema_name), tenant=tenant, is_primary=True)
+
+    standard, _premium = ensure_default_plans()
+    if get_subscription_display(tenant) is None:
+        assign_plan_to_client(client=tenant, plan=standard)
+    return tenant
+
+
+def _batched_create(model, rows, batch_size=BATCH_SIZE):
+    return model.objects.bulk_create(rows, batch_size=batch_size)
+
+
+def _copy_value(field, obj):
+    # Plain Python values (ints, text, dates, aware datetimes) already have a
+    # text form Postgres accepts, so only NULL and JSON need converting.
+    value = field.pre_save(obj, add=True)
+    if value is None:
+        return r'\N'
+    if field.get_internal_type() == 'JSONField':
+        return json.dumps(value, cls=field.encoder)
+    return value
+
+
+def copy_rows(model, objs) -> int:
+    """
+    Insert unsaved instances with one COPY ... FROM STDIN (auto_now fields are
+    filled like save() would). Primary keys are not set on `objs`, so use it
+    for rows nothing else points at.
+    """
+    fields = [field for field in model._meta.concrete_fields if not field.primary_key]
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    count = 0
+    for obj in objs:
+        writer.writerow([_copy_value(field, obj) for field in fields])
+        count += 1
+    if not count:
+        return 0
+    buffer.seek(0)
+    quote = connection.ops.quote_name
+    columns = ', '.join(quote(field.column) for field in fields)
+    with connection.cursor() as cursor:
+        cursor.copy_expert(
+            f"COPY {quote(model._meta.db_table)} ({columns}) FROM STDIN WITH (FORMAT csv, NULL '\\N')",
+            buffer,
+        )
+    return count
+
+
+def is_populated() -> bool:
+    from apps.users.models import User
+
+    return User.objects.filter(username='bench0').exists()
+
+
+@transaction.atomic
+def populate_schema(scale: DatasetScale, *, seed: int = 0, password_hash: str | None = None) -> dict[str, int]:
+    """Fill the current tenant schema. Returns row counts per model."""
+    from django.contrib.contenttypes.models import ContentType
+
+    from apps.activity.models import ActivityLog
+    from apps.attendance.models import Attendance
+    from apps.comments.models import Comment
+    from apps.projects.models import Project, ProjectMember
+    from apps.tickets.models import Ticket, allocate_ticket_ids
+    from apps.timelogs.models import WorkLog
+    from apps.users.models import User
+
+    rng = random.Random(seed)
+    now = timezone.now()
+    password_hash = password_hash or make_password(BENCH_PASSWORD)
+
+    managers = max(1, scale.users // 10)
+    users = _batched_create(User, [
+        User(
+            username=f'bench{i}',
+            email=f'bench{i}@example.com',
+            first_name=f'Bench{i}',
+            last_name='User',
+            password=password_hash,
+            role='admin' if i == 0 else 'manager' if i <= managers else 'employee',
+        )
+        for i in range(scale.users)
+    ])
+    staff = users[1:] or users
+
+    projects = _batched_create(Project, [
+        Project(
+            name=f'Project {i} {rng.choice(WORDS)}',
+            description=' '.join(rng.choices(WORDS, k=12)),
+            created_by=users[1 + i % managers] if len(users) > 1 else users[0],
+        )
+        for i in range(scale.projects)
+    ])
+    members_by_project = {
+        project.pk: rng.sample(staff, k=min(len(staff), max(3, len(staff) // 3)))
+        for project in projects
+    }
+    _batched_create(ProjectMember, [
+        ProjectMember(project_id=project_id, user=user)
+        for project_id, members in members_by_project.items()
+        for user in members
+    ])
+
+    statuses = [value for value, _ in Ticket.STATUS_CHOICES]
+    priorities = [value for value, _ in Ticket.PRIORITY_CHOICES]
+    types = [value for value, _ in Ticket.TYPE_CHOICES]
+    ticket_ids = allocate_ticket_ids(scale.tickets)
+    tickets = []
+    for i, ticket_id in enumerate(ticket_ids):
+        project = projects[i % len(projects)]
+        status = rng.choice(statuses)
+        tickets.append(Ticket(
+            ticket_id=ticket_id,
+            title=f'{rng.choice(WORDS).title()} {rng.choice(WORDS)} issue {i}',
+            description=' '.join(rng.choices(WORDS, k=30)),
+            type=rng.choice(types),
+            priority=rng.choice(priorities),
+            status=status,
+            project=project,
+            created_by=rng.choice(members_by_project[project.pk]),
+            closed_at=now if status == 'closed' else None,
+            due_date=(now + timedelta(days=rng.randint(-20, 40))).date() if i % 3 == 0 else None,
+        ))
+    tickets = _batched_create(Ticket, tickets)
+
+    Assignee = Ticket.assignees.through
+    assignees = copy_rows(Assignee, (
+        Assignee(ticket_id=ticket.pk, user_id=user.pk)
+        for ticket in tickets
+        for user in rng.sample(members_by_project[ticket.project_id], k=rng.randint(0, 2))
+    ))
+
+    comments = copy_rows(Comment, (
+        Comment(
+            ticket_id=ticket.pk,
+            author_id=rng.choice(members_by_project[ticket.project_id]).pk,
+            content=' '.join(rng.choices(WORDS, k=15)),
+        )
+        for ticket in tickets
+        for _ in range(scale.comments_per_ticket)
+    ))
+
+    def worklog_rows():
+        for ticket in tickets:
+            for _ in range(scale.worklogs_per_ticket):
+                started = now - timedelta(days=rng.randint(0, scale.attendance_days or 1), minutes=rng.randint(0, 600))
+                minutes = rng.randint(10, 240)
+                yield WorkLog(
+                    ticket_id=ticket.pk,
+                    user_id=rng.choice(members_by_project[ticket.project_id]).pk,
+                    start_time=started,
+                    end_time=started + timedelta(minutes=minutes),
+                    duration_minutes=minutes,
+                    notes='benchmark session',
+                )
+    worklogs = copy_rows(WorkLog, worklog_rows())
+
+    ticket_type = ContentType.objects.get_for_model(Ticket)
+    activity = copy_rows(ActivityLog, (
+        ActivityLog(
+            action='create',
+            user_id=ticket.created_by_id,
+            content_type=ticket_type,
+            object_id=ticket.pk,
+            description=f'Created ticket {ticket.ticket_id}',
+            extra_data={'ticket_id': ticket.ticket_id, 'status': ticket.status, 'priority': ticket.priority},
+        )
+        for ticket in tickets
+    ))
+
+    def attendance_rows():
+        today = timezone.localdate()
+        for offset in range(1, scale.attendance_days + 1):
+            day = today - timedelta(days=offset)
+            if day.weekday() >= 5:
+                continue
+            for user in staff:
+                status = rng.choices(['present', 'absent', 'leave'], weights=[85, 10, 5])[0]
+                yield Attendance(
+                    employee_id=user.pk,
+                    date=day,
+                    status=status,
+                    first_available_at=now - timedelta(days=offset) if status == 'present' else None,
+                )
+    attendance = copy_rows(Attendance, attendance_rows())
+
+    return {
+        'users': len(users),
+        'projects': len(projects),
+        'tickets': len(tickets),
+        'assignees': assignees,
+        'comments': comments,
+        'worklogs': worklogs,
+        'activity': activity,
+        'attendance': attendance,
+    }
+
+
+def _setup_worker() -> None:
+    import django
+    from django.apps import apps
+
+    if not apps.ready:
+        django.setup()
+
+
+def populate_tenant(schema_name: str, scale: DatasetScale, *, seed: int, password_hash: str) -> dict | None:
+    """Fill one existing benchmark tenant; returns None when it is already populated."""
+    from django_tenants.utils import get_tenant_model, schema_context
+
+    from apps.customers.services.login_accounts import resync_client_login_accounts
+
+    started = time.perf_counter()
+    with schema_context(schema_name):
+        if is_populated():
+            return None
+        counts = populate_schema(scale, seed=seed, password_hash=password_hash)
+    resync_client_login_accounts(get_tenant_model().objects.get(schema_name=schema_name))
+    return {'rows': counts, 'seconds': round(time.perf_counter() - started, 2)}
+
+
+def _populate_in_worker(*args, **kwargs) -> dict | None:
+    try:
+        return populate_tenant(*args, **kwargs)
+    finally:
+        connections.close_all()
+
+
+def generate_dataset(*, tenants: int, scale: DatasetScale, seed: int = 0, workers: int = 1, stdout=None) -> dict:
+    """
+    Create `tenants` benchmark tenants filled at `scale`. Returns a JSON-able summary.
+
+    Tenant schemas are created (migrated) one at a time; with `workers` > 1 they
+    are then filled by a process pool, one database connection per process.
+    """
+    password_hash = make_password(BENCH_PASSWORD)
+    summary = {'scale': asdict(scale), 'seed': seed, 'workers': workers, 'tenants': {}}
+    schema_names = [bench_schema_name(index) for index in range(tenants)]
+    for schema_name in schema_names:
+        ensure_bench_tenant(schema_name)
+
+    def report(schema_name, result):
+        if result is None:
+            message = f'{schema_name}: already populated, skipping'
+        else:
+            summary['tenants'][schema_name] = result
+            message = f'{schema_name}: {sum(result["rows"].values())} rows in {result["seconds"]}s'
+        if stdout is not None:
+            stdout.write(message)
+
+    if workers <= 1:
+        for index, schema_name in enumerate(schema_names):
+            report(schema_name, populate_tenant(schema_name, scale, seed=seed + index, password_hash=password_hash))
+        return summary
+
+    # Children must not share the parent's open connections.
+    connections.close_all()
+    with ProcessPoolExecutor(max_workers=workers, initializer=_setup_worker) as pool:
+        futures = {
+            pool.submit(_populate_in_worker, schema_name, scale, seed=seed + index, password_hash=password_hash): schema_name
+            for index, schema_name in enumerate(schema_names)
+        }
+        for future in as_completed(futures):
+            report(futures[future], future.result())
+    return summary
@@ -0,0 +1,62 @@
+"""
+Locust scenarios against a server holding `generate_benchmark_data` tenants.
+
+    locust -f benchmarks/locustfile.py --host http://localhost:8000
+
+BENCH_TENANTS and BENCH_USERS must not exceed what was generated (defaults
+match `--tenants 1 --scale small`). Each simulated user signs in as a random
+generated account; bench0 of every tenant is its admin. BENCH_THINK_TIME=0
+removes the pause between tasks, for measuring peak requests/sec.
+"""
+
+import os
+import random
+
+from locust import HttpUser, between, task
+
+from benchmarks.dataset import BENCH_PASSWORD, bench_login, bench_schema_name
+
+BENCH_TENANTS = int(os.environ.get('BENCH_TENANTS', '1'))
+BENCH_USERS = int(os.environ.get('BENCH_USERS', '25'))
+BENCH_THINK_TIME = float(os.environ.get('BENCH_THINK_TIME', '2'))
+
+
+class TicketHubUser(HttpUser):
+    wait_time = between(BENCH_THINK_TIME / 4, BENCH_THINK_TIME)
+
+    def on_start(self):
+        schema_name = bench_schema_name(random.randrange(BENCH_TENANTS))
+        username = f'bench{random.randrange(BENCH_USERS)}'
+        response = self.client.post('/api/auth/login/', json={
+            'username': bench_login(schema_name, username),
+            'password': BENCH_PASSWORD,
+        }, name='login')
+        response.raise_for_status()
+        payload = response.json()
+        self.role = payload['user']['role']
+        self.client.headers['Authorization'] = f'Bearer {payload["access"]}'
+        self.ticket_ids = []
+
+    @task(5)
+    def ticket_list(self):
+        response = self.client.get('/api/tickets/tickets/', name='ticket-list')
+        if response.ok:
+            self.ticket_ids = [ticket['id'] for ticket in response.json().get('results', [])]
+
+    @task(3)
+    def ticket_detail(self):
+        if not self.ticket_ids:
+            return self.ticket_list()
+        self.client.get(f'/api/tickets/tickets/{random.choice(self.ticket_ids)}/', name='ticket-detail')
+
+    @task(2)
+    def dashboard(self):
+        self.client.get(f'/api/dashboard/{self.role}/', name=f'dashboard-{self.role}')
+
+    @task(2)
+    def my_attendance(self):
+        self.client.get('/api/attendance/attendance/me/', name='attendance-me')
+
+    @task(1)
+    def attendance_list(self):
+        self.client.get('/api/attendance/attendance/', name='attendance-list')
@@ -0,0 +1,133 @@
+"""
+Run benchmarks and keep their JSON results under benchmarks/results/.
+
+    python -m benchmarks.run micro [pytest args...]
+    python -m benchmarks.run load --host http://localhost:8000 [--users 50 --run-time 2m]
+    python -m benchmarks.run compare OLD.json NEW.json [--threshold 10]
+
+`compare` reads both pytest-benchmark and locust result files and exits 1 when
+any benchmark's mean got slower than the threshold (percent). For two locust
+results it also prints requests/sec per endpoint and in total.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import subprocess
+import sys
+from datetime import datetime
+from pathlib import Path
+
+BENCH_DIR = Path(__file__).resolve().parent
+BACKEND_DIR = BENCH_DIR.parent
+RESULTS_DIR = BENCH_DIR / 'results'
+
+
+def _result_path(kind: str) -> Path:
+    RESULTS_DIR.mkdir(exist_ok=True)
+    return RESULTS_DIR / f'{kind}-{datetime.now():%Y%m%d-%H%M%S}.json'
+
+
+def run_micro(extra_args: list[str]) -> int:
+    output = _result_path('micro')
+    command = [
+        sys.executable, '-m', 'pytest', str(BENCH_DIR / 'bench_hot_paths.py'),
+        '-q', '-p', 'no:cacheprovider', f'--benchmark-json={output}', *extra_args,
+    ]
+    code = subprocess.call(command, cwd=BACKEND_DIR)
+    print(f'Results: {output}')
+    return code
+
+
+def run_load(host: str, users: int, spawn_rate: int, run_time: str) -> int:
+    output = _result_path('load')
+    command = [
+        sys.executable, '-m', 'locust', '-f', str(BENCH_DIR / 'locustfile.py'),
+        '--headless', '--host', host, '--users', str(users), '--spawn-rate', str(spawn_rate),
+        '--run-time', run_time, '--only-summary', '--json',
+    ]
+    completed = subprocess.run(command, cwd=BACKEND_DIR, stdout=subprocess.PIPE, text=True)
+    output.write_text(completed.stdout)
+    print(f'Results: {output}')
+    return completed.returncode
+
+
+def load_means(path: Path) -> dict[str, float]:
+    """Mean time in milliseconds per benchmark name, from either result format."""
+    data = json.loads(path.read_text())
+    if isinstance(data, dict) and 'benchmarks' in data:
+        return {item['fullname']: item['stats']['mean'] * 1000 for item in data['benchmarks']}
+    if isinstance(data, list):
+        return {
+            f'{item["method"]} {item["name"]}': item['total_response_time'] / item['num_requests']
+            for item in data
+            if item.get('num_requests')
+        }
+    raise ValueError(f'{path}: not a pytest-benchmark or locust --json result.')
+
+
+def load_throughput(path: Path) -> dict[str, float]:
+    """Requests/sec per locust endpoint plus 'total'; empty for pytest-benchmark results."""
+    data = json.loads(path.read_text())
+    if not isinstance(data, list):
+        return {}
+    rows = [item for item in data if item.get('num_requests')]
+    if not rows:
+        return {}
+    started = min(item['start_time'] for item in rows)
+    finished = max(item['last_request_timestamp'] for item in rows)
+    elapsed = max(finished - started, 1e-9)
+    rates = {f'{item["method"]} {item["name"]}': item['num_requests'] / elapsed for item in rows}
+    rates['total'] = sum(item['num_requests'] for item in rows) / elapsed
+    return rates
+
+
+def compare(old: Path, new: Path, threshold: float) -> int:
+    before, after = load_means(old), load_means(new)
+    regressions = 0
+    for name in sorted(before.keys() | after.keys()):
+        if name not in before or name not in after:
+            print(f'{"added" if name in after else "removed":>10}  {name}')
+            continue
+        change = (after[name] - before[name]) / before[name] * 100 if before[name] else 0.0
+        flag = 'SLOWER' if change > threshold else 'faster' if change < -threshold else ''
+        regressions += flag == 'SLOWER'
+        print(f'{change:+9.1f}%  {before[name]:10.2f}ms -> {after[name]:10.2f}ms  {name}  {flag}')
+
+    rps_before, rps_after = load_throughput(old), load_throughput(new)
+    for name in sorted(rps_before.keys() & rps_after.keys()):
+        change = (rps_after[name] - rps_before[name]) / rps_before[name] * 100
+        print(f'{change:+9.1f}%  {rps_before[name]:9.1f}/s -> {rps_after[name]:9.1f}/s  {name}')
+    return 1 if regressions else 0
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog='python -m benchmarks.run')
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    commands.add_parser('micro', help='pytest-benchmark micro-benchmarks')
+
+    load = commands.add_parser('load', help='headless locust run')
+    load.add_argument('--host', default='http://localhost:8000')
+    load.add_argument('--users', type=int, default=20)
+    load.add_argument('--spawn-rate', type=int, default=5)
+    load.add_argument('--run-time', default='1m')
+
+    diff = commands.add_parser('compare', help='diff two result files')
+    diff.add_argument('old', type=Path)
+    diff.add_argument('new', type=Path)
+    diff.add_argument('--threshold', type=float, default=10.0, help='percent slowdown reported as a regression')
+
+    args, extra = parser.parse_known_args(argv)
+    if args.command == 'micro':
+        return run_micro(extra)
+    if extra:
+        parser.error(f'unrecognized arguments: {" ".join(extra)}')
+    if args.command == 'load':
+        return run_load(args.host, args.users, args.spawn_rate, args.run_time)
+    return compare(args.old, args.new, args.threshold)
+
+
+if __name__ == '__main__':
+    sys.exit(main())
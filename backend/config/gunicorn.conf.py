@@ -0,0 +1,22 @@
+"""gunicorn settings (python -m gunicorn -c config/gunicorn.conf.py config.wsgi:application)."""
+
+import glob
+import os
+
+bind = os.environ.get('GUNICORN_BIND', '0.0.0.0:8000')
+workers = int(os.environ.get('GUNICORN_WORKERS', '3'))
+
+
+def on_starting(server):
+    # Live gauges left by workers of a previous run that never reached child_exit.
+    multiproc_dir = os.environ.get('PROMETHEUS_MULTIPROC_DIR')
+    if multiproc_dir:
+        os.makedirs(multiproc_dir, exist_ok=True)
+        for path in glob.glob(os.path.join(multiproc_dir, 'gauge_live*.db')):
+            os.remove(path)
+
+
+def child_exit(server, worker):
+    from apps.core.prometheus import mark_process_dead
+
+    mark_process_dead(worker.pid)
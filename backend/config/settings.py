@@ -23,6 +23,7 @@ SHARED_APPS = [
     'apps.customers',
     'apps.platform',
     'django.contrib.contenttypes',
+    'django.contrib.postgres',
     'django.contrib.sessions',
     'django.contrib.messages',
     'django.contrib.staticfiles',
@@ -56,6 +57,7 @@ TENANT_APPS = [
     'apps.workspace_docs',
     'apps.workspace_whiteboards',
     'apps.integrations',
+    'apps.search',
 ]
 
 INSTALLED_APPS = list(SHARED_APPS) + [
@@ -63,6 +65,7 @@ INSTALLED_APPS = list(SHARED_APPS) + [
 ]
 
 MIDDLEWARE = [
+    'apps.core.middleware.RequestInstrumentationMiddleware',
     'apps.customers.middleware.TenantResolutionMiddleware',
     'django.middleware.security.SecurityMiddleware',
     'whitenoise.middleware.WhiteNoiseMiddleware',
@@ -96,25 +99,52 @@ TEMPLATES = [
 
 WSGI_APPLICATION = 'config.wsgi.application'
 
+# Set DB_TRANSACTION_POOLING when POSTGRES_HOST is PgBouncer (or similar) in
+# transaction mode: session state such as search_path is then never reused
+# across transactions, and server-side cursors are disabled.
+DB_TRANSACTION_POOLING = config('DB_TRANSACTION_POOLING', default=False, cast=bool)
+
 DATABASES = {
     'default': {
-        'ENGINE': 'django_tenants.postgresql_backend',
+        'ENGINE': 'apps.core.postgresql_backend',
         'NAME': config('POSTGRES_DB'),
         'USER': config('POSTGRES_USER'),
         'PASSWORD': config('POSTGRES_PASSWORD'),
         'HOST': config('POSTGRES_HOST', default='db'),
         'PORT': config('POSTGRES_PORT', default='5432'),
         'ATOMIC_REQUESTS': True,
+        # Seconds to keep a connection open between requests (0 closes it after
+        # each request); health checks replace dead connections before reuse.
+        'CONN_MAX_AGE': config('DB_CONN_MAX_AGE', default=60, cast=int),
+        'CONN_HEALTH_CHECKS': True,
+        'TRANSACTION_POOLING': DB_TRANSACTION_POOLING,
+        'DISABLE_SERVER_SIDE_CURSORS': DB_TRANSACTION_POOLING,
     }
 }
 
 DATABASE_ROUTERS = ('django_tenants.routers.TenantSyncRouter',)
 
+# How views opted in through apps.core.transactions run GET/HEAD/OPTIONS:
+# 'autocommit' (no transaction) or 'read_only' (a rolled-back transaction in
+# which writes raise). Other methods keep ATOMIC_REQUESTS either way. Behind a
+# transaction pooler every autocommit query re-sends search_path, so one
+# read-only transaction per request is the default there.
+READ_ONLY_REQUEST_MODE = config(
+    'READ_ONLY_REQUEST_MODE', default='read_only' if DB_TRANSACTION_POOLING else 'autocommit',
+)
+
 TENANT_MODEL = 'customers.Client'
 TENANT_DOMAIN_MODEL = 'customers.Domain'
 PUBLIC_SCHEMA_NAME = 'public'
 SHOW_PUBLIC_IF_NO_TENANT_FOUND = config('SHOW_PUBLIC_IF_NO_TENANT_FOUND', default=True, cast=bool)
 SHARED_APP_DOMAIN = config('SHARED_APP_DOMAIN', default='localhost')
+# Skip SET search_path while the connection already has the tenant's path
+# (see apps.core.postgresql_backend).
+TENANT_LIMIT_SET_CALLS = True
+# New tenants are cloned from this pre-migrated schema when it is up to date
+# (kept current by `manage.py refresh_tenant_template`); otherwise migrated.
+TENANT_TEMPLATE_SCHEMA = config('TENANT_TEMPLATE_SCHEMA', default='tenant_template')
+TENANT_TEMPLATE_PROVISIONING = config('TENANT_TEMPLATE_PROVISIONING', default=True, cast=bool)
 
 
 AUTH_PASSWORD_VALIDATORS = [
@@ -124,6 +154,17 @@ AUTH_PASSWORD_VALIDATORS = [
     {'NAME': 'django.contrib.auth.password_validation.NumericPasswordValidator'},
 ]
 
+# PBKDF2 work factor for new and re-hashed passwords (Django 4.2's default is
+# 600000). Changing it re-hashes each user's password on their next login.
+PASSWORD_HASH_ITERATIONS = config('PASSWORD_HASH_ITERATIONS', default=600_000, cast=int)
+PASSWORD_HASHERS = [
+    'apps.users.hashers.ConfigurablePBKDF2PasswordHasher',
+    'django.contrib.auth.hashers.PBKDF2SHA1PasswordHasher',
+    'django.contrib.auth.hashers.Argon2PasswordHasher',
+    'django.contrib.auth.hashers.BCryptSHA256PasswordHasher',
+    'django.contrib.auth.hashers.ScryptPasswordHasher',
+]
+
 LANGUAGE_CODE = 'en-us'
 
 TIME_ZONE = 'Asia/Kathmandu'
@@ -177,6 +218,11 @@ SIMPLE_JWT = {
     'AUTH_HEADER_TYPES': ('Bearer',),
 }
 
+# Authenticate tenant requests from the access token plus a short-lived
+# is_active/role cache (apps.users.user_state) instead of loading the user row;
+# the full User is loaded lazily when a view needs other fields.
+JWT_LIGHTWEIGHT_USER = config('JWT_LIGHTWEIGHT_USER', default=False, cast=bool)
+
 CORS_ALLOWED_ORIGINS = config('CORS_ALLOWED_ORIGINS', default='http://localhost:3000,http://localhost:3001').split(',')
 CORS_ALLOW_CREDENTIALS = True
 CORS_ALLOW_HEADERS = (
@@ -208,10 +254,64 @@ SECURE_HSTS_PRELOAD = not DEBUG
 
 # Rate Limiting
 RATELIMIT_ENABLE = True
-RATELIMIT_USE_CACHE = 'default'
+RATELIMIT_USE_CACHE = 'ratelimit'
 DEFAULT_RATE_LIMIT = '100/minute'
 AUTH_RATE_LIMIT = '10/minute'
 
+# Cache aliases (see apps.core.cache). With REDIS_CACHE_URL they share one Redis
+# database under separate key prefixes, so every worker sees the same entries;
+# without it each process gets its own LocMem caches. Hits and misses are
+# reported to the request instrumentation either way.
+REDIS_CACHE_URL = config('REDIS_CACHE_URL', default='').strip()
+CACHE_KEY_PREFIX = config('CACHE_KEY_PREFIX', default='tickethub')
+
+
+def _cache(alias: str, **extra) -> dict:
+    if REDIS_CACHE_URL:
+        backend = {
+            'BACKEND': 'apps.core.cache.InstrumentedRedisCache',
+            'LOCATION': REDIS_CACHE_URL,
+            'KEY_PREFIX': f'{CACHE_KEY_PREFIX}:{alias}',
+        }
+    else:
+        backend = {'BACKEND': 'apps.core.cache.InstrumentedLocMemCache', 'LOCATION': alias}
+    return {**backend, **extra}
+
+
+CACHES = {
+    'default': _cache('default'),
+    'tenant': _cache('tenant', KEY_FUNCTION='apps.core.cache.make_tenant_key'),
+    'sessions': _cache('sessions'),
+    'ratelimit': _cache('ratelimit'),
+}
+
+SESSION_ENGINE = 'django.contrib.sessions.backends.cached_db'
+SESSION_CACHE_ALIAS = 'sessions'
+
+# Request instrumentation (apps.core.instrumentation).
+SERVER_TIMING_HEADER = config('SERVER_TIMING_HEADER', default=DEBUG, cast=bool)
+# Max SQL queries per URL name. Over-budget requests are logged, or raise when enforced (tests).
+QUERY_BUDGET_ENFORCE = config('QUERY_BUDGET_ENFORCE', default=False, cast=bool)
+QUERY_BUDGETS = {
+    'ticket-list': 16,
+    'ticket-detail': 20,
+    'ticket-stats': 8,
+    'worklog-list': 10,
+    'notification-list': 10,
+}
+
+# Bearer token for the Prometheus /metrics/ endpoint (unauthenticated only when DEBUG).
+METRICS_TOKEN = config('METRICS_TOKEN', default='').strip()
+
+# Browser/CDN max-age for public share pages; clients revalidate with If-None-Match after it.
+PUBLIC_SHARE_CACHE_MAX_AGE = config('PUBLIC_SHARE_CACHE_MAX_AGE', default=60, cast=int)
+
+# Share link views are buffered per process and rolled up into hourly counters.
+PUBLIC_SHARE_ACCESS_FLUSH_SIZE = config('PUBLIC_SHARE_ACCESS_FLUSH_SIZE', default=200, cast=int)
+PUBLIC_SHARE_ACCESS_FLUSH_SECONDS = config('PUBLIC_SHARE_ACCESS_FLUSH_SECONDS', default=30, cast=int)
+PUBLIC_SHARE_RAW_ACCESS_LOGS = config('PUBLIC_SHARE_RAW_ACCESS_LOGS', default=False, cast=bool)
+PUBLIC_SHARE_RAW_LOG_RETENTION_DAYS = config('PUBLIC_SHARE_RAW_LOG_RETENTION_DAYS', default=30, cast=int)
+
 # Frontend + public website (Technest-style links in HTML emails)
 FRONTEND_URL = config('FRONTEND_URL', default='http://localhost:3000')
 BACKEND_PUBLIC_URL = config('BACKEND_PUBLIC_URL', default='http://localhost:8000')
@@ -17,3 +17,6 @@ EMAIL_BACKEND = 'django.core.mail.backends.locmem.EmailBackend'
 EMAIL_ENABLED = True
 CELERY_TASK_ALWAYS_EAGER = True
 FRONTEND_URL = 'http://testserver'
+QUERY_BUDGET_ENFORCE = True
+# Fail loudly if an opted-in view writes during a safe method.
+READ_ONLY_REQUEST_MODE = 'read_only'
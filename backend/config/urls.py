@@ -1,6 +1,6 @@
 from django.urls import path, include
 from drf_spectacular.views import SpectacularAPIView, SpectacularSwaggerView
-from apps.core.views import health_check
+from apps.core.views import health_check, prometheus_metrics
 from apps.platform.admin_site import platform_admin_site
 from apps.customers.views.public_docs import public_shared_doc
 from apps.customers.views.public_whiteboards import public_shared_whiteboard
@@ -9,6 +9,7 @@ from apps.integrations.urls import public_urlpatterns as github_public_urlpatter
 urlpatterns = [
     path('admin/', platform_admin_site.urls),
     path('health/', health_check, name='health_check'),
+    path('metrics/', prometheus_metrics, name='prometheus_metrics'),
     path('api/schema/', SpectacularAPIView.as_view(), name='schema'),
     path('api/docs/', SpectacularSwaggerView.as_view(url_name='schema'), name='docs'),
     path('api/auth/', include('apps.users.urls')),
@@ -24,6 +25,7 @@ urlpatterns = [
     path('api/todos/', include('apps.todos.urls')),
     path('api/workspace-docs/', include('apps.workspace_docs.urls')),
     path('api/workspace-whiteboards/', include('apps.workspace_whiteboards.urls')),
+    path('api/search/', include('apps.search.urls')),
     path('api/public/share/docs/<uuid:token>/', public_shared_doc, name='public-shared-doc'),
     path('api/public/share/whiteboards/<uuid:token>/', public_shared_whiteboard, name='public-shared-whiteboard'),
     *github_public_urlpatterns,
@@ -1,9 +1,10 @@
 from django.urls import include, path
 
-from apps.core.views import health_check
+from apps.core.views import health_check, prometheus_metrics
 
 urlpatterns = [
     path('server/auth/', include('apps.platform.urls')),
     path('server/', include('apps.customers.urls')),
     path('health/', health_check, name='public_health'),
+    path('metrics/', prometheus_metrics, name='public_prometheus_metrics'),
 ]
@@ -12,13 +12,15 @@ Usage:
     docker compose exec backend python manage.py populate_db --clear
 """
 
+from django.contrib.auth.hashers import make_password
+from django.db import transaction
 from django.utils import timezone
 from datetime import timedelta
 import random
 
 from apps.users.models import User
 from apps.projects.models import Project, ProjectMember
-from apps.tickets.models import Ticket
+from apps.tickets.models import Ticket, allocate_ticket_ids
 from apps.comments.models import Comment
 from apps.timelogs.models import WorkLog
 from apps.activity.models import ActivityLog
@@ -28,6 +30,7 @@ from django.contrib.contenttypes.models import ContentType
 
 DEFAULT_PASSWORD = 'technest2026'
 DEFAULT_TENANT_SCHEMA = 'main'
+BATCH_SIZE = 1000
 
 
 def clear_data():
@@ -151,53 +154,20 @@ WORK_LOG_NOTES = [
 ]
 
 
-def create_user(username, email, role, first_name, last_name):
-    """Create or update a user."""
-    user, created = User.objects.get_or_create(
-        username=username,
-        defaults={
-            'email': email,
-            'first_name': first_name,
-            'last_name': last_name,
-            'role': role,
-            'is_active': True,
-        }
-    )
-    user.set_password(DEFAULT_PASSWORD)
-    user.save()
-    print(f"{'Created' if created else 'Updated'} user: {username} ({role})")
-    return user
-
-
 def create_users():
-    """Create a set of realistic users."""
+    """Create (or reset the password of) a set of realistic users."""
     print("\n=== Creating Users ===")
-    
-    users = {}
-    
-    # Admin user
-    admin_user = create_user(
-        username='admin',
-        email='admin@technest.com',
-        role='admin',
-        first_name='System',
-        last_name='Administrator'
-    )
-    users['admin'] = admin_user
-    
+
+    specs = [('admin', 'admin@technest.com', 'admin', 'System', 'Administrator')]
+
     # Manager users — username is the email local part; login = username@technest.com
     manager_data = [
         ('john.smith@technest.com', 'John', 'Smith'),
         ('sarah.johnson@technest.com', 'Sarah', 'Johnson'),
         ('david.williams@technest.com', 'David', 'Williams'),
     ]
-    
-    users['managers'] = []
-    for email, first_name, last_name in manager_data:
-        username = email.split('@')[0]
-        manager = create_user(username, email, 'manager', first_name, last_name)
-        users['managers'].append(manager)
-    
+    specs += [(email.split('@')[0], email, 'manager', first, last) for email, first, last in manager_data]
+
     # Developer users
     employee_data = [
         ('mike.brown@technest.com', 'Mike', 'Brown'),
@@ -207,177 +177,168 @@ def create_users():
         ('james.davis@technest.com', 'James', 'Davis'),
         ('maria.wilson@technest.com', 'Maria', 'Wilson'),
     ]
-    
-    users['employees'] = []
-    for email, first_name, last_name in employee_data:
-        username = email.split('@')[0]
-        employee = create_user(username, email, 'employee', first_name, last_name)
-        users['employees'].append(employee)
-    
-    return users
+    specs += [(email.split('@')[0], email, 'employee', first, last) for email, first, last in employee_data]
+
+    # Hash once: every user shares the same password.
+    password_hash = make_password(DEFAULT_PASSWORD)
+    usernames = [spec[0] for spec in specs]
+    existing = set(User.objects.filter(username__in=usernames).values_list('username', flat=True))
+    User.objects.filter(username__in=existing).update(password=password_hash)
+    User.objects.bulk_create([
+        User(
+            username=username,
+            email=email,
+            first_name=first_name,
+            last_name=last_name,
+            role=role,
+            is_active=True,
+            password=password_hash,
+        )
+        for username, email, role, first_name, last_name in specs
+        if username not in existing
+    ])
+    for username, _email, role, _first, _last in specs:
+        print(f"{'Updated' if username in existing else 'Created'} user: {username} ({role})")
+
+    by_username = User.objects.in_bulk(usernames, field_name='username')
+    return {
+        'admin': by_username['admin'],
+        'managers': [by_username[spec[0]] for spec in specs if spec[2] == 'manager'],
+        'employees': [by_username[spec[0]] for spec in specs if spec[2] == 'employee'],
+    }
 
 
 def create_projects(users):
-    """Create realistic projects."""
+    """Create realistic projects. Returns (project, member list) pairs."""
     print("\n=== Creating Projects ===")
-    
-    projects = []
+
     all_managers = users['managers']
     all_employees = users['employees']
-    
-    for i, (name, description) in enumerate(zip(PROJECT_NAMES, PROJECT_DESCRIPTIONS)):
+
+    projects = Project.objects.bulk_create([
         # Assign a manager as the creator
-        manager = all_managers[i % len(all_managers)]
-        
-        project = Project.objects.create(
-            name=name,
-            description=description,
-            status='active',
-            created_by=manager
-        )
-        print(f"Created project: {name}")
-        
-        # Add all managers to the project
-        for m in all_managers:
-            ProjectMember.objects.get_or_create(project=project, user=m)
-        
-        # Add some employees to the project (randomly 3-5 employees per project)
+        Project(name=name, description=description, status='active', created_by=all_managers[i % len(all_managers)])
+        for i, (name, description) in enumerate(zip(PROJECT_NAMES, PROJECT_DESCRIPTIONS))
+    ])
+
+    projects_data = []
+    for project in projects:
+        print(f"Created project: {project.name}")
+        # All managers plus 3-5 random employees per project
         num_members = random.randint(3, min(5, len(all_employees)))
-        selected_employees = random.sample(all_employees, num_members)
-        for emp in selected_employees:
-            ProjectMember.objects.get_or_create(project=project, user=emp)
-        
-        projects.append(project)
-    
-    return projects
+        projects_data.append((project, all_managers + random.sample(all_employees, num_members)))
+
+    ProjectMember.objects.bulk_create(
+        [ProjectMember(project=project, user=user) for project, members in projects_data for user in members],
+        ignore_conflicts=True,
+    )
+    return projects_data
 
 
-def create_tickets(projects, users):
-    """Create realistic tickets."""
+def create_tickets(projects_data):
+    """Create realistic tickets. Returns (ticket, project members, assignees) triples."""
     print("\n=== Creating Tickets ===")
-    
-    tickets = []
-    all_managers = users['managers']
-    all_employees = users['employees']
-    all_users = all_managers + all_employees
-    
+
     ticket_types = ['bug', 'task', 'feature']
     priorities = ['low', 'medium', 'high', 'critical']
     statuses = ['new', 'in_progress', 'qa', 'closed', 'reopened']
-    
-    # Create tickets for each project
-    for project in projects:
-        num_tickets = random.randint(8, 15)
-        project_users = list(project.members.all())
-        
-        for _ in range(num_tickets):
-            title = random.choice(TICKET_TITLES)
-            description = random.choice(TICKET_DESCRIPTIONS)
-            creator = random.choice(project_users)
-
-            # Try to create ticket with unique ID, retry if collision
-            max_retries = 10
-            for attempt in range(max_retries):
-                try:
-                    ticket = Ticket.objects.create(
-                        title=f"{title} - {random.randint(1, 999)}",
-                        description=description,
-                        type=random.choice(ticket_types),
-                        priority=random.choice(priorities),
-                        status=random.choice(statuses),
-                        project=project,
-                        created_by=creator
-                    )
-                    if random.random() > 0.1:
-                        ticket.assignees.add(random.choice(project_users))
-                    print(f"Created ticket: {ticket.ticket_id}")
-                    tickets.append((ticket, project_users))
-                    break
-                except Exception as e:
-                    if 'duplicate key' in str(e).lower() and attempt < max_retries - 1:
-                        continue
-                    else:
-                        raise
-    
-    return tickets
+
+    counts = [random.randint(8, 15) for _ in projects_data]
+    # One id range for the whole batch instead of a counter round trip per ticket.
+    ticket_ids = iter(allocate_ticket_ids(sum(counts)))
+
+    planned = []
+    for (project, project_users), count in zip(projects_data, counts):
+        for _ in range(count):
+            ticket = Ticket(
+                ticket_id=next(ticket_ids),
+                title=f"{random.choice(TICKET_TITLES)} - {random.randint(1, 999)}",
+                description=random.choice(TICKET_DESCRIPTIONS),
+                type=random.choice(ticket_types),
+                priority=random.choice(priorities),
+                status=random.choice(statuses),
+                project=project,
+                created_by=random.choice(project_users),
+            )
+            assignees = [random.choice(project_users)] if random.random() > 0.1 else []
+            planned.append((ticket, project_users, assignees))
+
+    Ticket.objects.bulk_create([ticket for ticket, _users, _assignees in planned], batch_size=BATCH_SIZE)
+
+    Assignee = Ticket.assignees.through
+    Assignee.objects.bulk_create([
+        Assignee(ticket_id=ticket.pk, user_id=user.pk)
+        for ticket, _users, assignees in planned
+        for user in assignees
+    ], batch_size=BATCH_SIZE)
+
+    print(f"Created {len(planned)} tickets")
+    return planned
 
 
 def create_comments(tickets_data):
     """Create comments for tickets."""
     print("\n=== Creating Comments ===")
-    
-    for ticket, project_users in tickets_data:
+
+    Comment.objects.bulk_create([
+        Comment(ticket=ticket, author=random.choice(project_users), content=random.choice(COMMENT_TEMPLATES))
+        for ticket, project_users, _assignees in tickets_data
         # Add 1-4 comments per ticket
-        num_comments = random.randint(1, 4)
-        
-        for _ in range(num_comments):
-            Comment.objects.create(
-                ticket=ticket,
-                author=random.choice(project_users),
-                content=random.choice(COMMENT_TEMPLATES)
-            )
-    
+        for _ in range(random.randint(1, 4))
+    ], batch_size=BATCH_SIZE)
+
     print(f"Created comments for {len(tickets_data)} tickets")
 
 
 def create_work_logs(tickets_data):
     """Create work logs for tickets."""
     print("\n=== Creating Work Logs ===")
-    
+
     now = timezone.now()
-    
-    for ticket, project_users in tickets_data:
+    work_logs = []
+    for ticket, _project_users, assignees in tickets_data:
         # Only add work logs for assigned and non-closed tickets
-        first_assignee = ticket.assignees.first()
-        if first_assignee and ticket.status != 'closed' and random.random() > 0.3:
+        if assignees and ticket.status != 'closed' and random.random() > 0.3:
             # Add 1-3 work log entries
-            num_logs = random.randint(1, 3)
-            
-            for i in range(num_logs):
+            for _ in range(random.randint(1, 3)):
                 start_time = now - timedelta(days=random.randint(1, 10))
                 duration = random.randint(30, 240)  # 30 mins to 4 hours
-                end_time = start_time + timedelta(minutes=duration)
-                
-                WorkLog.objects.create(
+                work_logs.append(WorkLog(
                     ticket=ticket,
-                    user=first_assignee,
+                    user=assignees[0],
                     start_time=start_time,
-                    end_time=end_time,
-                    notes=random.choice(WORK_LOG_NOTES)
-                )
-    
-    print("Created work logs for tickets")
+                    end_time=start_time + timedelta(minutes=duration),
+                    # bulk_create skips WorkLog.save(), which would derive this
+                    duration_minutes=duration,
+                    notes=random.choice(WORK_LOG_NOTES),
+                ))
+    WorkLog.objects.bulk_create(work_logs, batch_size=BATCH_SIZE)
 
+    print(f"Created {len(work_logs)} work logs")
 
-def create_activity_logs(tickets_data, projects, users):
+
+def create_activity_logs(tickets_data, projects):
     """Create activity logs for various actions."""
     print("\n=== Creating Activity Logs ===")
-    
-    now = timezone.now()
+
     ticket_content_type = ContentType.objects.get_for_model(Ticket)
     project_content_type = ContentType.objects.get_for_model(Project)
-    
+    logs = []
+
     # Log ticket activities
-    for ticket, project_users in tickets_data:
+    for ticket, project_users, assignees in tickets_data:
+        descriptions = {
+            'create': f'Created ticket {ticket.ticket_id}',
+            'update': f'Updated ticket {ticket.ticket_id}',
+            'status_change': f'Changed status of {ticket.ticket_id} to {ticket.status}',
+            'assignment_change': f'Assigned {ticket.ticket_id} to {", ".join(u.username for u in assignees) or "Unassigned"}',
+            'comment': f'Added comment to ticket {ticket.ticket_id}',
+            'work_log': f'Logged work on ticket {ticket.ticket_id}',
+        }
         # Create a few activity logs per ticket
-        num_activities = random.randint(2, 5)
-        
-        for _ in range(num_activities):
-            action = random.choice([
-                'create', 'update', 'status_change', 
-                'assignment_change', 'comment', 'work_log'
-            ])
-            
-            descriptions = {
-                'create': f'Created ticket {ticket.ticket_id}',
-                'update': f'Updated ticket {ticket.ticket_id}',
-                'status_change': f'Changed status of {ticket.ticket_id} to {ticket.status}',
-                'assignment_change': f'Assigned {ticket.ticket_id} to {", ".join(u.username for u in ticket.assignees.all()) or "Unassigned"}',
-                'comment': f'Added comment to ticket {ticket.ticket_id}',
-                'work_log': f'Logged work on ticket {ticket.ticket_id}',
-            }
-            
-            ActivityLog.objects.create(
+        for _ in range(random.randint(2, 5)):
+            action = random.choice(list(descriptions))
+            logs.append(ActivityLog(
                 action=action,
                 user=random.choice(project_users),
                 content_type=ticket_content_type,
@@ -387,13 +348,13 @@ def create_activity_logs(tickets_data, projects, users):
                     'ticket_id': ticket.ticket_id,
                     'status': ticket.status,
                     'priority': ticket.priority,
-                }
-            )
-    
+                },
+            ))
+
     # Log project activities
     for project in projects:
         for _ in range(random.randint(1, 3)):
-            ActivityLog.objects.create(
+            logs.append(ActivityLog(
                 action='create',
                 user=project.created_by,
                 content_type=project_content_type,
@@ -402,10 +363,11 @@ def create_activity_logs(tickets_data, projects, users):
                 extra_data={
                     'project_name': project.name,
                     'status': project.status,
-                }
-            )
-    
-    print("Created activity logs")
+                },
+            ))
+
+    ActivityLog.objects.bulk_create(logs, batch_size=BATCH_SIZE)
+    print(f"Created {len(logs)} activity logs")
 
 
 def print_summary(users, projects):
@@ -467,6 +429,7 @@ def print_summary(users, projects):
     print("="*50 + "\n")
 
 
+@transaction.atomic
 def main(clear=False):
     """Populate the current tenant schema. Use manage.py populate_db to set schema context."""
     from django.db import connection
@@ -491,10 +454,11 @@ def main(clear=False):
     users = create_users()
     
     # Create projects
-    projects = create_projects(users)
+    projects_data = create_projects(users)
+    projects = [project for project, _members in projects_data]
     
     # Create tickets
-    tickets_data = create_tickets(projects, users)
+    tickets_data = create_tickets(projects_data)
     
     # Create comments
     create_comments(tickets_data)
@@ -503,7 +467,7 @@ def main(clear=False):
     create_work_logs(tickets_data)
     
     # Create activity logs
-    create_activity_logs(tickets_data, projects, users)
+    create_activity_logs(tickets_data, projects)
     
     # Print summary
     print_summary(users, projects)
@@ -30,7 +30,10 @@ log "Applying shared schema migrations..."
 python manage.py migrate_schemas --shared --noinput
 
 log "Applying tenant schema migrations..."
-python manage.py migrate_schemas --noinput
+python manage.py run_tenant_job migrate --workers "${TENANT_MIGRATION_WORKERS:-4}"
+
+log "Refreshing tenant template schema..."
+python manage.py refresh_tenant_template
 
 log "Starting application: $@"
 exec "$@"
@@ -29,5 +29,8 @@ python manage.py migrate_schemas --shared --noinput
 log "Applying tenant schema migrations..."
 python manage.py migrate_schemas --noinput
 
+log "Refreshing tenant template schema..."
+python manage.py refresh_tenant_template
+
 log "Running: $@"
 exec "$@"
\ No newline at end of file
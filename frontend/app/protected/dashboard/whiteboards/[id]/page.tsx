@@ -14,7 +14,10 @@ import {
   WhiteboardShareLink,
   workspaceWhiteboardsApi,
   Whiteboard,
+  WhiteboardOp,
 } from '@/lib/workspace-whiteboards';
+import { isNativeCanvas } from '@/lib/whiteboard-canvas';
+import { applyCanvasOps, diffCanvasOps, rebaseCanvasOps } from '@/lib/whiteboard-ops';
 
 const WorkspaceWhiteboardEditor = dynamic(
   () => import('@/components/workspace-whiteboard-editor').then((m) => m.WorkspaceWhiteboardEditor),
@@ -30,6 +33,12 @@ const WorkspaceWhiteboardEditor = dynamic(
 
 type SaveStatus = 'idle' | 'saving' | 'saved' | 'error';
 
+interface StaleWhiteboardPayload {
+  code?: string;
+  revision?: number;
+  missed_ops?: WhiteboardOp[] | null;
+}
+
 export default function WorkspaceWhiteboardEditorPage() {
   const params = useParams();
   const router = useRouter();
@@ -58,6 +67,8 @@ export default function WorkspaceWhiteboardEditorPage() {
   const [copied, setCopied] = useState(false);
 
   const boardRef = useRef<Whiteboard | null>(null);
+  // Canvas as last saved at boardRef.current.revision; autosave sends ops against it.
+  const savedCanvasRef = useRef<TldrawSnapshot>({});
   const savedFadeRef = useRef<ReturnType<typeof setTimeout> | null>(null);
   const dirtyRef = useRef(false);
   const suppressDirtyRef = useRef(true);
@@ -84,6 +95,7 @@ export default function WorkspaceWhiteboardEditorPage() {
       setTitle(data.title);
       setProjectId(data.project);
       const canvas = data.canvas_data ?? {};
+      savedCanvasRef.current = canvas;
       setLoadedCanvas(canvas);
       setEditorRevision((r) => r + 1);
       dirtyRef.current = false;
@@ -104,6 +116,31 @@ export default function WorkspaceWhiteboardEditorPage() {
     void workspaceWhiteboardsApi.listShareLinks(boardId).then(setShareLinks);
   }, [shareOpen, canShare, boardId]);
 
+  const saveCanvasOps = useCallback(async (current: Whiteboard, canvasData: TldrawSnapshot) => {
+    const ops = diffCanvasOps(savedCanvasRef.current, canvasData);
+    if (!ops.length) return current;
+    try {
+      const result = await workspaceWhiteboardsApi.applyOps(boardId, current.revision, ops);
+      savedCanvasRef.current = canvasData;
+      return { ...current, ...result, canvas_data: canvasData };
+    } catch (err: unknown) {
+      const payload = err instanceof ApiError ? (err.response as StaleWhiteboardPayload | undefined) : undefined;
+      if (err instanceof ApiError && err.statusCode === 409 && payload?.missed_ops && payload.revision !== undefined) {
+        // Someone else saved first: replay our ops on top of theirs and retry once.
+        const serverCanvas = applyCanvasOps(savedCanvasRef.current, payload.missed_ops);
+        const rebased = rebaseCanvasOps(serverCanvas, ops);
+        const result = rebased.ops.length
+          ? await workspaceWhiteboardsApi.applyOps(boardId, payload.revision, rebased.ops)
+          : { revision: payload.revision, updated_at: current.updated_at };
+        savedCanvasRef.current = rebased.canvas;
+        setLoadedCanvas(rebased.canvas);
+        setEditorRevision((r) => r + 1);
+        return { ...current, ...result, canvas_data: rebased.canvas };
+      }
+      throw err;
+    }
+  }, [boardId]);
+
   const performSave = useCallback(async () => {
     const current = boardRef.current;
     if (!current || !dirtyRef.current) return;
@@ -111,12 +148,26 @@ export default function WorkspaceWhiteboardEditorPage() {
     setSaveStatus('saving');
     setStaleWarning(null);
     try {
-      const updated = await workspaceWhiteboardsApi.update(boardId, {
-        title,
-        canvas_data: canvasData,
-        project: projectId,
-        expected_updated_at: current.updated_at,
-      });
+      let updated: Whiteboard;
+      if (isNativeCanvas(savedCanvasRef.current)) {
+        updated = await saveCanvasOps(current, canvasData);
+        if (title !== updated.title || projectId !== updated.project) {
+          updated = await workspaceWhiteboardsApi.update(boardId, {
+            title,
+            project: projectId,
+            base_revision: updated.revision,
+          });
+        }
+      } else {
+        // Legacy (pre-native) canvases are replaced wholesale on first save.
+        updated = await workspaceWhiteboardsApi.update(boardId, {
+          title,
+          canvas_data: canvasData,
+          project: projectId,
+          base_revision: current.revision,
+        });
+        savedCanvasRef.current = canvasData;
+      }
       setBoard(updated);
       dirtyRef.current = false;
       setIsDirty(false);
@@ -126,7 +177,7 @@ export default function WorkspaceWhiteboardEditorPage() {
     } catch (err: unknown) {
       if (err instanceof ApiError) {
         const detail = err.message;
-        const payload = err.response as { code?: string } | undefined;
+        const payload = err.response as StaleWhiteboardPayload | undefined;
         if (payload?.code === 'stale_whiteboard' || detail.includes('updated by someone else')) {
           setStaleWarning(detail || 'Updated elsewhere — reload to continue.');
           setSaveStatus('error');
@@ -135,7 +186,7 @@ export default function WorkspaceWhiteboardEditorPage() {
       }
       setSaveStatus('error');
     }
-  }, [boardId, projectId, title]);
+  }, [boardId, projectId, saveCanvasOps, title]);
 
   const markDirty = useCallback(() => {
     if (!suppressDirtyRef.current) {
@@ -224,8 +275,9 @@ export default function WorkspaceWhiteboardEditorPage() {
         selection.ids[0],
         trimmedTitle,
       );
+      savedCanvasRef.current = result.canvas_data;
       setLoadedCanvas(result.canvas_data);
-      setBoard((prev) => prev ? { ...prev, canvas_data: result.canvas_data, updated_at: result.updated_at } : prev);
+      setBoard((prev) => prev ? { ...prev, canvas_data: result.canvas_data, revision: result.revision, updated_at: result.updated_at } : prev);
       setEditorRevision((r) => r + 1);
       setSelection({ ...selection, ticket: { id: result.ticket.id, ticketId: result.ticket.ticket_id } });
       dirtyRef.current = false;
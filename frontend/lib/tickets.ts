@@ -106,6 +106,19 @@ export interface TicketFilters {
   page?: number;
 }
 
+export interface BulkTicketUpdate {
+  ids: number[];
+  status?: TicketStatus;
+  priority?: TicketPriority;
+  assign?: number[];
+  unassign?: number[];
+}
+
+export interface BulkTicketUpdateResult {
+  updated: number;
+  tickets: Ticket[];
+}
+
 export const ticketsApi = {
   getTickets: async (filters?: TicketFilters): Promise<PaginatedResponse<Ticket>> => {
     const queryString = buildQueryString({
@@ -182,6 +195,12 @@ export const ticketsApi = {
     return response.data;
   },
 
+  /** Apply one change to many tickets; rejected as a whole (400 with per-ticket errors) if any ticket fails. */
+  bulkUpdate: async (data: BulkTicketUpdate): Promise<BulkTicketUpdateResult> => {
+    const response = await api.post<BulkTicketUpdateResult>('/tickets/tickets/bulk/', data);
+    return response.data;
+  },
+
   createGithubIssue: async (id: number): Promise<Ticket> => {
     const response = await api.post<Ticket>(`/tickets/tickets/${id}/create-github-issue/`);
     return response.data;
@@ -0,0 +1,87 @@
+/** Client side of the element-level ops protocol (mirrors backend canvas_utils). */
+
+import {
+  normalizeCanvas,
+  type WhiteboardCanvasData,
+  type WhiteboardCanvasDocument,
+  type WhiteboardElement,
+} from './whiteboard-canvas';
+import type { WhiteboardOp } from './workspace-whiteboards';
+
+type ElementRecord = Record<string, unknown> & { id: string };
+
+function sameValue(a: unknown, b: unknown): boolean {
+  return a === b || JSON.stringify(a) === JSON.stringify(b);
+}
+
+/** Describe the change between two canvas documents as element-level ops. */
+export function diffCanvasOps(oldCanvas: WhiteboardCanvasData, newCanvas: WhiteboardCanvasData): WhiteboardOp[] {
+  const before = normalizeCanvas(oldCanvas);
+  const after = normalizeCanvas(newCanvas);
+  const previousById = new Map(before.elements.map((el) => [el.id, el as unknown as ElementRecord]));
+  const nextIds = new Set(after.elements.map((el) => el.id));
+  const ops: WhiteboardOp[] = [];
+
+  for (const el of after.elements) {
+    const record = el as unknown as ElementRecord;
+    const previous = previousById.get(el.id);
+    if (!previous) {
+      ops.push({ op: 'add', element: record });
+      continue;
+    }
+    if (Object.keys(previous).some((key) => !(key in record))) {
+      // Shallow merges cannot drop keys; replace the element wholesale.
+      ops.push({ op: 'delete', id: el.id }, { op: 'add', element: record });
+      continue;
+    }
+    const changes: Record<string, unknown> = {};
+    for (const [key, value] of Object.entries(record)) {
+      if (!sameValue(previous[key], value)) changes[key] = value;
+    }
+    if (Object.keys(changes).length) ops.push({ op: 'update', id: el.id, changes });
+  }
+
+  for (const id of previousById.keys()) {
+    if (!nextIds.has(id)) ops.push({ op: 'delete', id });
+  }
+
+  if (!sameValue(before.camera, after.camera)) ops.push({ op: 'camera', camera: after.camera });
+  return ops;
+}
+
+/** Apply ops to a canvas, skipping any that no longer fit (e.g. updates to deleted elements). */
+export function applyCanvasOps(canvas: WhiteboardCanvasData, ops: WhiteboardOp[]): WhiteboardCanvasDocument {
+  return rebaseCanvasOps(canvas, ops).canvas;
+}
+
+/**
+ * Replay `ops` on top of `canvas` (the server's latest state) and keep the ones
+ * that still apply, so they can be resent against the server's revision.
+ */
+export function rebaseCanvasOps(
+  canvas: WhiteboardCanvasData,
+  ops: WhiteboardOp[],
+): { canvas: WhiteboardCanvasDocument; ops: WhiteboardOp[] } {
+  const doc = normalizeCanvas(canvas);
+  const elements = new Map(doc.elements.map((el) => [el.id, el]));
+  let camera = doc.camera;
+  const kept: WhiteboardOp[] = [];
+
+  for (const op of ops) {
+    if (op.op === 'add') {
+      if (elements.has(op.element.id)) continue;
+      elements.set(op.element.id, op.element as unknown as WhiteboardElement);
+    } else if (op.op === 'update') {
+      const current = elements.get(op.id);
+      if (!current) continue;
+      elements.set(op.id, { ...current, ...op.changes } as WhiteboardElement);
+    } else if (op.op === 'delete') {
+      if (!elements.delete(op.id)) continue;
+    } else {
+      camera = { ...camera, ...op.camera };
+    }
+    kept.push(op);
+  }
+
+  return { canvas: { ...doc, camera, elements: Array.from(elements.values()) }, ops: kept };
+}
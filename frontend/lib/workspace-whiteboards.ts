@@ -17,6 +17,7 @@ export interface Whiteboard {
   last_edited_by?: number | null;
   last_edited_by_name?: string | null;
   is_archived: boolean;
+  revision: number;
   created_at: string;
   updated_at: string;
 }
@@ -42,6 +43,19 @@ export interface ConvertElementResult {
     title: string;
   };
   canvas_data: WhiteboardCanvasData;
+  revision: number;
+  updated_at: string;
+}
+
+/** Element-level change applied server-side on top of a base revision. */
+export type WhiteboardOp =
+  | { op: 'add'; element: Record<string, unknown> & { id: string } }
+  | { op: 'update'; id: string; changes: Record<string, unknown> }
+  | { op: 'delete'; id: string }
+  | { op: 'camera'; camera: Partial<{ x: number; y: number; zoom: number }> };
+
+export interface ApplyOpsResult {
+  revision: number;
   updated_at: string;
 }
 
@@ -119,13 +133,21 @@ export const workspaceWhiteboardsApi = {
       title: string;
       canvas_data: WhiteboardCanvasData;
       project: number | null;
-      expected_updated_at: string;
+      base_revision: number;
     }>,
   ): Promise<Whiteboard> => {
     const response = await api.patch<Whiteboard>(`/workspace-whiteboards/whiteboards/${id}/`, data);
     return response.data;
   },
 
+  applyOps: async (id: string, baseRevision: number, ops: WhiteboardOp[]): Promise<ApplyOpsResult> => {
+    const response = await api.post<ApplyOpsResult>(
+      `/workspace-whiteboards/whiteboards/${id}/ops/`,
+      { base_revision: baseRevision, ops },
+    );
+    return response.data;
+  },
+
   archive: async (id: string): Promise<void> => {
     await api.delete(`/workspace-whiteboards/whiteboards/${id}/`);
   },